@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: JSONL finding decode throughput per json_codec backend.
+
+Builds a synthetic corpus of reviewer-findings-v1.0.0 records (100k by
+default), then times decoding every line with each installed backend —
+stdlib json, orjson, msgspec (untyped) and msgspec typed FindingRecord
+structs. Reports the best of --repeat runs and the speedup over stdlib.
+
+Usage:
+    python benchmarks/bench_json_decode.py [--findings 100000] [--repeat 3]
+"""
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from evals.utils import json_codec  # noqa: E402
+
+
+_REVIEWERS = ["assumption-hunter", "scope-guardian", "problem-framer", "success-validator"]
+_WORDS = (
+    "design requirement phase reviewer judge document assumption scope criteria "
+    "validation cache latency ground truth finding section acceptance undefined"
+).split()
+
+
+def synthetic_lines(n: int, seed: int = 0) -> list[str]:
+    """n schema-shaped finding records, one JSON document per line."""
+    rng = random.Random(seed)
+
+    def sentence(k: int) -> str:
+        return " ".join(rng.choice(_WORDS) for _ in range(k)).capitalize() + "."
+
+    lines = []
+    for i in range(n):
+        reviewer = rng.choice(_REVIEWERS)
+        lines.append(json.dumps({
+            "type": "finding",
+            "id": f"v1-{reviewer}-{i % 1000:03d}",
+            "title": sentence(8),
+            "severity": rng.choice(["Critical", "Important", "Minor"]),
+            "confidence": rng.randint(40, 100),
+            "phase": {"primary": "design", "contributing": None},
+            "section": sentence(3),
+            "issue": sentence(40),
+            "why_it_matters": sentence(25),
+            "suggestion": sentence(25),
+        }))
+    return lines
+
+
+def _time(decode, lines: list[str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for line in lines:
+            decode(line)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--findings", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    lines = synthetic_lines(args.findings)
+    size_mb = sum(len(line) + 1 for line in lines) / 1e6
+    print(f"Corpus: {len(lines):,} findings, {size_mb:.1f} MB")
+
+    decoders = [(name, json_codec.loads_with(name)) for name in json_codec._available_backends()[::-1]]
+    typed = json_codec.finding_decoder()
+    if typed is not None:
+        decoders.append(("msgspec-typed", typed))
+
+    baseline = None
+    print(f"\n{'Backend':<16} {'Seconds':>9} {'Findings/s':>12} {'Speedup':>8}")
+    print("-" * 48)
+    for name, decode in decoders:
+        elapsed = _time(decode, lines, args.repeat)
+        baseline = baseline or elapsed
+        print(f"{name:<16} {elapsed:>9.3f} {len(lines) / elapsed:>12,.0f} {baseline / elapsed:>7.1f}x")
+    print(f"\nActive backend (json_codec.BACKEND): {json_codec.BACKEND}")
+
+
+if __name__ == "__main__":
+    main()
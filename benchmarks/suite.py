@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite: the eval pipeline from dataset load to regression check.
+
+Each case builds a synthetic corpus of N reviewer findings (untimed), then
+times one pipeline stage on it at every --scales size up to the case's limit:
+
+    parse_review_output      reviewer JSONL completion → findings
+    match_findings           N actual vs N/2 expected findings (severity_scorer)
+    load_validated_findings  dataset directory → Inspect Sample, parse cache cleared
+    drop_section             SKILL.md with N sections, one dropped from the middle
+    validate_jsonl_file      reviewer-findings schema validation of N records
+    load_run                 .eval header + reductions with N samples (compare_to_baseline)
+    reverse_judge_precision  scorer over N findings, stub judge
+    must_find_recall         scorer over N must-finds, stub judge
+
+The stub judge is an in-process Inspect provider ("benchstub/") that answers
+YES at once, so the scorer cases time parsing, prompt building, caching and
+dispatch overhead but no model latency.
+
+Timing is asv-style: each case runs in a loop long enough to fill --min-time,
+the loop is repeated --repeat times, and the median per-call time is kept.
+--save appends the run to benchmarks/results/history.jsonl (commit, machine,
+Python, seconds per case and scale). --check compares against the latest saved
+run from the same machine and exits 1 when any case is slower by more than
+--threshold (default 25%). Times under --floor are too noisy to gate and are
+reported only.
+
+Usage:
+    python benchmarks/suite.py                          # 10 … 100k findings
+    python benchmarks/suite.py --quick --check          # make bench
+    python benchmarks/suite.py --save                   # make bench-save
+    python benchmarks/suite.py --cases match_findings,must_find_recall --scales 1000,10000
+"""
+import argparse
+import asyncio
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Callable
+
+_REPO_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(_REPO_ROOT))
+
+from inspect_ai.model import ModelAPI, ModelOutput, ModelUsage, modelapi  # noqa: E402
+
+from benchmarks.bench_eval_archive import write_synthetic_log  # noqa: E402
+from benchmarks.bench_json_decode import synthetic_lines  # noqa: E402
+from evals.utils.dataset_loader import clear_dataset_cache, load_validated_findings  # noqa: E402
+from evals.utils.output_parser import parse_review_output  # noqa: E402
+from evals.utils.skill_loader import drop_section  # noqa: E402
+from scorers.must_find_scorer import must_find_recall  # noqa: E402
+from scorers.reverse_judge_scorer import reverse_judge_precision  # noqa: E402
+from scorers.severity_scorer import match_findings  # noqa: E402
+from tools.compare_to_baseline import load_run  # noqa: E402
+
+HISTORY_PATH = Path(__file__).parent / "results" / "history.jsonl"
+DEFAULT_SCALES = [10, 100, 1_000, 10_000, 100_000]
+QUICK_SCALES = [10, 1_000]
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_FLOOR_S = 100e-6
+STUB_JUDGE = "benchstub/judge"
+
+
+@modelapi(name="benchstub")
+def benchstub() -> type[ModelAPI]:
+    return StubJudgeAPI
+
+
+class StubJudgeAPI(ModelAPI):
+    """Answers every judge prompt with an immediate YES."""
+
+    def __init__(self, model_name: str, base_url=None, api_key=None, config=None, **model_args):
+        super().__init__(model_name, base_url, api_key, [], config)
+
+    async def generate(self, input, tools, tool_choice, config) -> ModelOutput:
+        output = ModelOutput.from_content(self.model_name, "YES\nThe finding is genuine.")
+        output.usage = ModelUsage(input_tokens=sum(len(m.text) for m in input) // 4,
+                                  output_tokens=8, total_tokens=0)
+        return output
+
+    async def count_text_tokens(self, text: str) -> int:
+        return (len(text) + 3) // 4
+
+
+# ── Synthetic corpora ────────────────────────────────────────────────────────
+
+
+_SYLLABLES = ["ca", "che", "la", "ten", "cy", "re", "tri", "bud", "get", "scope", "pha", "se",
+              "gate", "va", "lid", "ju", "dge", "do", "cu", "ment", "sec", "tion", "cri", "te"]
+
+
+def synthetic_findings(n: int, seed: int = 0) -> list[dict]:
+    """Schema-shaped findings with distinct titles.
+
+    bench_json_decode's corpus draws titles from 16 words, which makes every
+    pair of titles look alike; real titles share far fewer bigrams, so titles
+    here come from a vocabulary of a few thousand pseudo-words.
+    """
+    rng = random.Random(seed)
+    vocabulary = ["".join(rng.choices(_SYLLABLES, k=rng.randint(2, 4))) for _ in range(5000)]
+    findings = [json.loads(line) for line in synthetic_lines(n, seed)]
+    for finding in findings:
+        finding["title"] = " ".join(rng.choices(vocabulary, k=rng.randint(4, 9))).capitalize()
+    return findings
+
+
+def _perturb(title: str, rng: random.Random) -> str:
+    """A reworded title that still clears the 0.8 match threshold most of the time."""
+    words = title.split()
+    if len(words) > 2 and rng.random() < 0.5:
+        i = rng.randrange(len(words) - 1)
+        words[i], words[i + 1] = words[i + 1], words[i]
+    return " ".join(words)
+
+
+def expected_for(findings: list[dict], seed: int = 1) -> list[dict]:
+    """Ground truth for half of findings (reworded), the rest unmatched."""
+    rng = random.Random(seed)
+    expected = [
+        {**f, "id": f"gt-{i}", "title": _perturb(f["title"], rng)}
+        for i, f in enumerate(findings[::2])
+    ]
+    return expected
+
+
+def completion_for(findings: list[dict]) -> str:
+    return "```jsonl\n" + "\n".join(json.dumps(f) for f in findings) + "\n```"
+
+
+def write_dataset(root: Path, findings: list[dict]) -> Path:
+    root.mkdir(parents=True, exist_ok=True)
+    (root / "design.md").write_text("# Design\n\n" + "\n".join(f["issue"] for f in findings[:200]))
+    with open(root / "critical_findings.jsonl", "w") as f:
+        for finding in findings:
+            f.write(json.dumps({**finding, "validation_status": "real_flaw", "reviewer": "bench"}) + "\n")
+    with open(root / "must_find.jsonl", "w") as f:
+        for finding in findings[:: max(1, len(findings) // 50)]:
+            f.write(json.dumps({"id": finding["id"], "title": finding["title"],
+                                "issue": finding["issue"], "min_recall": 0.8}) + "\n")
+    (root / "metadata.json").write_text(json.dumps({"design_doc_path": "design.md"}))
+    return root
+
+
+def skill_with_sections(n: int) -> str:
+    return "# Skill\n\n" + "\n\n".join(
+        f"## Section {i}\n" + "Guidance line for the reviewer.\n" * 3 for i in range(n)
+    )
+
+
+# ── Cases ────────────────────────────────────────────────────────────────────
+
+
+@dataclass
+class Case:
+    name: str
+    setup: Callable[[int, Path], Callable[[], object]]  # (scale, tmp dir) → timed call
+    max_scale: int = DEFAULT_SCALES[-1]
+
+
+def _state(completion: str, metadata: dict) -> SimpleNamespace:
+    return SimpleNamespace(
+        output=SimpleNamespace(completion=completion), metadata=metadata,
+        input_text="", sample_id="bench",
+    )
+
+
+def _setup_parse(n: int, tmp: Path):
+    completion = completion_for(synthetic_findings(n))
+    return lambda: parse_review_output(completion)
+
+
+def _setup_match(n: int, tmp: Path):
+    actual = synthetic_findings(n)
+    expected = expected_for(actual)
+    return lambda: match_findings(actual, expected)
+
+
+def _setup_load_dataset(n: int, tmp: Path):
+    path = str(write_dataset(tmp / f"dataset-{n}", synthetic_findings(n)))
+
+    def run():
+        clear_dataset_cache()
+        return load_validated_findings(path)
+    return run
+
+
+def _setup_drop_section(n: int, tmp: Path):
+    content = skill_with_sections(n)
+    header = f"## Section {n // 2}"
+    return lambda: drop_section(content, header)
+
+
+def _setup_validate(n: int, tmp: Path):
+    import importlib.util
+
+    spec = importlib.util.spec_from_file_location("validate_schemas", _REPO_ROOT / "scripts" / "validate-schemas.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    path = tmp / f"findings-{n}.jsonl"
+    path.write_text("\n".join(synthetic_lines(n)) + "\n")
+    return lambda: module.validate_jsonl_file(path, "reviewer-findings")
+
+
+def _setup_load_run(n: int, tmp: Path):
+    path = write_synthetic_log(tmp / f"run-{n}.eval", samples=n, sample_kb=1)
+    return lambda: load_run(path)
+
+
+def _setup_reverse_judge(n: int, tmp: Path):
+    findings = synthetic_findings(n)
+    scorer = reverse_judge_precision(judge=STUB_JUDGE)
+    state = _state(completion_for(findings), {"doc_content": "# Design\n\nBenchmark document."})
+    return lambda: asyncio.run(scorer(state, None))
+
+
+def _setup_must_find(n: int, tmp: Path):
+    findings = synthetic_findings(n)
+    must_finds = [{"id": f["id"], "title": f["title"], "issue": f["issue"]} for f in findings]
+    scorer = must_find_recall(judge=STUB_JUDGE)
+    state = _state(completion_for(findings[:200]), {"must_find_findings": must_finds})
+    return lambda: asyncio.run(scorer(state, None))
+
+
+CASES = [
+    Case("parse_review_output", _setup_parse),
+    # _candidate_pairs compares every title pair of a severity group; real
+    # reviews have tens of findings per document, and 10k would take minutes.
+    Case("match_findings", _setup_match, max_scale=1_000),
+    Case("load_validated_findings", _setup_load_dataset),
+    Case("drop_section", _setup_drop_section),
+    Case("validate_jsonl_file", _setup_validate),
+    Case("load_run", _setup_load_run, max_scale=10_000),
+    # One judge call per finding, each a full Inspect generate(); 100k calls
+    # would time the event loop rather than the scorer.
+    Case("reverse_judge_precision", _setup_reverse_judge, max_scale=10_000),
+    Case("must_find_recall", _setup_must_find, max_scale=10_000),
+]
+
+
+# ── Timing ───────────────────────────────────────────────────────────────────
+
+
+def time_call(fn: Callable[[], object], repeat: int, min_time: float) -> float:
+    """Median seconds per call over repeat loops of at least min_time each."""
+    t0 = time.perf_counter()
+    fn()  # warm-up, also sizes the loop
+    first = time.perf_counter() - t0
+    number = max(1, int(min_time / first)) if first > 0 else 1000
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - t0) / number)
+    return statistics.median(samples)
+
+
+def run_suite(cases: list[Case], scales: list[int], repeat: int, min_time: float,
+              progress: Callable[[str, int, float], None] | None = None) -> dict[str, dict[str, float]]:
+    results: dict[str, dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for case in cases:
+            for scale in scales:
+                if scale > case.max_scale:
+                    continue
+                seconds = time_call(case.setup(scale, Path(tmp)), repeat, min_time)
+                results.setdefault(case.name, {})[str(scale)] = seconds
+                if progress:
+                    progress(case.name, scale, seconds)
+    return results
+
+
+# ── History and regression check ─────────────────────────────────────────────
+
+
+def machine_id() -> str:
+    return f"{platform.node()}-{platform.machine()}"
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=_REPO_ROOT,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_history(path: Path = HISTORY_PATH) -> list[dict]:
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text().splitlines() if line.strip()]
+
+
+def save_run(results: dict, path: Path = HISTORY_PATH) -> dict:
+    entry = {
+        "commit": _git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "machine": machine_id(),
+        "python": platform.python_version(),
+        "results": results,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a") as f:
+        f.write(json.dumps(entry, sort_keys=True) + "\n")
+    return entry
+
+
+def latest_for_machine(history: list[dict], machine: str) -> dict | None:
+    runs = [entry for entry in history if entry.get("machine") == machine]
+    return runs[-1] if runs else None
+
+
+def compare(results: dict, previous: dict, threshold: float, floor: float) -> list[dict]:
+    """One row per case and scale present in both runs, flagged when regressed."""
+    rows = []
+    for case, scales in results.items():
+        for scale, seconds in scales.items():
+            before = previous.get("results", {}).get(case, {}).get(scale)
+            if before is None:
+                continue
+            ratio = seconds / before if before else float("inf")
+            rows.append({
+                "case": case, "scale": int(scale), "before": before, "after": seconds, "ratio": ratio,
+                "regressed": ratio > 1 + threshold and max(seconds, before) >= floor,
+            })
+    return rows
+
+
+def _fmt_seconds(seconds: float) -> str:
+    for unit, factor in (("s", 1), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= factor:
+            return f"{seconds / factor:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cases", help=f"Comma-separated subset of: {', '.join(c.name for c in CASES)}")
+    parser.add_argument("--scales", help="Comma-separated corpus sizes (default: 10 … 100000)")
+    parser.add_argument("--quick", action="store_true", help=f"Scales {QUICK_SCALES}, fewer repeats")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.2, help="Seconds per timing loop")
+    parser.add_argument("--save", action="store_true", help=f"Append the run to {HISTORY_PATH.relative_to(_REPO_ROOT)}")
+    parser.add_argument("--check", action="store_true", help="Exit 1 on regression vs the last saved run")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--floor", type=float, default=DEFAULT_FLOOR_S, help="Never gate cases faster than this")
+    parser.add_argument("--history", type=Path, default=HISTORY_PATH)
+    args = parser.parse_args()
+
+    cases = CASES
+    if args.cases:
+        wanted = set(args.cases.split(","))
+        unknown = wanted - {c.name for c in CASES}
+        if unknown:
+            parser.error(f"Unknown cases: {', '.join(sorted(unknown))}")
+        cases = [c for c in CASES if c.name in wanted]
+    scales = [int(s) for s in args.scales.split(",")] if args.scales else (
+        QUICK_SCALES if args.quick else DEFAULT_SCALES
+    )
+    repeat = min(args.repeat, 3) if args.quick else args.repeat
+    min_time = min(args.min_time, 0.05) if args.quick else args.min_time
+
+    print(f"{'Case':<26} {'Findings':>9} {'Per call':>11}")
+    print("-" * 48)
+    results = run_suite(
+        cases, scales, repeat, min_time,
+        progress=lambda case, scale, seconds: print(f"{case:<26} {scale:>9,} {_fmt_seconds(seconds):>11}", flush=True),
+    )
+
+    regressed = []
+    previous = latest_for_machine(load_history(args.history), machine_id())
+    if previous is None:
+        print(f"\nNo saved run for {machine_id()} in {args.history}; nothing to compare.")
+    else:
+        rows = compare(results, previous, args.threshold, args.floor)
+        regressed = [row for row in rows if row["regressed"]]
+        print(f"\nvs {previous.get('commit') or '?'} ({previous['timestamp']}): "
+              f"{len(rows)} compared, {len(regressed)} slower than +{args.threshold:.0%}")
+        for row in sorted(rows, key=lambda r: -r["ratio"]):
+            if row["regressed"] or row["ratio"] < 1 / (1 + args.threshold):
+                flag = "REGRESSED" if row["regressed"] else "faster"
+                print(f"  {row['case']:<26} {row['scale']:>9,} {_fmt_seconds(row['before']):>11} → "
+                      f"{_fmt_seconds(row['after']):>11} ({row['ratio']:.2f}x) {flag}")
+
+    if args.save:
+        save_run(results, args.history)
+        print(f"Saved to {args.history}")
+    sys.exit(1 if args.check and regressed else 0)
+
+
+if __name__ == "__main__":
+    main()
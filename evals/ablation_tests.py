@@ -1,7 +1,34 @@
+"""
+Ablation tasks: drop prompt sections and measure the Critical-detection drop.
+
+ablation_matrix runs any set of variants of one prompt source (a skill's
+SKILL.md or an agent file) as a single eval, alongside the unablated control:
+
+    inspect eval evals/ablation_tests.py@ablation_matrix \\
+        -T ablations='{"no_process": ["## Process"], "no_examples_limits": ["## Examples", "## Limitations"]}'
+    inspect eval evals/ablation_tests.py@ablation_matrix -T source=agent:scope-guardian \\
+        -T ablations='["**Voice rules:**", "**Blind spot check:**"]'
+
+A dict maps variant names to the sections they drop (any combination); a list
+gives one single-section variant per header. Sections are markdown headers or,
+for agent files, bold labels (see drop_section). The source is loaded once and
+every variant derived from it with drop_section. Variants with identical
+prompts (a header that does not exist, or drops covering the same text) are
+deduplicated by SHA-256 and generated once; each sample records every variant
+name sharing its prompt. All unique prompts × dataset samples run concurrently
+within the one task. tools/ablation_report.py turns the log into a table of
+detection deltas against the control.
+
+The single-section tasks below are kept for existing invocations.
+"""
+import hashlib
+import re
 from pathlib import Path
 from inspect_ai import Task, task
-from inspect_ai.solver import generate, system_message
+from inspect_ai.dataset import Dataset, MemoryDataset
+from inspect_ai.solver import Generate, Solver, TaskState, generate, solver, system_message
 
+from evals.utils.agent_loader import load_agent_content
 from evals.utils.dataset_loader import load_validated_findings
 from evals.utils.skill_loader import load_skill_content, drop_section
 from scorers.severity_scorer import severity_calibration
@@ -9,6 +36,131 @@ from scorers.severity_scorer import severity_calibration
 
 DATASET_PATH = Path(__file__).parent.parent / "datasets" / "inspect-ai-integration-requirements-v2"
 
+CONTROL = "control"
+DEFAULT_SOURCE = "skill:requirements"
+# Sections of skills/requirements/SKILL.md (the default source); each must exist
+# there, or its variant deduplicates onto the control and measures nothing.
+DEFAULT_ABLATIONS = {
+    "no_process": ["## Process"],
+    "no_examples": ["## Examples"],
+    "no_limitations": ["## Limitations"],
+}
+
+
+def load_source(source: str) -> str:
+    """Prompt text for "skill:<name>" (skills/<name>/SKILL.md) or "agent:<name>" (agents/<name>.md)."""
+    kind, _, name = source.partition(":")
+    if kind == "skill" and name:
+        return load_skill_content(name)
+    if kind == "agent" and name:
+        return load_agent_content(name)
+    raise ValueError(f"Ablation source must be skill:<name> or agent:<name>; got {source!r}")
+
+
+def _variant_name(header: str) -> str:
+    return "no_" + re.sub(r"[^a-z0-9]+", "_", header.lstrip("#").lower()).strip("_")
+
+
+def normalise_ablations(ablations: dict | list | None) -> dict[str, tuple[str, ...]]:
+    """Matrix spec → {variant name: section headers to drop}."""
+    if ablations is None:
+        ablations = DEFAULT_ABLATIONS
+    if isinstance(ablations, (list, tuple)):
+        ablations = {_variant_name(header): [header] for header in ablations}
+    spec = {}
+    for name, headers in ablations.items():
+        headers = (headers,) if isinstance(headers, str) else tuple(headers)
+        if name == CONTROL:
+            raise ValueError(f"{CONTROL!r} is reserved for the unablated prompt")
+        if not headers:
+            raise ValueError(f"Ablation {name!r} drops no sections")
+        spec[name] = headers
+    return spec
+
+
+def prompt_hash(prompt: str) -> str:
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+
+def ablation_variants(content: str, ablations: dict[str, tuple[str, ...]]) -> dict[str, dict]:
+    """
+    Unique variant prompts, keyed by prompt hash, control first.
+
+    Each value is {"prompt": text, "variants": [names sharing that prompt]}.
+    """
+    prompts = {CONTROL: content.strip()}  # drop_section strips; keep the control comparable
+    for name, headers in ablations.items():
+        prompt = content
+        for header in headers:
+            prompt = drop_section(prompt, header)
+        prompts[name] = prompt.strip()
+
+    unique: dict[str, dict] = {}
+    for name, prompt in prompts.items():
+        unique.setdefault(prompt_hash(prompt), {"prompt": prompt, "variants": []})["variants"].append(name)
+    return unique
+
+
+def matrix_dataset(samples: Dataset, unique: dict[str, dict]) -> MemoryDataset:
+    """One copy of every sample per unique prompt, tagged with its hash and variant names."""
+    matrix = []
+    for sample in samples:
+        for digest, variant in unique.items():
+            label = variant["variants"][0]
+            matrix.append(sample.model_copy(update={
+                "id": label if sample.id is None else f"{sample.id}@{label}",
+                "metadata": {
+                    **(sample.metadata or {}),
+                    "ablation_prompt": digest,
+                    "ablations": list(variant["variants"]),
+                },
+            }))
+    return MemoryDataset(samples=matrix, name=f"{samples.name or 'ablation'}-matrix")
+
+
+@solver
+def ablation_prompt(prompts: dict[str, str]) -> Solver:
+    """System message for the sample's variant (metadata["ablation_prompt"] → prompt)."""
+    messages = {digest: system_message(prompt) for digest, prompt in prompts.items()}
+
+    async def solve(state: TaskState, generate: Generate) -> TaskState:
+        return await messages[state.metadata["ablation_prompt"]](state, generate)
+
+    return solve
+
+
+def _source_dataset(source: str, dataset_path: Path) -> Dataset:
+    # Agent sources are scored against their own findings when the dataset has any.
+    kind, _, name = source.partition(":")
+    if kind == "agent":
+        try:
+            return load_validated_findings(dataset_path, reviewer_filter=name)
+        except ValueError:
+            pass
+    return load_validated_findings(dataset_path)
+
+
+@task
+def ablation_matrix(
+    source: str = DEFAULT_SOURCE,
+    ablations: dict | list | None = None,
+    dataset: str = DATASET_PATH.name,
+) -> Task:
+    """Control plus every ablation variant of source, deduplicated, in one eval."""
+    spec = normalise_ablations(ablations)
+    unique = ablation_variants(load_source(source), spec)
+    return Task(
+        dataset=matrix_dataset(_source_dataset(source, DATASET_PATH.parent / dataset), unique),
+        plan=[ablation_prompt({digest: variant["prompt"] for digest, variant in unique.items()}), generate()],
+        scorer=severity_calibration(),
+        max_tokens=16000,
+        metadata={
+            "ablation_source": source,
+            "ablations": {name: list(headers) for name, headers in spec.items()},
+            "ablation_prompts": {digest: variant["variants"] for digest, variant in unique.items()},
+        },
+    )
+
 
 def _ablated_task(section_to_drop: str, task_name: str) -> Task:
     skill = load_skill_content("requirements")
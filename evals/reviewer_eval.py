@@ -11,15 +11,28 @@ Dataset decisions:
 - constraint-finder:
   use inspect-ai-integration-requirements-light (v2 dataset has 0 constraint-finder
   real_flaws — all were quality failures per Session 25)
+
+reviewer_suite_eval runs one reviewer across every dataset under datasets/
+(one sample per document), optionally sharded:
+    inspect eval evals/reviewer_eval.py@reviewer_suite_eval -T reviewer=scope-guardian -T shard=0 -T num_shards=4
+
+agent_eval runs any agent against one dataset directory; tools/run_suite.py fans
+it out over agents × datasets × epochs.
+
+Every task takes -T epochs=N. Inspect runs the N epochs concurrently (sharing
+the judge cache); scorers.epoch_stats.reviewer_epochs reduces them, enforcing
+must-find min_recall from N≥3, and both scorers report bootstrap ci_lower /
+ci_upper alongside the mean.
 """
 from pathlib import Path
-from inspect_ai import Task, task
+from inspect_ai import Epochs, Task, task
 from inspect_ai.solver import generate, system_message
 
-from evals.utils.dataset_loader import load_validated_findings
+from evals.utils.dataset_loader import load_document, load_document_suite, load_validated_findings
 from evals.utils.agent_loader import load_agent_content
 from scorers.reverse_judge_scorer import reverse_judge_precision
 from scorers.must_find_scorer import must_find_recall
+from scorers.epoch_stats import reviewer_epochs
 
 
 _DATASETS = Path(__file__).parent.parent / "datasets"
@@ -27,48 +40,86 @@ _V2_DATASET = _DATASETS / "inspect-ai-integration-requirements-v2"
 _LIGHT_DATASET = _DATASETS / "inspect-ai-integration-requirements-light"
 
 
-def _reviewer_task(reviewer: str, dataset_path: Path) -> Task:
+def _reviewer_task(reviewer: str, dataset_path: Path, epochs: int = 1) -> Task:
     """Build a reviewer eval task: load dataset filtered to reviewer, inject agent prompt."""
+    return _reviewer_task_for(
+        reviewer, load_validated_findings(dataset_path, reviewer_filter=reviewer), epochs
+    )
+
+
+def _reviewer_task_for(reviewer: str, dataset, epochs: int = 1) -> Task:
+    """Reviewer task over any dataset; epochs > 1 reduces with reviewer_epochs."""
     return Task(
-        dataset=load_validated_findings(dataset_path, reviewer_filter=reviewer),
+        dataset=dataset,
+        epochs=Epochs(epochs, reviewer_epochs()),
         plan=[
+            load_document(),
             system_message(load_agent_content(reviewer)),
             generate(),
         ],
-        scorer=[reverse_judge_precision(), must_find_recall()],
+        scorer=[reverse_judge_precision(cache=True), must_find_recall(cache=True)],
         max_tokens=16000,
     )
 
 
 @task
-def assumption_hunter_eval() -> Task:
+def assumption_hunter_eval(epochs: int = 1) -> Task:
     """Evaluate assumption-hunter against its v2 pre-fix ground truth findings."""
-    return _reviewer_task("assumption-hunter", _V2_DATASET)
+    return _reviewer_task("assumption-hunter", _V2_DATASET, epochs)
 
 
 @task
-def constraint_finder_eval() -> Task:
+def constraint_finder_eval(epochs: int = 1) -> Task:
     """Evaluate constraint-finder against requirements-light ground truth.
 
     Note: v2 dataset has 0 constraint-finder real_flaws (all were quality failures).
     requirements-light has 2 constraint-finder real_flaws.
     """
-    return _reviewer_task("constraint-finder", _LIGHT_DATASET)
+    return _reviewer_task("constraint-finder", _LIGHT_DATASET, epochs)
 
 
 @task
-def problem_framer_eval() -> Task:
+def problem_framer_eval(epochs: int = 1) -> Task:
     """Evaluate problem-framer against its v2 pre-fix ground truth findings."""
-    return _reviewer_task("problem-framer", _V2_DATASET)
+    return _reviewer_task("problem-framer", _V2_DATASET, epochs)
 
 
 @task
-def scope_guardian_eval() -> Task:
+def scope_guardian_eval(epochs: int = 1) -> Task:
     """Evaluate scope-guardian against its v2 pre-fix ground truth findings."""
-    return _reviewer_task("scope-guardian", _V2_DATASET)
+    return _reviewer_task("scope-guardian", _V2_DATASET, epochs)
 
 
 @task
-def success_validator_eval() -> Task:
+def success_validator_eval(epochs: int = 1) -> Task:
     """Evaluate success-validator against its v2 pre-fix ground truth findings."""
-    return _reviewer_task("success-validator", _V2_DATASET)
+    return _reviewer_task("success-validator", _V2_DATASET, epochs)
+
+
+@task
+def reviewer_suite_eval(
+    reviewer: str = "assumption-hunter", shard: int = 0, num_shards: int = 1, epochs: int = 1,
+) -> Task:
+    """Evaluate one reviewer across every dataset directory (one sample per document)."""
+    return _reviewer_task_for(
+        reviewer,
+        load_document_suite(reviewer_filter=reviewer, shard=shard, num_shards=num_shards),
+        epochs,
+    )
+
+
+@task
+def agent_eval(
+    agent: str = "assumption-hunter", dataset: str = _V2_DATASET.name, epochs: int = 1,
+) -> Task:
+    """Evaluate any agent against one dataset directory (tools/run_suite.py entry point).
+
+    Ground truth is filtered to the agent's findings when the dataset has any;
+    agents with no validated findings there are scored against the full set.
+    """
+    dataset_path = _DATASETS / dataset
+    try:
+        samples = load_validated_findings(dataset_path, reviewer_filter=agent)
+    except ValueError:
+        samples = load_validated_findings(dataset_path)
+    return _reviewer_task_for(agent, samples, epochs)
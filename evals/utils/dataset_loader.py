@@ -1,6 +1,14 @@
+import hashlib
 import json
+import os
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
+from typing import Iterator
 from inspect_ai.dataset import MemoryDataset, Sample, Dataset
+from inspect_ai.solver import Generate, Solver, TaskState, solver
+
+from evals.utils import json_codec
 
 
 def count_by_severity(findings: list[dict]) -> dict:
@@ -14,7 +22,189 @@ def count_by_severity(findings: list[dict]) -> dict:
 
 def read_jsonl(path: Path) -> list[dict]:
     lines = path.read_text().strip().splitlines()
-    return [json.loads(line) for line in lines if line.strip()]
+    return [json_codec.loads(line) for line in lines if line.strip()]
+
+
+DATASETS_ROOT = Path(__file__).parent.parent.parent / "datasets"
+
+# Document store: content hash → file. Samples from the multi-document loader
+# carry only metadata["doc_hash"] (and "doc_path"); the text is read on demand.
+_DOCUMENTS: dict[str, Path] = {}
+_DOCUMENT_REF_PREFIX = "parallax-document:"
+
+
+def document_hash(text: str) -> str:
+    """SHA-256 of document text (same digest as scorers.judge_cache.content_hash)."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def register_document(path: Path) -> str:
+    """Add a document to the store and return its content hash."""
+    text = path.read_text()
+    doc_hash = document_hash(text)
+    _DOCUMENTS[doc_hash] = path
+    return doc_hash
+
+
+@lru_cache(maxsize=16)
+def read_document(doc_hash: str) -> str:
+    """Document text for a registered hash. Raises KeyError if unknown or changed."""
+    text = _DOCUMENTS[doc_hash].read_text()
+    if document_hash(text) != doc_hash:
+        raise KeyError(f"Document {doc_hash[:12]} changed on disk since it was registered")
+    return text
+
+
+def document_reference(doc_hash: str) -> str:
+    """Input of a multi-document sample until load_document() swaps in the text."""
+    return f"{_DOCUMENT_REF_PREFIX}{doc_hash}"
+
+
+def sample_document(metadata: dict, input_text: str | None = None) -> str:
+    """The document a sample was built from.
+
+    Single-document samples embed it as metadata["doc_content"]; multi-document
+    samples reference it by metadata["doc_hash"]. When this process has no
+    store entry for the hash (e.g. a rescored log), metadata["doc_path"] is
+    registered if its content still matches, else input_text is used unless
+    it is only a document_reference(). Raises KeyError when none of these
+    yield the document.
+    """
+    if "doc_content" in metadata:
+        return metadata["doc_content"]
+    doc_hash = metadata.get("doc_hash")
+    if doc_hash is None:
+        raise KeyError("Sample metadata has neither 'doc_content' nor 'doc_hash'")
+    try:
+        return read_document(doc_hash)
+    except KeyError:
+        doc_path = metadata.get("doc_path")
+        if doc_path and Path(doc_path).exists() and register_document(Path(doc_path)) == doc_hash:
+            return read_document(doc_hash)
+        if input_text is None or input_text.startswith(_DOCUMENT_REF_PREFIX):
+            raise
+        return input_text
+
+
+@solver
+def load_document() -> Solver:
+    """Replace a multi-document sample's reference input with the document text.
+
+    Samples that already carry their document (load_validated_findings) are
+    left as they are, so reviewer tasks use this solver for either loader.
+    """
+    async def solve(state: TaskState, generate: Generate) -> TaskState:
+        doc_hash = state.metadata.get("doc_hash")
+        if "doc_content" in state.metadata or doc_hash is None:
+            return state
+        if state.user_prompt.text == document_reference(doc_hash):
+            state.user_prompt.text = sample_document(state.metadata)
+        return state
+
+    return solve
+
+
+@dataclass
+class ParsedDataset:
+    """One dataset directory, parsed once and shared by every task built from it."""
+    metadata: dict
+    real_flaws: list[dict]
+    doc_hash: str
+    must_find_findings: list[dict] | None
+    fingerprint: tuple
+    real_flaws_by_reviewer: dict[str | None, list[dict]] = field(default_factory=dict)
+
+    def __post_init__(self):
+        for f in self.real_flaws:
+            self.real_flaws_by_reviewer.setdefault(f.get("reviewer"), []).append(f)
+
+    @property
+    def doc_content(self) -> str:
+        # Read through the document store's small LRU rather than pinning
+        # every dataset's document in the parse cache.
+        return read_document(self.doc_hash)
+
+    def view(self, reviewer_filter: str | None) -> list[dict]:
+        if reviewer_filter is None:
+            return list(self.real_flaws)
+        return list(self.real_flaws_by_reviewer.get(reviewer_filter, []))
+
+
+# Resolved dataset path → parse. Entries are revalidated against file stats on
+# every load, so editing ground truth mid-session is picked up.
+_DATASET_CACHE: dict[Path, ParsedDataset] = {}
+
+
+def clear_dataset_cache() -> None:
+    _DATASET_CACHE.clear()
+
+
+def _stat_key(path: Path) -> tuple | None:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _resolve_doc_path(base: Path, doc_path_str: str) -> Path:
+    doc_path = Path(doc_path_str)
+    if doc_path.is_absolute():
+        return doc_path  # use as-is
+    if "/" in doc_path_str or "\\" in doc_path_str:
+        # repo-relative path (legacy) — resolve from repo root
+        return Path(__file__).parent.parent.parent / doc_path
+    # bare filename — resolve against dataset directory (frozen snapshot)
+    return base / doc_path
+
+
+def _fingerprint(base: Path, doc_path: Path | None) -> tuple:
+    files = ["critical_findings.jsonl", "metadata.json", "must_find.jsonl"]
+    return tuple(_stat_key(base / name) for name in files) + (
+        _stat_key(doc_path) if doc_path is not None else None,
+    )
+
+
+def load_parsed_dataset(dataset_path: str | Path) -> ParsedDataset:
+    """Parse a dataset directory, reusing the process-level cache when unchanged.
+
+    The cache key is the resolved directory; an entry is reused only while the
+    mtime and size of critical_findings.jsonl, metadata.json, must_find.jsonl
+    and the design doc all match what was parsed.
+    """
+    base = Path(dataset_path).resolve()
+    cached = _DATASET_CACHE.get(base)
+    if cached is not None:
+        doc_path = _resolve_doc_path(base, cached.metadata["design_doc_path"])
+        if _fingerprint(base, doc_path) == cached.fingerprint:
+            return cached
+
+    findings = read_jsonl(base / "critical_findings.jsonl")
+    metadata = json.loads((base / "metadata.json").read_text())
+
+    # Only use confirmed real flaws as ground truth
+    real_flaws = [
+        f for f in findings
+        if f.get("type") == "finding" and f.get("validation_status") == "real_flaw"
+    ]
+
+    doc_path = _resolve_doc_path(base, metadata["design_doc_path"])
+    fingerprint = _fingerprint(base, doc_path)
+    doc_hash = register_document(doc_path)
+
+    # Load must-find list if present (optional — graceful skip if not yet curated)
+    must_find_path = base / "must_find.jsonl"
+    must_find_findings = read_jsonl(must_find_path) if must_find_path.exists() else None
+
+    parsed = ParsedDataset(
+        metadata=metadata,
+        real_flaws=real_flaws,
+        doc_hash=doc_hash,
+        must_find_findings=must_find_findings,
+        fingerprint=fingerprint,
+    )
+    _DATASET_CACHE[base] = parsed
+    return parsed
 
 
 def load_validated_findings(
@@ -28,22 +218,18 @@ def load_validated_findings(
     - target: str | list[str] — we use JSON-encoded list of expected finding IDs
     - metadata: dict — stores full ground truth (expected_findings, severity_distribution)
 
+    The dataset directory is parsed once per process (see load_parsed_dataset);
+    each call gets its own Sample built from a filtered view of that parse.
+
     Args:
         dataset_path: Path to dataset directory containing critical_findings.jsonl and metadata.json
         reviewer_filter: If provided, only include findings with matching reviewer field.
                          Use this for per-reviewer eval tasks (e.g., "assumption-hunter").
     """
-    base = Path(dataset_path)
-    findings = read_jsonl(base / "critical_findings.jsonl")
-    metadata = json.loads((base / "metadata.json").read_text())
+    parsed = load_parsed_dataset(dataset_path)
 
-    # Only use confirmed real flaws as ground truth, optionally filtered by reviewer
-    real_flaws = [
-        f for f in findings
-        if f.get("type") == "finding"
-        and f.get("validation_status") == "real_flaw"
-        and (reviewer_filter is None or f.get("reviewer") == reviewer_filter)
-    ]
+    # Confirmed real flaws, optionally filtered by reviewer
+    real_flaws = parsed.view(reviewer_filter)
 
     if reviewer_filter is not None and not real_flaws:
         raise ValueError(
@@ -52,32 +238,89 @@ def load_validated_findings(
             f"and that matched findings have validation_status='real_flaw'."
         )
 
-    doc_path_str = metadata["design_doc_path"]
-    doc_path = Path(doc_path_str)
-    if doc_path.is_absolute():
-        pass  # use as-is
-    elif "/" in doc_path_str or "\\" in doc_path_str:
-        # repo-relative path (legacy) — resolve from repo root
-        doc_path = Path(__file__).parent.parent.parent / doc_path
-    else:
-        # bare filename — resolve against dataset directory (frozen snapshot)
-        doc_path = base / doc_path
-    doc_content = doc_path.read_text()
-
-    # Load must-find list if present (optional — graceful skip if not yet curated)
-    must_find_path = base / "must_find.jsonl"
-    must_find_findings = read_jsonl(must_find_path) if must_find_path.exists() else None
-
+    must_find_findings = parsed.must_find_findings
     sample = Sample(
-        input=doc_content,
+        input=parsed.doc_content,
         target=[f["id"] for f in real_flaws],
         metadata={
-            **metadata,
+            **parsed.metadata,
             "expected_findings": real_flaws,
             "severity_distribution": count_by_severity(real_flaws),
-            "doc_content": doc_content,
-            "must_find_findings": must_find_findings,
+            "doc_content": parsed.doc_content,
+            "must_find_findings": list(must_find_findings) if must_find_findings is not None else None,
         }
     )
 
     return MemoryDataset(samples=[sample])
+
+
+def discover_datasets(root: str | Path = DATASETS_ROOT) -> list[Path]:
+    """Every dataset directory under root (one with metadata.json and critical_findings.jsonl)."""
+    return sorted(
+        meta.parent for meta in Path(root).rglob("metadata.json")
+        if (meta.parent / "critical_findings.jsonl").exists()
+    )
+
+
+def iter_document_samples(
+    root: str | Path = DATASETS_ROOT,
+    reviewer_filter: str | None = None,
+    shard: int = 0,
+    num_shards: int = 1,
+) -> Iterator[Sample]:
+    """Yield one Sample per dataset directory, without holding any document text.
+
+    Datasets are assigned to shards round-robin in sorted order, so shard i of
+    n is stable across processes. Samples reference their document by hash
+    (metadata["doc_hash"], plus "doc_path"); the input is document_reference()
+    until the load_document() solver reads the text for that sample alone.
+    Datasets with no real flaws for reviewer_filter are skipped.
+    """
+    if not 0 <= shard < num_shards:
+        raise ValueError(f"shard must be in [0, {num_shards}), got {shard}")
+
+    for base in discover_datasets(root)[shard::num_shards]:
+        parsed = load_parsed_dataset(base)
+        real_flaws = parsed.view(reviewer_filter)
+        if not real_flaws:
+            continue
+        must_find_findings = parsed.must_find_findings
+        yield Sample(
+            id=base.name,
+            input=document_reference(parsed.doc_hash),
+            target=[f["id"] for f in real_flaws],
+            metadata={
+                **parsed.metadata,
+                "dataset": base.name,
+                "doc_hash": parsed.doc_hash,
+                "doc_path": str(_DOCUMENTS[parsed.doc_hash]),
+                "expected_findings": real_flaws,
+                "severity_distribution": count_by_severity(real_flaws),
+                "must_find_findings": list(must_find_findings) if must_find_findings is not None else None,
+            },
+        )
+
+
+def load_document_suite(
+    root: str | Path = DATASETS_ROOT,
+    reviewer_filter: str | None = None,
+    shard: int = 0,
+    num_shards: int = 1,
+) -> Dataset:
+    """Multi-document dataset: one sample per dataset directory in this shard.
+
+    Samples are small (no document text), so a shard is materialised as a
+    MemoryDataset; tasks add load_document() to read each document when its
+    sample runs.
+
+    Raises:
+        ValueError: if the shard contains no samples.
+    """
+    samples = list(iter_document_samples(root, reviewer_filter, shard, num_shards))
+    if not samples:
+        raise ValueError(
+            f"No datasets under {root} with real_flaw findings"
+            + (f" for reviewer_filter={reviewer_filter!r}" if reviewer_filter else "")
+            + (f" in shard {shard}/{num_shards}" if num_shards > 1 else "")
+        )
+    return MemoryDataset(samples=samples, name=f"document-suite-{shard}-of-{num_shards}")
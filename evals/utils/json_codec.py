@@ -0,0 +1,112 @@
+"""
+Pluggable JSON decoding for JSONL finding records.
+
+Every JSONL reader in the repo (dataset loader, review output parser, schema
+validator, validation UI) decodes one small object per line, where stdlib
+json's per-call overhead dominates. loads() uses the fastest installed
+backend and falls back to stdlib json otherwise:
+
+    orjson   → msgspec → json          (override: PARALLAX_JSON_BACKEND)
+
+Install the optional backends with `pip install -e ".[fast]"`.
+
+All backends raise json.JSONDecodeError (or a subclass) on bad input, so
+callers keep their existing `except json.JSONDecodeError` handling. orjson and
+msgspec are stricter than stdlib json about non-standard input (NaN/Infinity
+literals, integers beyond 64 bits); parallax records never contain either.
+
+With msgspec installed, finding_decoder() additionally returns a typed decoder
+producing FindingRecord structs for bulk analysis where dict access is not
+needed.
+"""
+import json
+import os
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # optional dependency
+    msgspec = None
+
+
+def _available_backends() -> list[str]:
+    backends = []
+    if orjson is not None:
+        backends.append("orjson")
+    if msgspec is not None:
+        backends.append("msgspec")
+    backends.append("json")
+    return backends
+
+
+def _make_loads(backend: str) -> Callable[[str | bytes], Any]:
+    if backend == "orjson":
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError already.
+        return orjson.loads
+    if backend == "msgspec":
+        decoder = msgspec.json.Decoder()
+
+        def loads(data: str | bytes) -> Any:
+            try:
+                return decoder.decode(data)
+            except msgspec.DecodeError as e:
+                doc = data if isinstance(data, str) else data.decode("utf-8", "replace")
+                raise json.JSONDecodeError(str(e), doc, 0) from None
+
+        return loads
+    return json.loads
+
+
+def select_backend(name: str | None = None) -> str:
+    """Pick a decoder backend by name, or the fastest installed one.
+
+    Raises:
+        ValueError: if the named backend is unknown or not installed.
+    """
+    available = _available_backends()
+    if name is None:
+        return available[0]
+    if name not in available:
+        raise ValueError(
+            f"JSON backend {name!r} is not available. Installed: {', '.join(available)}"
+        )
+    return name
+
+
+BACKEND = select_backend(os.environ.get("PARALLAX_JSON_BACKEND") or None)
+loads = _make_loads(BACKEND)
+
+
+def loads_with(backend: str) -> Callable[[str | bytes], Any]:
+    """Return the loads function for a specific backend (benchmarks, tests)."""
+    return _make_loads(select_backend(backend))
+
+
+if msgspec is not None:
+    class FindingRecord(msgspec.Struct, kw_only=True, omit_defaults=True):
+        """Typed view of a reviewer-findings-v1.0.0 record (unknown fields ignored)."""
+        type: str
+        id: str | None = None
+        title: str = ""
+        severity: str | None = None
+        confidence: int | None = None
+        section: str | None = None
+        issue: str = ""
+        why_it_matters: str | None = None
+        suggestion: str | None = None
+        reviewer: str | None = None
+        validation_status: str | None = None
+else:
+    FindingRecord = None
+
+
+def finding_decoder() -> Callable[[str | bytes], Any] | None:
+    """Typed FindingRecord decoder when msgspec is installed, else None."""
+    if msgspec is None:
+        return None
+    return msgspec.json.Decoder(FindingRecord).decode
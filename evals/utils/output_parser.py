@@ -1,4 +1,9 @@
 import json
+import re
+from dataclasses import dataclass
+from typing import AsyncIterable, Iterable, Iterator
+
+from evals.utils import json_codec
 
 
 def strip_fences(text: str) -> str:
@@ -18,27 +23,152 @@ def strip_fences(text: str) -> str:
     )
 
 
-def parse_review_output(completion: str, severity_filter: str | None = None) -> list[dict]:
+# Boundaries recognised by str.splitlines(); a chunk ending in none of these
+# leaves its last line incomplete.
+_LINE_BREAKS = ("\n", "\r", "\x0b", "\x0c", "\x1c", "\x1d", "\x1e", "\x85", "\u2028", "\u2029")
+_LINE_BREAK_RE = re.compile("[" + "".join(_LINE_BREAKS) + "]")
+
+
+@dataclass
+class ParseStats:
+    """Line counts from one parse, for diagnosing noisy reviewer output."""
+    lines: int = 0       # non-empty lines seen (fences included)
+    fences: int = 0      # markdown fence markers dropped
+    malformed: int = 0   # lines that were not a JSON object (prose, truncated JSON, ...)
+    filtered: int = 0    # JSON objects dropped by the type / severity filters
+    findings: int = 0    # findings yielded
+
+    def as_dict(self) -> dict:
+        return {
+            "lines": self.lines,
+            "fences": self.fences,
+            "malformed": self.malformed,
+            "filtered": self.filtered,
+            "findings": self.findings,
+        }
+
+
+class ReviewStreamParser:
     """
-    Parse model output text into structured findings.
-    Strips markdown code fences before parsing.
-    Expects JSONL format (one JSON object per line).
-    Returns only type=finding records, optionally filtered by severity.
-    Silently skips malformed lines.
+    Incremental JSONL parser for reviewer output arriving in chunks.
+
+    feed() accepts arbitrary text chunks (e.g. live streamed model output) and
+    returns the findings whose lines were completed by that chunk; close()
+    flushes a final unterminated line. Line handling matches
+    parse_review_output: fence-marker lines are dropped, blank and malformed
+    lines are skipped, and only records passing the filters are returned.
     """
-    cleaned = strip_fences(completion)
-    findings = []
-    for line in cleaned.splitlines():
+
+    def __init__(
+        self,
+        severity_filter: str | None = None,
+        record_type: str | None = "finding",
+        stats: ParseStats | None = None,
+    ):
+        self.severity_filter = severity_filter
+        self.record_type = record_type
+        self.stats = stats if stats is not None else ParseStats()
+        self._pending: list[str] = []
+
+    def feed(self, chunk: str) -> list[dict]:
+        # Buffer chunks without a line break so a long line streamed in many
+        # small pieces is joined once, not re-scanned on every chunk.
+        if not _LINE_BREAK_RE.search(chunk):
+            self._pending.append(chunk)
+            return []
+        self._pending.append(chunk)
+        lines = "".join(self._pending).splitlines(keepends=True)
+        # The last piece is incomplete unless it ends in a line break. A split
+        # "\r\n" only yields an extra blank line, which is skipped anyway.
+        self._pending = [lines.pop()] if not lines[-1].endswith(_LINE_BREAKS) else []
+        return [f for f in map(self._parse_line, lines) if f is not None]
+
+    def close(self) -> list[dict]:
+        pending, self._pending = "".join(self._pending), []
+        finding = self._parse_line(pending)
+        return [finding] if finding is not None else []
+
+    def _parse_line(self, line: str) -> dict | None:
         stripped = line.strip()
         if not stripped:
-            continue
+            return None
+        self.stats.lines += 1
+        if stripped.startswith("```"):
+            self.stats.fences += 1
+            return None
         try:
-            obj = json.loads(stripped)
+            obj = json_codec.loads(stripped)
         except json.JSONDecodeError:
-            continue
-        if obj.get("type") != "finding":
-            continue
-        if severity_filter and obj.get("severity") != severity_filter:
-            continue
-        findings.append(obj)
-    return findings
+            self.stats.malformed += 1
+            return None
+        if not isinstance(obj, dict):
+            self.stats.malformed += 1
+            return None
+        if self.record_type is not None and obj.get("type") != self.record_type:
+            self.stats.filtered += 1
+            return None
+        if self.severity_filter and obj.get("severity") != self.severity_filter:
+            self.stats.filtered += 1
+            return None
+        self.stats.findings += 1
+        return obj
+
+
+def iter_review_findings(
+    chunks: Iterable[str],
+    severity_filter: str | None = None,
+    stats: ParseStats | None = None,
+) -> Iterator[dict]:
+    """Yield findings from text chunks as soon as each line is complete."""
+    parser = ReviewStreamParser(severity_filter=severity_filter, stats=stats)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+async def aiter_review_findings(
+    chunks: AsyncIterable[str],
+    severity_filter: str | None = None,
+    stats: ParseStats | None = None,
+):
+    """Async variant of iter_review_findings for live streamed model output."""
+    parser = ReviewStreamParser(severity_filter=severity_filter, stats=stats)
+    async for chunk in chunks:
+        for finding in parser.feed(chunk):
+            yield finding
+    for finding in parser.close():
+        yield finding
+
+
+_COMPACT_FIELDS = ("title", "issue", "section")
+
+
+def render_findings_compact(findings: list[dict]) -> str:
+    """
+    Canonical judge rendering of parsed findings: one compact JSON object per
+    line with only title/issue/section. Reviewer preamble, fences, prose and
+    fields a judge does not need (ids, severity, suggestions) are dropped, so
+    the same findings always render to the same, much shorter text.
+    """
+    return "\n".join(
+        json.dumps(
+            {key: finding[key] for key in _COMPACT_FIELDS if finding.get(key)},
+            ensure_ascii=False, separators=(",", ":"),
+        )
+        for finding in findings
+    )
+
+
+def parse_review_output(
+    completion: str,
+    severity_filter: str | None = None,
+    stats: ParseStats | None = None,
+) -> list[dict]:
+    """
+    Parse model output text into structured findings.
+    Strips markdown code fences before parsing.
+    Expects JSONL format (one JSON object per line).
+    Returns only type=finding records, optionally filtered by severity.
+    Silently skips malformed lines; pass a ParseStats to count them.
+    """
+    return list(iter_review_findings([completion], severity_filter, stats))
@@ -0,0 +1,229 @@
+"""
+Record/replay model provider for deterministic, network-free eval runs.
+
+Registered with Inspect as the "replay" provider, wrapping any other model:
+
+    inspect eval evals/reviewer_eval.py --model replay/anthropic/claude-sonnet-4-5
+
+Each generate() request is reduced to a SHA-256 key. The key covers the
+wrapped model name, the messages (without their random ids), the tools, the
+tool choice and every generation setting that can change the response
+(retries, timeouts and connection limits excluded). Every epoch of a sample
+sends the same request, so responses are stored per (key, epoch), with the
+epoch taken from the active sample (1 outside an eval). The mode comes from
+the "mode" model arg, else PARALLAX_REPLAY:
+
+- record: call the wrapped model and store its response under (key, epoch).
+- replay: answer from the store only; a missing entry raises ReplayMissError.
+- auto:   replay when the entry is stored, record otherwise.
+
+Responses are stored zlib-compressed in one SQLite file (PARALLAX_REPLAY_STORE
+or the "store" model arg, default .replay_store.sqlite at the repo root).
+Replay never constructs the wrapped provider, so it needs no API key or
+network. The store is opened on the first generate(), not when Inspect builds
+the model.
+
+Judges are resolved through replay_model_name(), so with PARALLAX_REPLAY set
+the scorers' get_model(judge) calls are recorded and replayed as well.
+Judging is T=0, generation settings are part of the key and each epoch gets
+its own recorded response, so a replayed run reproduces the recorded one
+exactly (epoch-to-epoch variance included), from the loader through regression.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import zlib
+from pathlib import Path
+from typing import Any
+
+from inspect_ai.model import (
+    ChatMessage, GenerateConfig, Model, ModelAPI, ModelOutput, get_model, modelapi,
+)
+from inspect_ai.log._samples import sample_active
+from inspect_ai.tool import ToolChoice, ToolInfo
+
+
+PROVIDER = "replay"
+MODES = ("record", "replay", "auto")
+DEFAULT_STORE_PATH = Path(__file__).parent.parent.parent / ".replay_store.sqlite"
+
+# Settings that change how a request is sent, not what comes back.
+_TRANSPORT_CONFIG = {
+    "max_retries", "timeout", "attempt_timeout", "stream_idle_timeout", "max_connections",
+    "adaptive_connections", "extra_headers", "cache", "cache_prompt", "batch", "fallback_models",
+}
+
+
+class ReplayMissError(LookupError):
+    """Replay mode met a request that was never recorded."""
+
+
+def replay_mode() -> str | None:
+    mode = os.environ.get("PARALLAX_REPLAY") or None
+    if mode is not None and mode not in MODES:
+        raise ValueError(f"PARALLAX_REPLAY must be one of {', '.join(MODES)}; got {mode!r}")
+    return mode
+
+
+def replay_model_name(name: str) -> str:
+    """name routed through the replay provider when PARALLAX_REPLAY is set."""
+    if replay_mode() is None or name.startswith(f"{PROVIDER}/") or name.startswith("mockllm/"):
+        return name
+    return f"{PROVIDER}/{name}"
+
+
+def request_key(
+    model: str,
+    input: list[ChatMessage],
+    tools: list[ToolInfo],
+    tool_choice: ToolChoice,
+    config: GenerateConfig,
+) -> str:
+    """SHA-256 over everything in a generate() request that can change the response."""
+    payload = {
+        "model": model,
+        "input": [message.model_dump(mode="json", exclude={"id"}) for message in input],
+        "tools": [tool.model_dump(mode="json") for tool in tools],
+        "tool_choice": tool_choice if isinstance(tool_choice, str) else tool_choice.name,
+        "config": config.model_dump(mode="json", exclude_none=True, exclude=_TRANSPORT_CONFIG),
+    }
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def current_epoch() -> int:
+    """Epoch of the sample being run (scorers included); 1 outside an eval."""
+    active = sample_active()
+    return active.epoch if active is not None else 1
+
+
+class ReplayStore:
+    """(Request key, epoch) → compressed ModelOutput JSON, in one SQLite file."""
+
+    def __init__(self, path: str | Path = DEFAULT_STORE_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Parallel shards may record into the same file; WAL lets them.
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        with self._conn:
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(responses)")}
+            if columns and "epoch" not in columns:
+                # Stores recorded before responses were kept per epoch: keep them as epoch 1.
+                self._conn.execute("ALTER TABLE responses RENAME TO responses_unversioned")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT NOT NULL, epoch INTEGER NOT NULL, model TEXT NOT NULL,"
+                " output BLOB NOT NULL, PRIMARY KEY (key, epoch))"
+            )
+            if columns and "epoch" not in columns:
+                self._conn.execute(
+                    "INSERT INTO responses (key, epoch, model, output)"
+                    " SELECT key, 1, model, output FROM responses_unversioned"
+                )
+                self._conn.execute("DROP TABLE responses_unversioned")
+
+    def get(self, key: str, epoch: int = 1) -> ModelOutput | None:
+        row = self._conn.execute(
+            "SELECT output FROM responses WHERE key = ? AND epoch = ?", (key, epoch)
+        ).fetchone()
+        if row is None:
+            return None
+        return ModelOutput.model_validate_json(zlib.decompress(row[0]))
+
+    def put(self, key: str, model: str, output: ModelOutput, epoch: int = 1) -> None:
+        blob = zlib.compress(output.model_dump_json(exclude_none=True).encode("utf-8"), 9)
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, epoch, model, output) VALUES (?, ?, ?, ?)",
+                (key, epoch, model, blob),
+            )
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+_stores: dict[Path, ReplayStore] = {}
+
+
+def open_replay_store(path: str | Path | None = None) -> ReplayStore:
+    """Process-wide store for path (PARALLAX_REPLAY_STORE, else the default)."""
+    path = Path(path or os.environ.get("PARALLAX_REPLAY_STORE") or DEFAULT_STORE_PATH).resolve()
+    if path not in _stores:
+        _stores[path] = ReplayStore(path)
+    return _stores[path]
+
+
+class ReplayModelAPI(ModelAPI):
+    """Serves generate() from a ReplayStore, recording through the wrapped model."""
+
+    def __init__(
+        self,
+        model_name: str,
+        base_url: str | None = None,
+        api_key: str | None = None,
+        config: GenerateConfig = GenerateConfig(),
+        mode: str | None = None,
+        store: str | None = None,
+        **model_args: Any,
+    ) -> None:
+        super().__init__(model_name, base_url, api_key, [], config)
+        self.mode = mode or replay_mode() or "replay"
+        if self.mode not in MODES:
+            raise ValueError(f"replay mode must be one of {', '.join(MODES)}; got {self.mode!r}")
+        self._store_path = store
+        self._store: ReplayStore | None = None
+        self._wrapped_args = {"base_url": base_url, "api_key": api_key, "config": config, **model_args}
+        self._wrapped: Model | None = None
+
+    @property
+    def store(self) -> ReplayStore:
+        # Opened on first use: Inspect builds models (with no model args) well before they generate.
+        if self._store is None:
+            self._store = open_replay_store(self._store_path)
+        return self._store
+
+    def wrapped(self) -> Model:
+        # Built on first record only, so replay never needs provider credentials.
+        if self._wrapped is None:
+            self._wrapped = get_model(self.model_name, **self._wrapped_args)
+        return self._wrapped
+
+    async def generate(
+        self,
+        input: list[ChatMessage],
+        tools: list[ToolInfo],
+        tool_choice: ToolChoice,
+        config: GenerateConfig,
+    ) -> ModelOutput:
+        key = request_key(self.model_name, input, tools, tool_choice, config)
+        epoch = current_epoch()
+        if self.mode != "record":
+            output = self.store.get(key, epoch)
+            if output is not None:
+                return output
+            if self.mode == "replay":
+                raise ReplayMissError(
+                    f"No recorded response for {self.model_name} request {key[:12]} (epoch {epoch}) "
+                    f"in {self.store.path}; record it with PARALLAX_REPLAY=record"
+                )
+        output = await self.wrapped().generate(input, tools, tool_choice, config)
+        if not output.error:
+            self.store.put(key, self.model_name, output, epoch)
+        return output
+
+    async def count_text_tokens(self, text: str) -> int:
+        # Same ~4 characters per token as judge_usage.estimate_tokens; no tokenizer download.
+        return (len(text) + 3) // 4
+
+    def max_connections(self) -> int:
+        return self.wrapped().api.max_connections() if self.mode == "record" else super().max_connections()
+
+
+@modelapi(name=PROVIDER)
+def replay() -> type[ModelAPI]:
+    return ReplayModelAPI
@@ -15,7 +15,13 @@ def drop_section(content: str, section_header: str) -> str:
     """
     Remove a markdown section (header + content until next same-level header).
     Used for ablation tests.
+
+    A bold-label header ("**Voice rules:**", as in agents/*.md) drops the
+    labelled block instead: up to the next bold label or markdown header.
     """
+    if section_header.startswith("**"):
+        pattern = rf"(?m)^{re.escape(section_header)}.*?(?=^\*\*|^#|\Z)"
+        return re.sub(pattern, "", content, flags=re.DOTALL).strip()
     # Determine heading level from header
     level = len(section_header) - len(section_header.lstrip("#"))
     # Anchor to end of header line (\n) to prevent matching prefix-named sections
@@ -6,7 +6,9 @@ Runs both judge prompt styles on labeled findings from the datasets:
 - context_dependent_findings.jsonl → expected label: NOT_GENUINE
 
 Reports accuracy, false positive rate, false negative rate, and token cost
-for each style. Outputs a side-by-side comparison table.
+for each style. Outputs a side-by-side comparison table. Judge telemetry
+(tokens, latency, cost) is recorded per style via scorers.judge_telemetry,
+so PARALLAX_TELEMETRY_JSONL / PARALLAX_TELEMETRY_PROM export it as well.
 
 Usage:
     .venv-evals/bin/python experiments/geval_comparison.py
@@ -19,6 +21,9 @@ from pathlib import Path
 
 from inspect_ai.model import get_model
 
+from scorers.judge_dispatch import DispatchStats, get_dispatcher
+from scorers.judge_telemetry import record_judge_telemetry
+from scorers.judge_usage import TokenUsage, UsageRecordingModel
 from scorers.reverse_judge_scorer import _reverse_judge_one, _geval_judge_one
 
 
@@ -57,6 +62,8 @@ class Summary:
     false_negatives: int = 0   # predicted NOT_GENUINE, expected GENUINE
     total_elapsed_s: float = 0.0
     errors: list = field(default_factory=list)
+    dispatch: dict = field(default_factory=dict)
+    telemetry: dict = field(default_factory=dict)
 
     @property
     def accuracy(self) -> float:
@@ -121,6 +128,9 @@ async def run_style(
     judge_fn = _geval_judge_one if style == "geval" else _reverse_judge_one
     summary = Summary(style=style)
     results = []
+    dispatch_stats = DispatchStats()
+    token_usage = TokenUsage()
+    judge_model = UsageRecordingModel(judge_model, token_usage)
 
     async def judge_one(lf: LabeledFinding) -> RunResult:
         t0 = time.monotonic()
@@ -135,8 +145,13 @@ async def run_style(
             elapsed_s=elapsed,
         )
 
-    tasks = [judge_one(lf) for lf in corpus]
-    run_results = await asyncio.gather(*tasks)
+    run_results = await get_dispatcher().gather(
+        JUDGE_MODEL, [lambda lf=lf: judge_one(lf) for lf in corpus], dispatch_stats
+    )
+    summary.dispatch = dispatch_stats.as_dict()
+    summary.telemetry = record_judge_telemetry(
+        f"geval_comparison/{style}", JUDGE_MODEL, token_usage, dispatch_stats
+    )
 
     actual_not_genuine = sum(1 for lf in corpus if not lf.expected_genuine)
 
@@ -189,6 +204,20 @@ def print_results(
     row("FP rate (FP/actual-NOT_GENUINE)", f"{d_fpr:.1%}", f"{g_fpr:.1%}")
     row("FN rate (FN/actual-GENUINE)", f"{d_fnr:.1%}", f"{g_fnr:.1%}")
     row("Avg latency/finding (s)", f"{direct_summary.avg_elapsed_s:.2f}s", f"{geval_summary.avg_elapsed_s:.2f}s")
+    row("p95 latency (s)",
+        f"{direct_summary.dispatch.get('latency_p95_s') or 0:.2f}s",
+        f"{geval_summary.dispatch.get('latency_p95_s') or 0:.2f}s")
+    row("Rate-limit retries", str(direct_summary.dispatch.get("retries", 0)),
+        str(geval_summary.dispatch.get("retries", 0)))
+    row("Input tokens (all)",
+        *(str(s.telemetry.get("input_tokens_uncached", 0) + s.telemetry.get("input_tokens_cache_read", 0)
+              + s.telemetry.get("input_tokens_cache_write", 0))
+          for s in (direct_summary, geval_summary)))
+    row("Output tokens", *(str(s.telemetry.get("output_tokens", 0)) for s in (direct_summary, geval_summary)))
+    row("Est. cost (USD)", *(
+        f"${s.telemetry['cost_usd']:.4f}" if s.telemetry.get("cost_usd") is not None else "n/a"
+        for s in (direct_summary, geval_summary)
+    ))
 
     print("=" * 70)
 
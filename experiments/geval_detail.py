@@ -5,13 +5,18 @@ import asyncio
 import json
 from pathlib import Path
 from inspect_ai.model import get_model
+from scorers.judge_dispatch import DispatchStats, get_dispatcher
+from scorers.judge_telemetry import record_judge_telemetry
+from scorers.judge_usage import TokenUsage, UsageRecordingModel
 from scorers.reverse_judge_scorer import _geval_judge_one
 
 JUDGE_MODEL = "anthropic/claude-haiku-4-5-20251001"
 DISAGREEMENTS = ["scope-guardian-004", "assumption-hunter-001", "success-validator-001", "assumption-hunter-013"]
 
 async def main():
-    judge = get_model(JUDGE_MODEL)
+    token_usage = TokenUsage()
+    dispatch_stats = DispatchStats()
+    judge = UsageRecordingModel(get_model(JUDGE_MODEL), token_usage)
     for ds_path in ["datasets/inspect-ai-integration-requirements-v2", "datasets/inspect-ai-integration-requirements-light"]:
         ds = Path(ds_path)
         doc = next(ds.glob("*.md"), None)
@@ -32,8 +37,15 @@ async def main():
             print(f"Title: {f['title']}")
             print(f"Issue: {f.get('issue', '')[:200]}")
             print(f"{'='*70}")
-            is_genuine, reasoning = await _geval_judge_one(judge, f, doc_content)
+            is_genuine, reasoning = await get_dispatcher().call(
+                JUDGE_MODEL, lambda: _geval_judge_one(judge, f, doc_content), dispatch_stats
+            )
             print(f"G-Eval verdict: {'GENUINE' if is_genuine else 'NOT_GENUINE'}")
             print(f"\nReasoning:\n{reasoning}")
 
+    telemetry = record_judge_telemetry("geval_detail", JUDGE_MODEL, token_usage, dispatch_stats)
+    cost = telemetry["cost_usd"]
+    print(f"\nJudge calls: {telemetry['calls']}, p50 latency {telemetry['latency_p50_s'] or 0:.2f}s, "
+          f"cost ${cost if cost is not None else 0:.4f}")
+
 asyncio.run(main())
@@ -0,0 +1,215 @@
+"""
+Multi-epoch aggregation for the reviewer scorers.
+
+Reviewer output is sampled, so one run per document says little about a
+change. With Task(epochs=Epochs(N, reviewer_epochs())), Inspect runs every
+sample N times (concurrently, sharing the judge cache) and reviewer_epochs
+reduces the N scores of a sample to one:
+
+- value: mean over epochs; metadata["epoch_values"] keeps the per-epoch values.
+- must_find_recall: per must-find hit rate across epochs, checked against each
+  finding's min_recall once there are at least MIN_RECALL_EPOCHS epochs.
+
+The bootstrap_ci metric turns those per-epoch values into a confidence
+interval for the task-level mean (resampling documents, then epochs within
+each document), and min_recall_met reports the share of samples whose
+must-find list met every min_recall.
+"""
+import math
+import random
+import statistics
+
+from inspect_ai.scorer import SampleScore, Score, ScoreReducer, metric, score_reducer
+
+# min_recall is a rate; with fewer epochs a single miss decides it, so it is
+# reported but not enforced (N=1 only gives binary found/not-found).
+MIN_RECALL_EPOCHS = 3
+DEFAULT_RESAMPLES = 2000
+
+
+def _as_float(value) -> float | None:
+    if isinstance(value, bool):
+        return float(value)
+    if isinstance(value, int | float) and not math.isnan(value):
+        return float(value)
+    return None
+
+
+def _percentile_interval(estimates: list[float], level: float) -> tuple[float, float]:
+    estimates = sorted(estimates)
+    tail = (1 - level) / 2
+    lo = estimates[max(0, math.floor(tail * len(estimates)))]
+    hi = estimates[min(len(estimates) - 1, math.ceil((1 - tail) * len(estimates)) - 1)]
+    return lo, hi
+
+
+def bootstrap_mean_ci(
+    groups: list[list[float]],
+    level: float = 0.95,
+    resamples: int = DEFAULT_RESAMPLES,
+    seed: int = 0,
+) -> tuple[float, float] | None:
+    """Percentile bootstrap interval for the mean of per-group means.
+
+    groups holds the epoch values of each sample. Each resample draws samples
+    with replacement, then epochs with replacement within each drawn sample,
+    so both document-to-document and run-to-run variance widen the interval.
+    Returns None when there are no values.
+    """
+    groups = [g for g in groups if g]
+    if not groups:
+        return None
+    distinct = {v for g in groups for v in g}
+    if len(distinct) == 1:
+        value = distinct.pop()
+        return value, value
+    rng = random.Random(seed)
+    estimates = []
+    for _ in range(resamples):
+        drawn = rng.choices(groups, k=len(groups))
+        estimates.append(statistics.fmean(
+            statistics.fmean(rng.choices(g, k=len(g))) for g in drawn
+        ))
+    return _percentile_interval(estimates, level)
+
+
+def paired_permutation_test(
+    pairs: list[tuple[list[float], list[float]]],
+    resamples: int = DEFAULT_RESAMPLES,
+    seed: int = 0,
+) -> tuple[float, float] | None:
+    """Two-sided permutation test for a change in the mean of per-sample means.
+
+    pairs holds (baseline epoch values, current epoch values) for each sample
+    present in both runs. Labels are shuffled within each sample only, so
+    samples are paired and document difficulty cancels out; with one epoch
+    per side this reduces to the sign-flip test on per-sample differences.
+    Returns (observed difference, p-value), or None when there are no pairs.
+    """
+    pairs = [(list(a), list(b)) for a, b in pairs if a and b]
+    if not pairs:
+        return None
+
+    def statistic(split: list[tuple[list[float], list[float]]]) -> float:
+        return statistics.fmean(statistics.fmean(b) - statistics.fmean(a) for a, b in split)
+
+    observed = statistic(pairs)
+    rng = random.Random(seed)
+    extreme = 0
+    for _ in range(resamples):
+        shuffled = []
+        for a, b in pairs:
+            pooled = a + b
+            rng.shuffle(pooled)
+            shuffled.append((pooled[:len(a)], pooled[len(a):]))
+        # Small tolerance so exact ties with the observed split count as extreme.
+        extreme += abs(statistic(shuffled)) >= abs(observed) - 1e-12
+    return observed, (extreme + 1) / (resamples + 1)
+
+
+def _must_find_rates(scores: list[Score]) -> tuple[list[dict], bool | None]:
+    """Per must-find hit rates across epochs, and whether all met min_recall."""
+    rates: dict[str, dict] = {}
+    for score in scores:
+        for result in (score.metadata or {}).get("find_results", []):
+            if result.get("skipped"):  # threshold mode stopped before judging it
+                continue
+            key = result.get("must_find_id") or result.get("must_find_title")
+            entry = rates.setdefault(key, {
+                "must_find_id": result.get("must_find_id"),
+                "must_find_title": result.get("must_find_title"),
+                "min_recall": result.get("min_recall"),
+                "found": 0,
+                "epochs": 0,
+            })
+            entry["found"] += bool(result.get("found"))
+            entry["epochs"] += 1
+
+    enforce = len(scores) >= MIN_RECALL_EPOCHS
+    for entry in rates.values():
+        entry["hit_rate"] = entry["found"] / entry["epochs"]
+        min_recall = entry["min_recall"]
+        entry["meets_min_recall"] = (
+            entry["hit_rate"] >= min_recall if enforce and min_recall is not None else None
+        )
+    verdicts = [e["meets_min_recall"] for e in rates.values() if e["meets_min_recall"] is not None]
+    return list(rates.values()), (all(verdicts) if verdicts else None)
+
+
+@score_reducer(name="reviewer_epochs")
+def reviewer_epochs(level: float = 0.95) -> ScoreReducer:
+    """Mean over epochs, keeping per-epoch values and must-find hit rates."""
+
+    def reduce(scores: list[Score]) -> Score:
+        values = [v for v in (_as_float(s.value) for s in scores) if v is not None]
+        if not values:
+            return Score(value=math.nan, explanation="No scored epochs.")
+        mean_value = statistics.fmean(values)
+        ci = bootstrap_mean_ci([values], level=level)
+        # Like Inspect's built-in reducers, keep the first epoch's metadata for
+        # per-finding detail; the headline rate fields become epoch means.
+        first = scores[0].metadata or {}
+        metadata = {
+            **first,
+            **{key: mean_value for key in ("precision", "recall") if key in first},
+            "epochs": len(scores),
+            "epoch_values": values,
+            "epoch_stdev": statistics.stdev(values) if len(values) > 1 else 0.0,
+            "ci_lower": ci[0],
+            "ci_upper": ci[1],
+        }
+        explanation = f"Mean {mean_value:.2f} over {len(values)} epochs (95% CI {ci[0]:.2f}–{ci[1]:.2f})."
+
+        if any("find_results" in (s.metadata or {}) for s in scores):
+            rates, met = _must_find_rates(scores)
+            metadata["must_find_rates"] = rates
+            metadata["min_recall_met"] = met
+            below = [r["must_find_title"] for r in rates if r["meets_min_recall"] is False]
+            if below:
+                explanation += f" Below min_recall: {'; '.join(below)}."
+
+        return Score(value=mean_value, explanation=explanation, metadata=metadata)
+
+    return reduce
+
+
+@metric
+def bootstrap_ci(level: float = 0.95, resamples: int = DEFAULT_RESAMPLES, seed: int = 0):
+    """Bootstrap confidence interval for the mean score (ci_lower / ci_upper)."""
+
+    def compute(scores: list[SampleScore]) -> dict:
+        groups = []
+        for sample_score in scores:
+            epoch_values = (sample_score.score.metadata or {}).get("epoch_values")
+            if epoch_values is None:
+                value = _as_float(sample_score.score.value)
+                epoch_values = [value] if value is not None else []
+            groups.append(epoch_values)
+        ci = bootstrap_mean_ci(groups, level=level, resamples=resamples, seed=seed)
+        if ci is None:
+            return {}
+        return {"ci_lower": ci[0], "ci_upper": ci[1]}
+
+    return compute
+
+
+@metric
+def min_recall_met():
+    """Share of samples whose must-find hit rates all met min_recall.
+
+    Only samples reduced over at least MIN_RECALL_EPOCHS epochs carry a
+    verdict; with none, the metric is omitted.
+    """
+
+    def compute(scores: list[SampleScore]) -> dict:
+        verdicts = [
+            verdict for verdict in (
+                (s.score.metadata or {}).get("min_recall_met") for s in scores
+            )
+            if verdict is not None
+        ]
+        if not verdicts:
+            return {}
+        return {"min_recall_met": sum(verdicts) / len(verdicts)}
+
+    return compute
@@ -0,0 +1,161 @@
+"""
+Content-addressed on-disk cache for judge verdicts.
+
+Judge calls run at T=0, so the same (judge model, prompt template, finding,
+document) tuple always yields the same verdict. Re-running an eval after
+changing one reviewer prompt re-sends every unchanged tuple to the judge; this
+cache lets those calls be answered from disk instead.
+
+Keys are SHA-256 digests over every input that can change the verdict —
+model name, system prompt, prompt template, the finding's title/issue/severity
+and a hash of the document. Editing _JUDGE_SYSTEM or a template therefore
+invalidates old entries automatically; nothing needs to be flushed by hand.
+
+Entries are small JSON files sharded by key prefix. Eviction is by age
+(expired entries are treated as misses) and by total size (oldest entries are
+pruned first when the cache is opened).
+"""
+import hashlib
+import json
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Awaitable, Callable
+
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / ".judge_cache"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_AGE_S = 30 * 24 * 3600
+
+
+def content_hash(text: str) -> str:
+    """SHA-256 hex digest of text.
+
+    For frozen dataset snapshots this equals the design_doc_hash stored in
+    metadata.json, but it is computed from the content actually passed to the
+    judge so a stale metadata hash can never serve a wrong verdict.
+    """
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def judge_cache_key(**parts: str | None) -> str:
+    """Build a cache key from named prompt inputs (order-independent)."""
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """Per-score hit/miss counters, surfaced in Score metadata."""
+    enabled: bool = False
+    hits: int = 0
+    misses: int = 0
+
+    def as_dict(self) -> dict:
+        return {"enabled": self.enabled, "hits": self.hits, "misses": self.misses}
+
+
+class JudgeCache:
+    """Persistent verdict store keyed by judge_cache_key() digests."""
+
+    def __init__(
+        self,
+        path: str | Path = DEFAULT_CACHE_DIR,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_age_s: float = DEFAULT_MAX_AGE_S,
+    ):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.max_age_s = max_age_s
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.prune()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.path / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> dict | None:
+        """Return the cached entry, or None on miss / expiry / corruption."""
+        entry_path = self._entry_path(key)
+        try:
+            stat = entry_path.stat()
+        except FileNotFoundError:
+            return None
+        if time.time() - stat.st_mtime > self.max_age_s:
+            entry_path.unlink(missing_ok=True)
+            return None
+        try:
+            return json.loads(entry_path.read_text())
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def put(self, key: str, value: dict) -> None:
+        """Store an entry atomically (concurrent writers never see partial files)."""
+        entry_path = self._entry_path(key)
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=entry_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(value, f)
+            os.replace(tmp, entry_path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def prune(self) -> int:
+        """Drop expired entries, then oldest entries until under max_bytes.
+
+        Returns:
+            Number of entries removed.
+        """
+        now = time.time()
+        entries = []
+        removed = 0
+        for entry_path in self.path.glob("*/*.json"):
+            try:
+                stat = entry_path.stat()
+            except FileNotFoundError:
+                continue
+            if now - stat.st_mtime > self.max_age_s:
+                entry_path.unlink(missing_ok=True)
+                removed += 1
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry_path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry_path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            entry_path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        return removed
+
+
+def open_judge_cache(enabled: bool, cache_dir: str | None = None) -> JudgeCache | None:
+    """Scorer helper: return a JudgeCache when enabled, else None."""
+    if not enabled:
+        return None
+    return JudgeCache(cache_dir if cache_dir is not None else DEFAULT_CACHE_DIR)
+
+
+async def cached_verdict(
+    cache: JudgeCache | None,
+    key: str,
+    judge_call: Callable[[], Awaitable[tuple[bool, str]]],
+    stats: CacheStats,
+) -> tuple[bool, str]:
+    """Return a (verdict, reasoning) pair from cache, or run judge_call and store it."""
+    if cache is not None:
+        entry = cache.get(key)
+        if entry is not None:
+            stats.hits += 1
+            return entry["verdict"], entry["reasoning"]
+        stats.misses += 1
+
+    verdict, reasoning = await judge_call()
+
+    if cache is not None:
+        cache.put(key, {"verdict": verdict, "reasoning": reasoning})
+    return verdict, reasoning
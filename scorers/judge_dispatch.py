@@ -0,0 +1,209 @@
+"""
+Shared judge call dispatcher: bounded concurrency, per-model rate limiting,
+jittered retry on rate-limit errors and per-call latency stats.
+
+The scorers judge every finding in parallel. With 20+ findings per sample
+across five reviewer tasks an unbounded asyncio.gather fires hundreds of
+requests at once and the provider answers with 429s, which then retry in
+lock-step. All judge calls therefore go through one process-wide dispatcher:
+
+- a semaphore caps in-flight calls (PARALLAX_JUDGE_CONCURRENCY, default 8)
+- a token bucket per model spaces requests (PARALLAX_JUDGE_RPM, default off)
+- rate-limit errors are retried with full-jitter exponential backoff so
+  concurrent callers spread out instead of retrying together
+- every call's latency is recorded, globally and per caller-supplied stats
+"""
+import asyncio
+import math
+import os
+import random
+import time
+import weakref
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, TypeVar
+
+
+T = TypeVar("T")
+
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_MAX_RETRIES = 4
+
+
+def _percentile(values: list[float], pct: float) -> float | None:
+    """Nearest-rank percentile; None for an empty list."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+@dataclass
+class DispatchStats:
+    """Latency and retry counters for a set of judge calls."""
+    latencies_s: list[float] = field(default_factory=list)
+    retries: int = 0
+    rate_limited: int = 0
+
+    def record(self, latency_s: float) -> None:
+        self.latencies_s.append(latency_s)
+
+    def as_dict(self) -> dict:
+        lat = self.latencies_s
+        return {
+            "calls": len(lat),
+            "retries": self.retries,
+            "rate_limited": self.rate_limited,
+            "latency_p50_s": _percentile(lat, 50),
+            "latency_p95_s": _percentile(lat, 95),
+            "latency_max_s": max(lat) if lat else None,
+        }
+
+
+class TokenBucket:
+    """Token bucket limiter: `rate` requests/second with bursts up to `capacity`.
+
+    Callers reserve a token immediately and sleep off any deficit, so waiters
+    are released in arrival order without a lock (asyncio is single-threaded).
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def reserve(self) -> float:
+        """Take one token; return seconds the caller must wait before using it."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    async def acquire(self) -> None:
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """Best-effort detection of provider rate-limit / overload errors."""
+    status = getattr(exc, "status_code", None) or getattr(exc, "status", None)
+    if status in (429, 529):
+        return True
+    name = type(exc).__name__.lower()
+    if "ratelimit" in name or "overloaded" in name:
+        return True
+    text = str(exc).lower()
+    return "rate limit" in text or "rate_limit" in text or "429" in text
+
+
+class JudgeDispatcher:
+    """Runs judge calls under a shared concurrency ceiling and per-model rate limits."""
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        requests_per_minute: float | None = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        base_delay_s: float = 1.0,
+        max_delay_s: float = 30.0,
+    ):
+        self.max_concurrency = max_concurrency
+        self.requests_per_minute = requests_per_minute
+        self.max_retries = max_retries
+        self.base_delay_s = base_delay_s
+        self.max_delay_s = max_delay_s
+        self._buckets: dict[str, TokenBucket] = {}
+        self._stats: dict[str, DispatchStats] = {}
+        # asyncio.Semaphore binds to the loop it is first used on; scorers run
+        # under different loops (Inspect vs asyncio.run in tests), so keep one per loop.
+        self._semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        sem = self._semaphores.get(loop)
+        if sem is None:
+            sem = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores[loop] = sem
+        return sem
+
+    def _bucket(self, model: str) -> TokenBucket | None:
+        if not self.requests_per_minute:
+            return None
+        if model not in self._buckets:
+            self._buckets[model] = TokenBucket(self.requests_per_minute / 60.0)
+        return self._buckets[model]
+
+    def _backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_delay_s, self.base_delay_s * 2 ** attempt))
+
+    def stats(self, model: str) -> DispatchStats:
+        """Process-lifetime stats for one model."""
+        return self._stats.setdefault(model, DispatchStats())
+
+    async def call(
+        self,
+        model: str,
+        fn: Callable[[], Awaitable[T]],
+        stats: DispatchStats | None = None,
+    ) -> T:
+        """Run one judge call. `fn` is a zero-arg factory so retries get a fresh coroutine."""
+        model_stats = self.stats(model)
+        bucket = self._bucket(model)
+        attempt = 0
+        while True:
+            async with self._semaphore():
+                if bucket is not None:
+                    await bucket.acquire()
+                t0 = time.monotonic()
+                try:
+                    result = await fn()
+                except Exception as exc:
+                    if not is_rate_limit_error(exc) or attempt >= self.max_retries:
+                        raise
+                    for s in (model_stats, stats):
+                        if s is not None:
+                            s.rate_limited += 1
+                            s.retries += 1
+                else:
+                    latency = time.monotonic() - t0
+                    for s in (model_stats, stats):
+                        if s is not None:
+                            s.record(latency)
+                    return result
+            # Back off outside the semaphore so other calls can proceed.
+            await asyncio.sleep(self._backoff(attempt))
+            attempt += 1
+
+    async def gather(
+        self,
+        model: str,
+        fns: list[Callable[[], Awaitable[T]]],
+        stats: DispatchStats | None = None,
+    ) -> list[T]:
+        """Dispatcher-bounded replacement for asyncio.gather over judge calls."""
+        return await asyncio.gather(*(self.call(model, fn, stats) for fn in fns))
+
+
+_dispatcher: JudgeDispatcher | None = None
+
+
+def configure_dispatcher(**kwargs) -> JudgeDispatcher:
+    """Replace the shared dispatcher (e.g. from an experiment's CLI flags)."""
+    global _dispatcher
+    _dispatcher = JudgeDispatcher(**kwargs)
+    return _dispatcher
+
+
+def get_dispatcher() -> JudgeDispatcher:
+    """Shared dispatcher, configured from the environment on first use."""
+    global _dispatcher
+    if _dispatcher is None:
+        rpm = os.environ.get("PARALLAX_JUDGE_RPM")
+        _dispatcher = JudgeDispatcher(
+            max_concurrency=int(os.environ.get("PARALLAX_JUDGE_CONCURRENCY", DEFAULT_MAX_CONCURRENCY)),
+            requests_per_minute=float(rpm) if rpm else None,
+        )
+    return _dispatcher
@@ -0,0 +1,215 @@
+"""
+Judge cost and latency telemetry, uniform across scorers and experiments.
+
+Every judge call already goes through UsageRecordingModel (token usage) and
+the JudgeDispatcher (latency, retries). record_judge_telemetry() turns one
+scorer invocation's TokenUsage + DispatchStats into a single dict, which is
+stored in Score metadata as "judge_telemetry". It includes:
+
+- calls, cache-read / cache-write / uncached input tokens, output tokens
+- latency p50 / p95 / max and rate-limit retries
+- estimated cost in USD, from MODEL_PRICES (None for unpriced models)
+
+It also adds the record to a process-wide registry aggregated per scorer and
+judge model. Exports are driven by the environment, so no scorer signature
+changes:
+
+    PARALLAX_TELEMETRY_JSONL=logs/judge_telemetry.jsonl   # one line per scorer call
+    PARALLAX_TELEMETRY_PROM=/var/lib/node_exporter/       # Prometheus textfile
+
+A PROM path that is a directory gets parallax_judge_<pid>.prom, so parallel
+shards (tools/run_suite.py) each write their own file for the textfile
+collector. The file is rewritten atomically after every record.
+
+PARALLAX_JUDGE_PRICES may point to a JSON file of
+{model: {input, output, cache_read, cache_write}} in USD per million tokens,
+which extends or overrides MODEL_PRICES.
+"""
+import json
+import os
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from scorers.judge_dispatch import DispatchStats, _percentile
+from scorers.judge_usage import TokenUsage
+
+
+# USD per million tokens. Cache writes are billed at 1.25× input and cache
+# reads at 0.1× input (Anthropic 5-minute prompt cache).
+MODEL_PRICES: dict[str, dict[str, float]] = {
+    "anthropic/claude-haiku-4-5-20251001": {"input": 1.0, "output": 5.0, "cache_read": 0.1, "cache_write": 1.25},
+    "anthropic/claude-haiku-4-5": {"input": 1.0, "output": 5.0, "cache_read": 0.1, "cache_write": 1.25},
+    "anthropic/claude-sonnet-4-5": {"input": 3.0, "output": 15.0, "cache_read": 0.3, "cache_write": 3.75},
+}
+
+
+def model_prices() -> dict[str, dict[str, float]]:
+    prices = dict(MODEL_PRICES)
+    path = os.environ.get("PARALLAX_JUDGE_PRICES")
+    if path:
+        prices.update(json.loads(Path(path).read_text()))
+    return prices
+
+
+def estimate_cost_usd(judge: str, usage: TokenUsage) -> float | None:
+    price = model_prices().get(judge)
+    if price is None:
+        return None
+    return (
+        usage.input_tokens * price["input"]
+        + usage.input_tokens_cache_read * price.get("cache_read", price["input"])
+        + usage.input_tokens_cache_write * price.get("cache_write", price["input"])
+        + usage.output_tokens * price["output"]
+    ) / 1e6
+
+
+@dataclass
+class ScorerTelemetry:
+    """Running totals for one (scorer, judge) pair in this process."""
+    scores: int = 0
+    calls: int = 0
+    input_tokens: int = 0
+    input_tokens_cache_read: int = 0
+    input_tokens_cache_write: int = 0
+    output_tokens: int = 0
+    retries: int = 0
+    cost_usd: float = 0.0
+    latencies_s: list[float] = field(default_factory=list)
+
+    def add(self, usage: TokenUsage, dispatch: DispatchStats, cost: float | None) -> None:
+        self.scores += 1
+        self.calls += usage.calls
+        self.input_tokens += usage.input_tokens
+        self.input_tokens_cache_read += usage.input_tokens_cache_read
+        self.input_tokens_cache_write += usage.input_tokens_cache_write
+        self.output_tokens += usage.output_tokens
+        self.retries += dispatch.retries
+        self.cost_usd += cost or 0.0
+        self.latencies_s.extend(dispatch.latencies_s)
+
+
+_registry: dict[tuple[str, str], ScorerTelemetry] = {}
+
+
+def telemetry_registry() -> dict[tuple[str, str], ScorerTelemetry]:
+    """Process-lifetime totals keyed by (scorer, judge)."""
+    return _registry
+
+
+def reset_telemetry() -> None:
+    _registry.clear()
+
+
+def record_judge_telemetry(
+    scorer: str,
+    judge: str,
+    usage: TokenUsage,
+    dispatch: DispatchStats,
+    sample_id: str | int | None = None,
+) -> dict:
+    """Summarise one scorer call, add it to the registry and export it."""
+    cost = estimate_cost_usd(judge, usage)
+    latencies = dispatch.latencies_s
+    record = {
+        "scorer": scorer,
+        "judge": judge,
+        "calls": usage.calls,
+        "input_tokens_uncached": usage.input_tokens,
+        "input_tokens_cache_read": usage.input_tokens_cache_read,
+        "input_tokens_cache_write": usage.input_tokens_cache_write,
+        "output_tokens": usage.output_tokens,
+        "retries": dispatch.retries,
+        "latency_p50_s": _percentile(latencies, 50),
+        "latency_p95_s": _percentile(latencies, 95),
+        "latency_max_s": max(latencies) if latencies else None,
+        "cost_usd": cost,
+    }
+    _registry.setdefault((scorer, judge), ScorerTelemetry()).add(usage, dispatch, cost)
+
+    jsonl_path = os.environ.get("PARALLAX_TELEMETRY_JSONL")
+    if jsonl_path:
+        append_jsonl(Path(jsonl_path), {"ts": time.time(), "sample_id": sample_id, **record})
+    prom_path = os.environ.get("PARALLAX_TELEMETRY_PROM")
+    if prom_path:
+        write_prometheus_textfile(Path(prom_path))
+    return record
+
+
+def append_jsonl(path: Path, record: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # One write() per line on an O_APPEND descriptor keeps concurrent writers' lines whole.
+    with open(path, "a") as f:
+        f.write(json.dumps(record, default=str) + "\n")
+
+
+def _labels(**labels: str) -> str:
+    def escape(value: str) -> str:
+        return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    return "{" + ",".join(f'{k}="{escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def prometheus_text(registry: dict[tuple[str, str], ScorerTelemetry] | None = None) -> str:
+    """Registry totals in the Prometheus text exposition format."""
+    registry = _registry if registry is None else registry
+    lines = []
+
+    def family(name: str, kind: str, help_text: str, samples: list[tuple[str, float]]) -> None:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        lines.extend(f"{name}{labels} {value:g}" for labels, value in samples)
+
+    items = sorted(registry.items())
+    family("parallax_judge_scores_total", "counter", "Scorer invocations that used a judge.",
+           [(_labels(scorer=s, judge=j), t.scores) for (s, j), t in items])
+    family("parallax_judge_calls_total", "counter", "Judge model calls.",
+           [(_labels(scorer=s, judge=j), t.calls) for (s, j), t in items])
+    family("parallax_judge_input_tokens_total", "counter", "Judge input tokens by cache status.",
+           [
+               (_labels(scorer=s, judge=j, kind=kind), value)
+               for (s, j), t in items
+               for kind, value in (
+                   ("uncached", t.input_tokens),
+                   ("cache_read", t.input_tokens_cache_read),
+                   ("cache_write", t.input_tokens_cache_write),
+               )
+           ])
+    family("parallax_judge_output_tokens_total", "counter", "Judge output tokens.",
+           [(_labels(scorer=s, judge=j), t.output_tokens) for (s, j), t in items])
+    family("parallax_judge_retries_total", "counter", "Rate-limit retries of judge calls.",
+           [(_labels(scorer=s, judge=j), t.retries) for (s, j), t in items])
+    family("parallax_judge_cost_usd_total", "counter", "Estimated judge cost in USD.",
+           [(_labels(scorer=s, judge=j), t.cost_usd) for (s, j), t in items])
+
+    latency = []
+    for (s, j), t in items:
+        for quantile in (0.5, 0.95):
+            value = _percentile(t.latencies_s, quantile * 100)
+            if value is not None:
+                latency.append((_labels(scorer=s, judge=j, quantile=str(quantile)), value))
+    lines.append("# HELP parallax_judge_latency_seconds Judge call latency.")
+    lines.append("# TYPE parallax_judge_latency_seconds summary")
+    lines.extend(f"parallax_judge_latency_seconds{labels} {value:g}" for labels, value in latency)
+    for (s, j), t in items:
+        labels = _labels(scorer=s, judge=j)
+        lines.append(f"parallax_judge_latency_seconds_sum{labels} {sum(t.latencies_s):g}")
+        lines.append(f"parallax_judge_latency_seconds_count{labels} {len(t.latencies_s)}")
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus_textfile(path: Path) -> Path:
+    """Atomically (re)write the registry as a .prom textfile; returns the file written."""
+    if path.is_dir() or str(path).endswith(os.sep):
+        path = path / f"parallax_judge_{os.getpid()}.prom"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(prometheus_text())
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    return path
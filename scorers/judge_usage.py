@@ -0,0 +1,74 @@
+"""
+Token usage accounting for judge calls.
+
+The judge prompts put the document (reverse judge) or the reviewer output
+(must-find judge) in the system message — a prefix that is byte-identical
+across every finding of a sample — and request provider-side prompt caching
+for it. UsageRecordingModel wraps the judge model and sums the usage Inspect
+reports per call, so Score metadata shows how many input tokens were served
+from the provider cache versus billed at the full rate.
+"""
+from dataclasses import dataclass
+
+from inspect_ai.model import ModelUsage
+
+
+@dataclass
+class TokenUsage:
+    """Summed judge token usage for one score call."""
+    calls: int = 0
+    input_tokens: int = 0
+    input_tokens_cache_read: int = 0
+    input_tokens_cache_write: int = 0
+    output_tokens: int = 0
+
+    def add(self, usage: ModelUsage | None) -> None:
+        # Providers (and test doubles) that report no usage are counted as calls only.
+        self.calls += 1
+        if not isinstance(usage, ModelUsage):
+            return
+        self.input_tokens += usage.input_tokens
+        self.input_tokens_cache_read += usage.input_tokens_cache_read or 0
+        self.input_tokens_cache_write += usage.input_tokens_cache_write or 0
+        self.output_tokens += usage.output_tokens
+
+    def as_dict(self) -> dict:
+        total_input = (
+            self.input_tokens + self.input_tokens_cache_read + self.input_tokens_cache_write
+        )
+        return {
+            "calls": self.calls,
+            "input_tokens_uncached": self.input_tokens,
+            "input_tokens_cache_read": self.input_tokens_cache_read,
+            "input_tokens_cache_write": self.input_tokens_cache_write,
+            "output_tokens": self.output_tokens,
+            "cached_input_fraction": (
+                self.input_tokens_cache_read / total_input if total_input else None
+            ),
+        }
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough prompt size in tokens (~4 characters per token).
+
+    Used to compare prompt renderings before any call is made; billed
+    counts come from TokenUsage. No local tokenizer matches the judge model,
+    so a character estimate is as good as any and needs no downloads.
+    """
+    return (len(text) + 3) // 4
+
+
+class UsageRecordingModel:
+    """Judge model wrapper that records each generate() call's usage."""
+
+    def __init__(self, model, usage: TokenUsage):
+        self._model = model
+        self._usage = usage
+
+    async def generate(self, *args, **kwargs):
+        output = await self._model.generate(*args, **kwargs)
+        self._usage.add(getattr(output, "usage", None))
+        return output
+
+    def __getattr__(self, name):
+        return getattr(self._model, name)
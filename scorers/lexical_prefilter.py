@@ -0,0 +1,146 @@
+"""
+Local lexical pre-pass for must-find judging.
+
+Before asking the judge "did the reviewer identify this flaw?", each
+must-find's title + issue is ranked against the parsed reviewer findings
+with BM25. No embeddings or network are involved. The best-ranked finding's
+coverage of the query (the IDF-weighted share of query terms it contains)
+then routes the check:
+
+- coverage >= HIGH_COVERAGE: "narrowed" — the judge sees only that finding
+  instead of the whole completion.
+- coverage < LOW_COVERAGE: "non_match" — flagged as a probable miss.
+- otherwise, or when the completion has no parseable findings: "full".
+
+The pre-pass never decides a verdict on its own. The scorer chooses what a
+narrowed NO or a non_match means (see must_find_recall(prefilter=...)).
+"""
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+
+from evals.utils.output_parser import render_findings_compact
+
+
+HIGH_COVERAGE = 0.5
+LOW_COVERAGE = 0.1
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset("""
+a an and are as at be been but by can do does for from has have how if in into is it its
+no not of on or should so such that the their them there these this to was were what when
+which while who will with without would
+""".split())
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase word tokens without stopwords, crudely stemmed.
+
+    Strips one of -ing/-ed/-es/-s and then a trailing e, so cache, caches,
+    cached and caching all become "cach".
+    """
+    tokens = []
+    for token in _TOKEN_RE.findall(text.lower()):
+        if token in _STOPWORDS or len(token) < 2:
+            continue
+        for suffix in ("ing", "ed", "es", "s"):
+            if len(token) > len(suffix) + 3 and token.endswith(suffix):
+                token = token[: -len(suffix)]
+                break
+        if len(token) > 4 and token.endswith("e"):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+def finding_text(finding: dict) -> str:
+    return " ".join(str(finding.get(k) or "") for k in ("title", "issue", "section"))
+
+
+class BM25Index:
+    """Okapi BM25 over a small list of token lists."""
+
+    def __init__(self, documents: list[list[str]], k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.documents = [Counter(doc) for doc in documents]
+        self.lengths = [len(doc) for doc in documents]
+        self.avg_length = (sum(self.lengths) / len(self.lengths)) if documents else 0.0
+        df = Counter(term for doc in self.documents for term in doc)
+        n = len(documents)
+        self._n = n
+        self._idf = {term: math.log(1 + (n - f + 0.5) / (f + 0.5)) for term, f in df.items()}
+
+    def idf(self, term: str) -> float:
+        # Unseen terms weigh like a term in one finding: the must-find's own
+        # phrasing ("defined", "section") should not outweigh the shared terms.
+        return self._idf.get(term, math.log(1 + (self._n - 0.5) / 1.5))
+
+    def scores(self, query: list[str]) -> list[float]:
+        terms = set(query)
+        result = []
+        for doc, length in zip(self.documents, self.lengths):
+            norm = self.k1 * (1 - self.b + self.b * length / (self.avg_length or 1))
+            result.append(sum(
+                self.idf(t) * doc[t] * (self.k1 + 1) / (doc[t] + norm)
+                for t in terms if t in doc
+            ))
+        return result
+
+    def coverage(self, query: list[str], index: int) -> float:
+        """IDF-weighted share of query terms present in document index."""
+        terms = set(query)
+        total = sum(self.idf(t) for t in terms)
+        if not total:
+            return 0.0
+        return sum(self.idf(t) for t in terms if t in self.documents[index]) / total
+
+
+@dataclass
+class PrefilterResult:
+    route: str                      # "narrowed" | "non_match" | "full"
+    coverage: float | None = None
+    best_index: int | None = None
+    best_id: str | None = None
+
+    def as_dict(self) -> dict:
+        return {
+            "route": self.route,
+            "coverage": round(self.coverage, 3) if self.coverage is not None else None,
+            "best_finding_id": self.best_id,
+        }
+
+
+class FindingPrefilter:
+    """BM25 index over one sample's parsed findings, queried per must-find."""
+
+    def __init__(
+        self,
+        findings: list[dict],
+        high: float = HIGH_COVERAGE,
+        low: float = LOW_COVERAGE,
+    ):
+        self.findings = findings
+        self.high = high
+        self.low = low
+        self.index = BM25Index([tokenize(finding_text(f)) for f in findings])
+
+    def route(self, must_find: dict) -> PrefilterResult:
+        if not self.findings:
+            return PrefilterResult("full")
+        query = tokenize(f"{must_find.get('title', '')} {must_find.get('issue', '')}")
+        scores = self.index.scores(query)
+        best = max(range(len(scores)), key=scores.__getitem__)
+        coverage = self.index.coverage(query, best) if scores[best] > 0 else 0.0
+        if coverage >= self.high:
+            route = "narrowed"
+        elif coverage < self.low:
+            route = "non_match"
+        else:
+            route = "full"
+        return PrefilterResult(route, coverage, best, self.findings[best].get("id"))
+
+    def render(self, index: int) -> str:
+        """The selected finding in the compact one-line judge rendering."""
+        return render_findings_compact([self.findings[index]])
@@ -0,0 +1,79 @@
+"""
+Historical miss rates of must-find checks, used to order judge calls.
+
+must_find_recall(threshold=...) stops judging once the pass/fail outcome is
+decided. Checks that are usually missed go first, so a failing run is
+decided after a few judge calls. Rates come from a small JSON file of
+judged/missed counts per must-find (keyed by id, else title), which is
+updated after every scored sample when history is enabled.
+
+Rates are Laplace-smoothed, so an unseen must-find sits at 0.5, between
+reliably found and reliably missed checks.
+"""
+import json
+import os
+import tempfile
+from pathlib import Path
+
+
+DEFAULT_HISTORY_PATH = Path(__file__).parent.parent / ".must_find_history.json"
+
+
+def must_find_key(must_find: dict) -> str:
+    return must_find.get("id") or must_find.get("title", "")
+
+
+class MissHistory:
+    """judged / missed counts per must-find key, persisted as JSON."""
+
+    def __init__(self, path: str | Path = DEFAULT_HISTORY_PATH):
+        self.path = Path(path)
+        self.counts: dict[str, dict[str, int]] = self._load()
+
+    def _load(self) -> dict[str, dict[str, int]]:
+        try:
+            return json.loads(self.path.read_text())
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def miss_rate(self, key: str) -> float:
+        entry = self.counts.get(key, {})
+        return (entry.get("missed", 0) + 1) / (entry.get("judged", 0) + 2)
+
+    def order(self, must_finds: list[dict]) -> list[int]:
+        """Indices of must_finds, most likely missed first (stable for ties)."""
+        return sorted(
+            range(len(must_finds)),
+            key=lambda i: -self.miss_rate(must_find_key(must_finds[i])),
+        )
+
+    def record(self, outcomes: list[tuple[str, bool]]) -> None:
+        """Add (key, found) outcomes and write the file atomically.
+
+        Counts are merged into the file's current contents, so concurrent
+        scorers only lose updates that race on the same write.
+        """
+        if not outcomes:
+            return
+        counts = self._load()
+        for key, found in outcomes:
+            entry = counts.setdefault(key, {"judged": 0, "missed": 0})
+            entry["judged"] += 1
+            entry["missed"] += not found
+        self.counts = counts
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(counts, f, indent=1, sort_keys=True)
+            os.replace(tmp, self.path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+
+def open_miss_history(enabled: bool, path: str | None = None) -> MissHistory | None:
+    """Scorer helper: return a MissHistory when enabled, else None."""
+    if not enabled:
+        return None
+    return MissHistory(path if path is not None else DEFAULT_HISTORY_PATH)
@@ -5,19 +5,51 @@ Strategy: for each document-visible required finding in must_find.jsonl
 (pre-loaded into sample metadata), ask a judge model "did the reviewer
 identify this flaw?" Returns recall (found / total_must_find) as the score.
 
+The judge sees a compact canonical rendering of the parsed findings
+(title/issue/section per line, evals.utils.output_parser.render_findings_compact)
+rather than the raw completion. It is built once per sample and shared by
+every must-find check. Output with no parseable findings is sent as-is.
+
 Direction is the same as llm_judge_match (expected→actual), but the source is
 the curated must-find list rather than the full ground truth. Must-find findings
 are document-visible-only — context-dependent findings are excluded (tracked
 separately in context_dependent_findings.jsonl).
 
-The min_recall field per finding is stored in metadata for Phase 2 use (N≥3
-runs). It is NOT enforced in MVP (N=1 gives only binary found/not-found).
+The min_recall field per finding is reported in find_results. It is enforced
+across epochs by scorers.epoch_stats.reviewer_epochs once a task runs N≥3
+epochs (N=1 gives only binary found/not-found).
+
+With threshold=T the scorer only answers "does recall reach T?": must-finds
+are judged in order of historical miss rate (scorers.must_find_history), with
+no more judge calls in flight than verdicts still needed to settle the
+outcome, so no call is made once it is decided. Skipped checks are listed in
+find_results with found=None.
+
+With prefilter=True a local BM25 pre-pass (scorers.lexical_prefilter) ranks
+the parsed reviewer findings against each must-find first. Strong lexical
+matches are judged against just the best-matching finding, which is a much
+smaller prompt. A NO on that narrowed prompt is re-checked against the full
+output, so recall is never lost to the narrowing. Clear non-matches are
+flagged, and with skip_non_matches=True they are scored as missed without a
+judge call.
 """
 import asyncio
+import math
+from typing import Awaitable, Callable
 from inspect_ai.model import get_model, ChatMessageSystem, ChatMessageUser, GenerateConfig
 from inspect_ai.scorer import Score, scorer, mean
 
-from evals.utils.output_parser import parse_review_output
+from evals.utils.output_parser import parse_review_output, render_findings_compact
+from evals.utils.replay_model import replay_model_name
+from scorers.judge_cache import (
+    CacheStats, cached_verdict, content_hash, judge_cache_key, open_judge_cache,
+)
+from scorers.judge_dispatch import DispatchStats, get_dispatcher
+from scorers.epoch_stats import bootstrap_ci, min_recall_met
+from scorers.lexical_prefilter import FindingPrefilter
+from scorers.must_find_history import must_find_key, open_miss_history
+from scorers.judge_telemetry import record_judge_telemetry
+from scorers.judge_usage import TokenUsage, UsageRecordingModel, estimate_tokens
 
 
 _JUDGE_SYSTEM = """\
@@ -25,14 +57,17 @@ You are evaluating whether an AI reviewer identified a known design flaw.
 Answer with exactly YES or NO on the first line, followed by one sentence of reasoning.
 Do not add any other text before YES or NO."""
 
+# The reviewer output is the same for every must-find item of a sample, so it
+# goes in the system message as a cacheable prefix; the flaw to check trails it.
+_OUTPUT_PREFIX_TEMPLATE = """\
+Reviewer output (JSONL findings):
+{output}"""
+
 _JUDGE_TEMPLATE = """\
 Known flaw to check for:
   Title: {title}
   Issue: {issue}
 
-Reviewer output (JSONL findings):
-{output}
-
 Did the reviewer identify this flaw, even if using different wording or framing?
 A match counts if the reviewer's output conveys the same core problem."""
 
@@ -42,11 +77,11 @@ async def _judge_one(judge_model, must_find: dict, actual_text: str) -> tuple[bo
     prompt = _JUDGE_TEMPLATE.format(
         title=must_find.get("title", ""),
         issue=must_find.get("issue", ""),
-        output=actual_text,
     )
+    system = f"{_JUDGE_SYSTEM}\n\n{_OUTPUT_PREFIX_TEMPLATE.format(output=actual_text)}"
     output = await judge_model.generate(
-        [ChatMessageSystem(content=_JUDGE_SYSTEM), ChatMessageUser(content=prompt)],
-        config=GenerateConfig(max_tokens=100, temperature=0.0),
+        [ChatMessageSystem(content=system), ChatMessageUser(content=prompt)],
+        config=GenerateConfig(max_tokens=100, temperature=0.0, cache_prompt=True),
     )
     first_line = output.completion.strip().splitlines()[0].strip().upper()
     found = first_line.startswith("YES")
@@ -54,8 +89,62 @@ async def _judge_one(judge_model, must_find: dict, actual_text: str) -> tuple[bo
     return found, reasoning
 
 
-@scorer(metrics=[mean()])
-def must_find_recall(judge: str = "anthropic/claude-haiku-4-5-20251001"):
+def required_hits(threshold: float, total: int) -> int:
+    """Smallest found count whose recall reaches threshold."""
+    return min(total, max(0, math.ceil(threshold * total - 1e-9)))
+
+
+async def judge_until_decided(
+    calls: list[Callable[[], Awaitable[tuple[bool, str]]]],
+    needed: int,
+) -> list[tuple[bool, str] | None]:
+    """Run judge calls (started in list order) until found >= needed is settled.
+
+    Only as many calls are in flight as verdicts must still arrive before the
+    outcome could be settled: min(hits still needed, misses still affordable
+    + 1). The window is refilled as verdicts arrive, so it never exceeds that
+    bound and no call is started that cannot change the outcome. Calls never
+    started have None results.
+    """
+    total = len(calls)
+    results: list[tuple[bool, str] | None] = [None] * total
+    found = missed = 0
+    if needed <= 0:
+        return results
+    queued = iter(enumerate(calls))
+    running: dict[asyncio.Future, int] = {}
+    try:
+        while found < needed and missed <= total - needed:
+            window = min(needed - found, total - needed - missed + 1)
+            while len(running) < window and (item := next(queued, None)) is not None:
+                running[asyncio.ensure_future(item[1]())] = item[0]
+            if not running:
+                break
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                verdict = task.result()
+                results[running.pop(task)] = verdict
+                found += verdict[0]
+                missed += not verdict[0]
+    finally:
+        for task in running:  # only reached on error; the window leaves none outstanding
+            task.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
+    return results
+
+
+@scorer(metrics=[mean(), bootstrap_ci(), min_recall_met()])
+def must_find_recall(
+    judge: str = "anthropic/claude-haiku-4-5-20251001",
+    cache: bool = False,
+    cache_dir: str | None = None,
+    threshold: float | None = None,
+    history: bool = False,
+    history_path: str | None = None,
+    prefilter: bool = False,
+    skip_non_matches: bool = False,
+    compact: bool = True,
+):
     """
     Score must-find recall by asking a judge LLM per required finding.
 
@@ -67,7 +156,22 @@ def must_find_recall(judge: str = "anthropic/claude-haiku-4-5-20251001"):
 
     Args:
         judge: Model to use for judging. Defaults to Haiku (cheap, fast).
+        cache: Reuse verdicts from the on-disk judge cache (scorers/judge_cache.py).
+        cache_dir: Cache location. Defaults to .judge_cache/ at the repo root.
+        threshold: Only decide whether recall >= threshold. The score value
+            becomes 1.0 (pass) / 0.0 (fail), and judging stops once the
+            outcome is settled.
+        history: Record per-must-find miss rates, which order threshold checks.
+        history_path: History file. Defaults to .must_find_history.json at the repo root.
+        prefilter: Route each check through the BM25 pre-pass (narrowed prompts).
+        skip_non_matches: With prefilter, score clear lexical non-matches as
+            missed without asking the judge.
+        compact: Judge the compact rendering of the parsed findings instead
+            of the raw completion.
     """
+    verdict_cache = open_judge_cache(cache, cache_dir)
+    miss_history = open_miss_history(history, history_path)
+
     async def score(state, target):
         actual_text = state.output.completion
         must_find_findings = state.metadata.get("must_find_findings")
@@ -86,14 +190,78 @@ def must_find_recall(judge: str = "anthropic/claude-haiku-4-5-20251001"):
                 metadata={"found": 0, "total": 0, "find_results": [], "missed_titles": []}
             )
 
-        judge_model = get_model(judge)
+        token_usage = TokenUsage()
+        judge_model = UsageRecordingModel(get_model(replay_model_name(judge)), token_usage)
+        cache_stats = CacheStats(enabled=verdict_cache is not None)
+        dispatch_stats = DispatchStats()
+        dispatcher = get_dispatcher()
+        findings = parse_review_output(actual_text) if compact or prefilter else []
+        rendered = compact and bool(findings)
+        judge_text = render_findings_compact(findings) if rendered else actual_text
+        judge_hash = content_hash(judge_text)
+        lexical = FindingPrefilter(findings) if prefilter else None
+        routes: dict[int, dict] = {}
+        prompt_chars = {"full": 0, "sent": 0}
 
-        tasks = [_judge_one(judge_model, mf, actual_text) for mf in must_find_findings]
-        results = await asyncio.gather(*tasks)
+        def judged(mf: dict, text: str, text_hash: str):
+            key = judge_cache_key(
+                judge=judge,
+                system=_JUDGE_SYSTEM,
+                prefix=_OUTPUT_PREFIX_TEMPLATE,
+                template=_JUDGE_TEMPLATE,
+                title=mf.get("title", ""),
+                issue=mf.get("issue", ""),
+                output_hash=text_hash,
+            )
+            prompt_chars["sent"] += len(text)
+            return cached_verdict(
+                verdict_cache, key,
+                lambda: dispatcher.call(
+                    judge, lambda: _judge_one(judge_model, mf, text), dispatch_stats
+                ),
+                cache_stats,
+            )
+
+        async def verdict(i: int) -> tuple[bool, str]:
+            mf = must_find_findings[i]
+            prompt_chars["full"] += len(judge_text)
+            if lexical is None:
+                return await judged(mf, judge_text, judge_hash)
+            routed = lexical.route(mf)
+            routes[i] = routed.as_dict()
+            if routed.route == "narrowed":
+                narrowed = lexical.render(routed.best_index)
+                found, reasoning = await judged(mf, narrowed, content_hash(narrowed))
+                if found:
+                    return found, reasoning
+                routes[i]["confirmed_with_full_output"] = True
+            elif routed.route == "non_match" and skip_non_matches:
+                return False, (
+                    f"Lexical pre-filter: no reviewer finding covers this flaw's key terms "
+                    f"(coverage {routed.coverage:.2f}); judge not asked."
+                )
+            return await judged(mf, judge_text, judge_hash)
+
+        total = len(must_find_findings)
+        if threshold is None:
+            results = await asyncio.gather(*(verdict(i) for i in range(total)))
+        else:
+            order = (
+                miss_history.order(must_find_findings) if miss_history is not None
+                else list(range(total))
+            )
+            needed = required_hits(threshold, total)
+            ordered = await judge_until_decided(
+                [lambda i=i: verdict(i) for i in order], needed
+            )
+            results = [None] * total
+            for i, result in zip(order, ordered):
+                results[i] = result
 
         find_results = []
         found_count = 0
-        for mf, (found, reasoning) in zip(must_find_findings, results):
+        for i, (mf, result) in enumerate(zip(must_find_findings, results)):
+            found, reasoning = result if result is not None else (None, None)
             if found:
                 found_count += 1
             find_results.append({
@@ -102,25 +270,82 @@ def must_find_recall(judge: str = "anthropic/claude-haiku-4-5-20251001"):
                 "found": found,
                 "reasoning": reasoning,
                 "min_recall": mf.get("min_recall"),
+                **({"skipped": True} if result is None else {}),
+                **({"prefilter": routes[i]} if i in routes else {}),
             })
 
-        total = len(must_find_findings)
-        recall = found_count / total
-        missed = [r["must_find_title"] for r in find_results if not r["found"]]
+        if miss_history is not None:
+            miss_history.record([
+                (must_find_key(mf), r["found"])
+                for mf, r in zip(must_find_findings, find_results) if not r.get("skipped")
+            ])
 
+        missed = [r["must_find_title"] for r in find_results if r["found"] is False]
+        skipped = [r["must_find_title"] for r in find_results if r.get("skipped")]
+        metadata = {
+            "found": found_count,
+            "total": total,
+            "recall": found_count / total,
+            "missed_titles": missed,
+            "find_results": find_results,
+            "judge_cache": cache_stats.as_dict(),
+            "judge_dispatch": dispatch_stats.as_dict(),
+            "judge_usage": token_usage.as_dict(),
+            "judge_telemetry": record_judge_telemetry(
+                "must_find_recall", judge, token_usage, dispatch_stats,
+                sample_id=getattr(state, "sample_id", None),
+            ),
+            "judge_output": {
+                "rendering": "compact" if rendered else "raw",
+                "parsed_findings": len(findings),
+                "tokens_raw": estimate_tokens(actual_text),
+                "tokens_sent": estimate_tokens(judge_text),
+            },
+        }
+        if lexical is not None:
+            route_counts = {"narrowed": 0, "full": 0, "non_match": 0}
+            for route in routes.values():
+                route_counts[route["route"]] += 1
+            metadata["prefilter"] = {
+                **route_counts,
+                "parsed_findings": len(lexical.findings),
+                "confirmed_with_full_output": sum(
+                    1 for r in routes.values() if r.get("confirmed_with_full_output")
+                ),
+                "prompt_chars": prompt_chars,
+            }
+
+        if threshold is None:
+            recall = found_count / total
+            return Score(
+                value=recall,
+                explanation=(
+                    f"Reviewer found {found_count}/{total} must-find findings. "
+                    f"Recall: {recall:.2%}."
+                ),
+                metadata=metadata,
+            )
+
+        passed = found_count >= needed
+        # The value is pass/fail and recall is only bounded once checks are
+        # skipped, so report the bounds (equal when nothing was skipped) instead.
+        del metadata["recall"]
+        metadata.update({
+            "threshold": threshold,
+            "threshold_passed": passed,
+            "recall_lower": found_count / total,
+            "recall_upper": (total - len(missed)) / total,
+            "skipped": len(skipped),
+            "skipped_titles": skipped,
+        })
         return Score(
-            value=recall,
+            value=1.0 if passed else 0.0,
             explanation=(
-                f"Reviewer found {found_count}/{total} must-find findings. "
-                f"Recall: {recall:.2%}."
+                f"Recall {'reaches' if passed else 'is below'} {threshold:.0%}: "
+                f"{found_count} found, {len(missed)} missed, {len(skipped)} of {total} "
+                f"checks skipped once decided."
             ),
-            metadata={
-                "found": found_count,
-                "total": total,
-                "recall": recall,
-                "missed_titles": missed,
-                "find_results": find_results,
-            }
+            metadata=metadata,
         )
 
     return score
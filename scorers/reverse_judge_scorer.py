@@ -15,16 +15,24 @@ Key constraint (ADR-007): pass the FULL document to the judge — never truncate
 Findings may reference any part of the document.
 """
 import asyncio
+import json
 import re
 from inspect_ai.model import get_model, ChatMessageSystem, ChatMessageUser, GenerateConfig
 from inspect_ai.scorer import Score, scorer, mean
 
+from evals.utils.dataset_loader import sample_document
 from evals.utils.output_parser import parse_review_output
+from evals.utils.replay_model import replay_model_name
+from scorers.judge_cache import (
+    CacheStats, cached_verdict, content_hash, judge_cache_key, open_judge_cache,
+)
+from scorers.judge_dispatch import DispatchStats, get_dispatcher
+from scorers.epoch_stats import bootstrap_ci
+from scorers.judge_telemetry import record_judge_telemetry
+from scorers.judge_usage import TokenUsage, UsageRecordingModel
 
 
-_JUDGE_SYSTEM = """\
-You are evaluating whether an AI design reviewer's finding is genuine.
-
+_JUDGE_CRITERIA = """\
 A finding is GENUINE if it identifies a real design gap or flaw visible in the provided document.
 
 GENUINE includes:
@@ -39,22 +47,56 @@ A finding is NOT_GENUINE if it falls into any of these false positive categories
 - Style preference: subjective formatting, naming, or structural preference with no design impact
 - Hypothetical future concern: speculates about future requirements not relevant to the current design
 - Duplicate: substantively the same flaw already identified in another finding
-- Context-dependent: requires external knowledge (project history, MEMORY.md, prior sessions) to evaluate — cannot be assessed from the document alone
+- Context-dependent: requires external knowledge (project history, MEMORY.md, prior sessions) to evaluate — cannot be assessed from the document alone"""
+
+_JUDGE_SYSTEM = f"""\
+You are evaluating whether an AI design reviewer's finding is genuine.
+
+{_JUDGE_CRITERIA}
 
 Answer with exactly GENUINE or NOT_GENUINE on the first line, followed by one sentence of reasoning.
 Do not add any other text before GENUINE or NOT_GENUINE."""
 
+# The document goes in the system message after the instructions: that prefix is
+# identical for every finding of a sample, so the provider can cache it. Only the
+# short per-finding user message changes between calls.
+_DOC_PREFIX_TEMPLATE = """\
+Source document (evaluate the finding against this document only):
+{doc_content}"""
+
 _JUDGE_TEMPLATE = """\
 Finding to evaluate:
   Title: {title}
   Issue: {issue}
   Severity: {severity}
 
-Source document (evaluate the finding against this document only):
-{doc_content}
-
 Is this finding GENUINE or NOT_GENUINE?"""
 
+# Batched variant: N findings judged in one call against a single copy of the
+# document. Same criteria as the direct prompt; the verdicts come back as a JSON
+# array so they can be mapped to findings by index.
+_BATCHED_JUDGE_SYSTEM = f"""\
+You are evaluating whether each of several AI design reviewer findings is genuine.
+Judge every finding independently — one finding's verdict must not influence another's.
+
+{_JUDGE_CRITERIA}
+
+Respond with only a JSON array containing one object per finding, in the order given:
+[{{"index": 1, "verdict": "GENUINE", "reasoning": "<one sentence>"}}, ...]
+verdict must be exactly GENUINE or NOT_GENUINE. Do not add any text outside the array."""
+
+_BATCHED_JUDGE_TEMPLATE = """\
+Findings to evaluate:
+{findings_block}
+
+Return the JSON array of verdicts for all {count} findings."""
+
+_BATCHED_FINDING_TEMPLATE = """\
+Finding {index}:
+  Title: {title}
+  Issue: {issue}
+  Severity: {severity}"""
+
 # G-Eval variant: reasoning-first prompting (chain-of-thought before verdict).
 # Forces the model to locate evidence in the document and apply each false-positive
 # criterion explicitly before committing to a verdict.
@@ -68,9 +110,6 @@ Finding to evaluate:
   Issue: {issue}
   Severity: {severity}
 
-Source document (evaluate the finding against this document only):
-{doc_content}
-
 Work through these evaluation steps:
 
 Step 1 — Evidence: Find and quote the specific text in the document that this finding references. If relevant text cannot be found, state that explicitly.
@@ -86,12 +125,23 @@ Verdict: GENUINE
 Verdict: NOT_GENUINE"""
 
 
+def _judge_messages(system: str, doc_content: str, prompt: str) -> list:
+    """Build judge messages with the document in the cacheable system prefix."""
+    return [
+        ChatMessageSystem(
+            content=f"{system}\n\n{_DOC_PREFIX_TEMPLATE.format(doc_content=doc_content)}"
+        ),
+        ChatMessageUser(content=prompt),
+    ]
+
+
 async def _reverse_judge_one(
     judge_model, finding: dict, doc_content: str
 ) -> tuple[bool, str]:
     """Ask LLM judge if an actual reviewer finding is genuine (direct prompt).
 
     Passes the full document — no truncation. Findings may reference any section.
+    The document sits in the system prefix so repeated calls hit the prompt cache.
 
     Returns:
         (is_genuine, reasoning) — whether judge says GENUINE and the reasoning.
@@ -100,11 +150,10 @@ async def _reverse_judge_one(
         title=finding.get("title", ""),
         issue=finding.get("issue", finding.get("description", "")),
         severity=finding.get("severity", ""),
-        doc_content=doc_content,
     )
     output = await judge_model.generate(
-        [ChatMessageSystem(content=_JUDGE_SYSTEM), ChatMessageUser(content=prompt)],
-        config=GenerateConfig(max_tokens=150, temperature=0.0),
+        _judge_messages(_JUDGE_SYSTEM, doc_content, prompt),
+        config=GenerateConfig(max_tokens=150, temperature=0.0, cache_prompt=True),
     )
     first_line = output.completion.strip().splitlines()[0].strip().upper()
     is_genuine = first_line.startswith("GENUINE") and not first_line.startswith("NOT_GENUINE")
@@ -128,11 +177,10 @@ async def _geval_judge_one(
         title=finding.get("title", ""),
         issue=finding.get("issue", finding.get("description", "")),
         severity=finding.get("severity", ""),
-        doc_content=doc_content,
     )
     output = await judge_model.generate(
-        [ChatMessageSystem(content=_GEVAL_JUDGE_SYSTEM), ChatMessageUser(content=prompt)],
-        config=GenerateConfig(max_tokens=1000, temperature=0.0),
+        _judge_messages(_GEVAL_JUDGE_SYSTEM, doc_content, prompt),
+        config=GenerateConfig(max_tokens=1000, temperature=0.0, cache_prompt=True),
     )
     reasoning = output.completion.strip()
 
@@ -149,10 +197,86 @@ async def _geval_judge_one(
     return is_genuine, reasoning
 
 
-@scorer(metrics=[mean()])
+def _parse_batched_verdicts(text: str, count: int) -> list[tuple[bool, str]] | None:
+    """Parse a batched judge response into per-finding (is_genuine, reasoning).
+
+    Returns None unless the response holds a JSON array with exactly one valid
+    verdict for each index 1..count — callers fall back to per-finding calls.
+    """
+    start, end = text.find("["), text.rfind("]")
+    if start == -1 or end <= start:
+        return None
+    try:
+        items = json.loads(text[start:end + 1])
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(items, list):
+        return None
+
+    by_index: dict[int, tuple[bool, str]] = {}
+    for item in items:
+        if not isinstance(item, dict):
+            return None
+        index = item.get("index")
+        verdict = str(item.get("verdict", "")).strip().upper()
+        if not isinstance(index, int) or verdict not in ("GENUINE", "NOT_GENUINE"):
+            return None
+        reasoning = str(item.get("reasoning", "")).strip()
+        by_index[index] = (verdict == "GENUINE", f"{verdict}\n{reasoning}".strip())
+
+    if sorted(by_index) != list(range(1, count + 1)):
+        return None
+    return [by_index[i] for i in range(1, count + 1)]
+
+
+async def _batched_judge_many(
+    judge_model, findings: list[dict], doc_content: str
+) -> list[tuple[bool, str]] | None:
+    """Ask LLM judge for verdicts on several findings in one call.
+
+    The full document is sent once per batch instead of once per finding.
+
+    Returns:
+        One (is_genuine, reasoning) per finding in input order, or None if the
+        response could not be parsed into a complete verdict list.
+    """
+    findings_block = "\n\n".join(
+        _BATCHED_FINDING_TEMPLATE.format(
+            index=i,
+            title=finding.get("title", ""),
+            issue=finding.get("issue", finding.get("description", "")),
+            severity=finding.get("severity", ""),
+        )
+        for i, finding in enumerate(findings, start=1)
+    )
+    prompt = _BATCHED_JUDGE_TEMPLATE.format(
+        findings_block=findings_block,
+        count=len(findings),
+    )
+    output = await judge_model.generate(
+        _judge_messages(_BATCHED_JUDGE_SYSTEM, doc_content, prompt),
+        config=GenerateConfig(max_tokens=100 + 150 * len(findings), temperature=0.0,
+            cache_prompt=True,
+        ),
+    )
+    return _parse_batched_verdicts(output.completion, len(findings))
+
+
+# prompt_style → (judge function, system prompt, template). The prompt text is
+# part of the verdict cache key so editing a prompt invalidates its entries.
+_PROMPT_STYLES = {
+    "direct": (_reverse_judge_one, _JUDGE_SYSTEM, _JUDGE_TEMPLATE),
+    "geval": (_geval_judge_one, _GEVAL_JUDGE_SYSTEM, _GEVAL_JUDGE_TEMPLATE),
+}
+
+
+@scorer(metrics=[mean(), bootstrap_ci()])
 def reverse_judge_precision(
     judge: str = "anthropic/claude-haiku-4-5-20251001",
     prompt_style: str = "direct",
+    cache: bool = False,
+    cache_dir: str | None = None,
+    batch_size: int = 10,
 ):
     """
     Score reviewer precision by asking a judge LLM per actual finding.
@@ -166,14 +290,22 @@ def reverse_judge_precision(
 
     Args:
         judge: Model to use for judging. Defaults to Haiku (cheap, fast).
-        prompt_style: "direct" (verdict-first, max_tokens=150) or
-                      "geval" (reasoning-first chain-of-thought, max_tokens=500).
+        prompt_style: "direct" (verdict-first, max_tokens=150),
+                      "geval" (reasoning-first chain-of-thought, max_tokens=500) or
+                      "batched" (up to batch_size findings per call, one copy of
+                      the document per batch; falls back to "direct" per finding
+                      when a batch response cannot be parsed).
+        cache: Reuse verdicts from the on-disk judge cache (scorers/judge_cache.py).
+        cache_dir: Cache location. Defaults to .judge_cache/ at the repo root.
+        batch_size: Findings per judge call when prompt_style="batched".
     """
-    judge_fn = _geval_judge_one if prompt_style == "geval" else _reverse_judge_one
+    batched = prompt_style == "batched"
+    judge_fn, system_prompt, template = _PROMPT_STYLES.get(prompt_style, _PROMPT_STYLES["direct"])
+    verdict_cache = open_judge_cache(cache, cache_dir)
 
     async def score(state, target):
         actual_text = state.output.completion
-        doc_content = state.metadata["doc_content"]
+        doc_content = sample_document(state.metadata, state.input_text)
 
         actual_findings = parse_review_output(actual_text)
 
@@ -184,13 +316,81 @@ def reverse_judge_precision(
                 metadata={"genuine": 0, "total": 0, "judge_results": []}
             )
 
-        judge_model = get_model(judge)
+        token_usage = TokenUsage()
+        judge_model = UsageRecordingModel(get_model(replay_model_name(judge)), token_usage)
+        cache_stats = CacheStats(enabled=verdict_cache is not None)
+        dispatch_stats = DispatchStats()
+        dispatcher = get_dispatcher()
+        doc_hash = state.metadata.get("doc_hash") or content_hash(doc_content)
+
+        def cache_key(finding: dict, system: str, tmpl: str) -> str:
+            return judge_cache_key(
+                judge=judge,
+                system=system,
+                prefix=_DOC_PREFIX_TEMPLATE,
+                template=tmpl,
+                title=finding.get("title", ""),
+                issue=finding.get("issue", finding.get("description", "")),
+                severity=finding.get("severity", ""),
+                doc_hash=doc_hash,
+            )
+
+        def verdict(finding: dict, stats: CacheStats = cache_stats):
+            return cached_verdict(
+                verdict_cache, cache_key(finding, system_prompt, template),
+                lambda: dispatcher.call(
+                    judge, lambda: judge_fn(judge_model, finding, doc_content), dispatch_stats
+                ),
+                stats,
+            )
 
-        tasks = [
-            judge_fn(judge_model, finding, doc_content)
-            for finding in actual_findings
-        ]
-        results = await asyncio.gather(*tasks)
+        batch_info = {"batch_size": batch_size, "batches": 0, "fallback_batches": 0}
+
+        async def batched_verdicts(findings: list[dict]) -> list[tuple[bool, str]]:
+            results: list[tuple[bool, str] | None] = [None] * len(findings)
+            pending = []
+            for i, finding in enumerate(findings):
+                entry = (
+                    verdict_cache.get(cache_key(finding, _BATCHED_JUDGE_SYSTEM, _BATCHED_JUDGE_TEMPLATE))
+                    if verdict_cache is not None else None
+                )
+                if entry is not None:
+                    cache_stats.hits += 1
+                    results[i] = (entry["verdict"], entry["reasoning"])
+                else:
+                    if verdict_cache is not None:
+                        cache_stats.misses += 1
+                    pending.append(i)
+
+            async def run_batch(indices: list[int]) -> None:
+                batch = [findings[i] for i in indices]
+                batch_info["batches"] += 1
+                verdicts = await dispatcher.call(
+                    judge, lambda: _batched_judge_many(judge_model, batch, doc_content), dispatch_stats
+                )
+                if verdicts is None:
+                    # These findings were already counted as batched-key misses.
+                    batch_info["fallback_batches"] += 1
+                    verdicts = await asyncio.gather(*(verdict(f, CacheStats()) for f in batch))
+                if verdict_cache is not None:
+                    for finding, (is_genuine, reasoning) in zip(batch, verdicts):
+                        verdict_cache.put(
+                            cache_key(finding, _BATCHED_JUDGE_SYSTEM, _BATCHED_JUDGE_TEMPLATE),
+                            {"verdict": is_genuine, "reasoning": reasoning},
+                        )
+                for i, result in zip(indices, verdicts):
+                    results[i] = result
+
+            size = max(1, batch_size)
+            await asyncio.gather(*(
+                run_batch(pending[j:j + size]) for j in range(0, len(pending), size)
+            ))
+            return results
+
+        if batched:
+            results = await batched_verdicts(actual_findings)
+        else:
+            results = await asyncio.gather(*(verdict(f) for f in actual_findings))
 
         judge_results = []
         genuine_count = 0
@@ -229,6 +429,14 @@ def reverse_judge_precision(
                 "precision": precision,
                 "not_genuine_titles": not_genuine,
                 "judge_results": judge_results,
+                "judge_cache": cache_stats.as_dict(),
+                "judge_dispatch": dispatch_stats.as_dict(),
+                "judge_usage": token_usage.as_dict(),
+                "judge_telemetry": record_judge_telemetry(
+                    "reverse_judge_precision", judge, token_usage, dispatch_stats,
+                    sample_id=getattr(state, "sample_id", None),
+                ),
+                **({"batching": batch_info} if batched else {}),
                 "confidence_stratified": {
                     "high_confidence": {
                         "count": len(high),
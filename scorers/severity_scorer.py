@@ -1,5 +1,6 @@
 # DEPRECATED: replaced by reverse_judge_precision() + must_find_recall() (ADR-007 / Issue #71).
 # Kept for reference. Do not use in reviewer_eval.py.
+from collections import Counter
 from difflib import SequenceMatcher
 from inspect_ai.scorer import Score, scorer, accuracy
 
@@ -21,8 +22,184 @@ def _actual_key(finding: dict) -> str | int:
     return raw_id if raw_id is not None else id(finding)
 
 
+def _bigram_counts(text: str) -> Counter:
+    return Counter(text[i:i + 2] for i in range(len(text) - 1))
+
+
+def _candidate_pairs(
+    actual_titles: list[str],
+    expected_titles: list[str],
+    threshold: float,
+) -> dict[tuple[int, int], float]:
+    """Similarity for every (expected, actual) pair at or above threshold.
+
+    Pruning is exact (a count filter over a bigram inverted index): every
+    SequenceMatcher block of length L is a common substring contributing L-1
+    shared bigrams, and consecutive blocks are separated by at least one
+    unmatched character, so with S = len(a) + len(b) and M matched characters
+        shared_bigrams >= M - blocks >= 3M - S - 1.
+    ratio = 2M / S >= threshold therefore needs
+        shared_bigrams >= S * (1.5 * threshold - 1) - 1,
+    and pairs below that are never passed to SequenceMatcher. Each expected
+    title is loaded as seq2 once so its preprocessing is shared across all of
+    its surviving candidates.
+    """
+    slope = 1.5 * threshold - 1
+    eps = 1e-9  # keep the bound conservative under float rounding (e.g. 1.5 * 0.8 - 1)
+    actual_lengths = [len(title) for title in actual_titles]
+    index: dict[str, list[tuple[int, int]]] = {}
+    for j, title in enumerate(actual_titles):
+        for gram, count in _bigram_counts(title).items():
+            index.setdefault(gram, []).append((j, count))
+    by_length = sorted(range(len(actual_titles)), key=actual_lengths.__getitem__)
+
+    pairs: dict[tuple[int, int], float] = {}
+    matcher = SequenceMatcher(None)
+    for i, exp_title in enumerate(expected_titles):
+        exp_len = len(exp_title)
+        if slope <= 0:
+            candidates = range(len(actual_titles))  # low thresholds: no usable bound
+        else:
+            shared: dict[int, int] = {}
+            for gram, count in _bigram_counts(exp_title).items():
+                for j, act_count in index.get(gram, ()):
+                    shared[j] = shared.get(j, 0) + min(count, act_count)
+            candidates = [
+                j for j, n in shared.items()
+                if n >= (exp_len + actual_lengths[j]) * slope - 1 - eps
+            ]
+            # Very short pairs can match without sharing any bigram.
+            max_len_without_shared = 1 / slope - exp_len + eps
+            for j in by_length:
+                if actual_lengths[j] > max_len_without_shared:
+                    break
+                if j not in shared:
+                    candidates.append(j)
+        if not candidates:
+            continue
+
+        matcher.set_seq2(exp_title)
+        for j in sorted(candidates):
+            matcher.set_seq1(actual_titles[j])
+            if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+                continue
+            similarity = matcher.ratio()
+            if similarity >= threshold:
+                pairs[(i, j)] = similarity
+    return pairs
+
+
+def _max_weight_assignment(weights: list[list[float]]) -> list[tuple[int, int]]:
+    """Maximum-weight assignment (Hungarian algorithm, O(n²m)) for an n×m matrix.
+
+    Returns (row, col) pairs for every row when n <= m, or every column when
+    n > m. Callers drop pairs whose weight marks a non-edge.
+    """
+    transposed = len(weights) > len(weights[0])
+    if transposed:
+        weights = [list(col) for col in zip(*weights)]
+    n, m = len(weights), len(weights[0])
+    top = max(max(row) for row in weights)
+    # Minimise cost = top - weight; 1-indexed potentials per the classic formulation.
+    u = [0.0] * (n + 1)
+    v = [0.0] * (m + 1)
+    owner = [0] * (m + 1)
+    way = [0] * (m + 1)
+    for row in range(1, n + 1):
+        owner[0] = row
+        col0 = 0
+        minv = [float("inf")] * (m + 1)
+        used = [False] * (m + 1)
+        while True:
+            used[col0] = True
+            row0, delta, col1 = owner[col0], float("inf"), 0
+            for col in range(1, m + 1):
+                if used[col]:
+                    continue
+                cur = (top - weights[row0 - 1][col - 1]) - u[row0] - v[col]
+                if cur < minv[col]:
+                    minv[col], way[col] = cur, col0
+                if minv[col] < delta:
+                    delta, col1 = minv[col], col
+            for col in range(m + 1):
+                if used[col]:
+                    u[owner[col]] += delta
+                    v[col] -= delta
+                else:
+                    minv[col] -= delta
+            col0 = col1
+            if owner[col0] == 0:
+                break
+        while col0:
+            col1 = way[col0]
+            owner[col0] = owner[col1]
+            col0 = col1
+
+    assignment = [(owner[col] - 1, col - 1) for col in range(1, m + 1) if owner[col]]
+    return [(c, r) for r, c in assignment] if transposed else assignment
+
+
+def _optimal_matching(pairs: dict[tuple[int, int], float]) -> list[tuple[int, int]]:
+    """Maximum-cardinality matching over candidate pairs, ties broken by total similarity.
+
+    The candidate graph is split into connected components so the cubic
+    assignment step only ever runs on small clusters of similar titles.
+    """
+    parent: dict[tuple[str, int], tuple[str, int]] = {}
+
+    def find(node):
+        parent.setdefault(node, node)
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    for i, j in pairs:
+        parent[find(("e", i))] = find(("a", j))
+
+    components: dict[tuple[str, int], list[tuple[int, int]]] = {}
+    for i, j in pairs:
+        components.setdefault(find(("e", i)), []).append((i, j))
+
+    matches = []
+    for edges in components.values():
+        if len(edges) == 1:
+            matches.extend(edges)
+            continue
+        rows = sorted({i for i, _ in edges})
+        cols = sorted({j for _, j in edges})
+        # Every edge outweighs any sum of similarity bonuses, so more matches always win.
+        edge_weight = len(edges) + 1
+        weights = [[0.0] * len(cols) for _ in rows]
+        for i, j in edges:
+            weights[rows.index(i)][cols.index(j)] = edge_weight + pairs[(i, j)]
+        for r, c in _max_weight_assignment(weights):
+            if weights[r][c] > 0:
+                matches.append((rows[r], cols[c]))
+    return matches
+
+
+def _greedy_matching(
+    pairs: dict[tuple[int, int], float], n_expected: int, n_actual: int
+) -> list[tuple[int, int]]:
+    """Legacy first-match consumption in expected order (pre-index behaviour)."""
+    consumed: set[int] = set()
+    matches = []
+    for i in range(n_expected):
+        for j in range(n_actual):
+            if j not in consumed and (i, j) in pairs:
+                matches.append((i, j))
+                consumed.add(j)
+                break
+    return matches
+
+
 def match_findings(
-    actual: list[dict], expected: list[dict]
+    actual: list[dict],
+    expected: list[dict],
+    threshold: float = 0.8,
+    require_severity: bool = True,
+    strategy: str = "optimal",
 ) -> tuple[list[dict], set[str | int]]:
     """
     Match actual review findings to expected ground truth findings.
@@ -33,27 +210,52 @@ def match_findings(
     assigned independently each run — they are not stable cross-run identifiers.
     The same flaw found in two runs will have different IDs but similar titles.
 
+    Titles are lower-cased once, grouped by severity and pruned through a bigram
+    count filter before any SequenceMatcher work (see _candidate_pairs). With the
+    default "optimal" strategy the final pairing maximises the number of
+    matches (then total similarity) instead of letting an early expected
+    finding consume an actual finding a later one needed. "greedy" keeps the
+    original first-match order.
+
+    Args:
+        actual: Parsed reviewer findings.
+        expected: Ground truth findings.
+        threshold: Minimum SequenceMatcher title ratio for a match.
+        require_severity: Only pair findings with equal severity.
+        strategy: "optimal" (maximum matching) or "greedy" (first match wins).
+
     Returns:
         (matched_expected, consumed_actual_keys) — the list of matched expected
         findings and the set of _actual_key() values that were consumed.
         consumed_actual_keys is needed by callers to compute false positives.
     """
-    matched = []
-    consumed_actual_keys: set[str | int] = set()
+    groups: dict[object, tuple[list[int], list[int]]] = {}
+    for i, exp in enumerate(expected):
+        sev = exp.get("severity") if require_severity else None
+        groups.setdefault(sev, ([], []))[0].append(i)
+    for j, act in enumerate(actual):
+        sev = act.get("severity") if require_severity else None
+        if sev in groups:
+            groups[sev][1].append(j)
 
-    for exp in expected:
-        for act in actual:
-            act_key = _actual_key(act)
-            if act_key in consumed_actual_keys:
-                continue
-            if (
-                act.get("severity") == exp.get("severity")
-                and _title_similarity(act.get("title", ""), exp.get("title", "")) >= 0.8
-            ):
-                matched.append(exp)
-                consumed_actual_keys.add(act_key)
-                break
+    matches: list[tuple[int, int]] = []
+    for exp_idx, act_idx in groups.values():
+        if not act_idx:
+            continue
+        local = _candidate_pairs(
+            actual_titles=[actual[j].get("title", "").lower() for j in act_idx],
+            expected_titles=[expected[i].get("title", "").lower() for i in exp_idx],
+            threshold=threshold,
+        )
+        if strategy == "greedy":
+            local_matches = _greedy_matching(local, len(exp_idx), len(act_idx))
+        else:
+            local_matches = _optimal_matching(local)
+        matches.extend((exp_idx[i], act_idx[j]) for i, j in local_matches)
 
+    matched_expected = {i for i, _ in matches}
+    matched = [exp for i, exp in enumerate(expected) if i in matched_expected]
+    consumed_actual_keys = {_actual_key(actual[j]) for _, j in matches}
     return matched, consumed_actual_keys
 
 
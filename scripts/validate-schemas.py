@@ -4,20 +4,34 @@ Validate JSONL/JSON files against parallax schemas.
 
 Usage:
     python3 scripts/validate-schemas.py docs/reviews/parallax-review-v1/
+    python3 scripts/validate-schemas.py --jobs 4 docs/reviews/parallax-review-v1/
+    python3 scripts/validate-schemas.py --recursive --jobs 0 --json-summary - docs/reviews/
     python3 scripts/validate-schemas.py --file assumption-hunter.jsonl --schema reviewer-findings
+
+Every schema violation in a record is reported, not just the first.
 """
 
 import argparse
+import hashlib
 import json
+import os
 import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Tuple
 
-import jsonschema
 from jsonschema import Draft202012Validator
 
+try:
+    from evals.utils.json_codec import loads as json_loads
+except ImportError:  # scripts/ venv without the evals package installed
+    json_loads = json.loads
+
 
 SCHEMA_DIR = Path(__file__).parent.parent / "schemas"
+DEFAULT_MANIFEST = Path(__file__).parent.parent / ".schema-validation-manifest.json"
 SCHEMA_MAPPING = {
     "reviewer-findings": "reviewer-findings-v1.0.0.schema.json",
     "run-metadata": "run-metadata-v1.0.0.schema.json",
@@ -36,23 +50,92 @@ def load_schema(schema_name: str) -> dict:
         return json.load(f)
 
 
-def validate_jsonl_line(line_num: int, line: str, schema: dict) -> Tuple[bool, str]:
-    """Validate a single JSONL line against schema."""
+class CompiledSchema:
+    """Validator for one schema, with per-record-type dispatch for unions.
+
+    reviewer-findings is a oneOf over record types, each pinned by a "type"
+    const. Checking a record against every branch triples the work, so records
+    whose "type" names a branch are validated against that branch alone (the
+    consts are disjoint, so this is equivalent to the oneOf). Anything else
+    falls back to the full schema.
+    """
+
+    def __init__(self, schema: dict):
+        Draft202012Validator.check_schema(schema)
+        self.validator = Draft202012Validator(schema)
+        self.by_type: Dict[str, Draft202012Validator] = {}
+        base = {key: value for key, value in schema.items() if key != "oneOf"}
+        for branch in schema.get("oneOf", []):
+            ref = branch.get("$ref", "")
+            if not ref.startswith("#/$defs/"):
+                continue
+            definition = schema["$defs"][ref.removeprefix("#/$defs/")]
+            record_type = definition.get("properties", {}).get("type", {}).get("const")
+            if record_type is not None and "type" in definition.get("required", []):
+                self.by_type[record_type] = Draft202012Validator({**base, "$ref": ref})
+
+    def iter_errors(self, obj):
+        record_type = obj.get("type") if isinstance(obj, dict) else None
+        validator = self.by_type.get(record_type, self.validator)
+        return validator.iter_errors(obj)
+
+
+@lru_cache(maxsize=None)
+def get_validator(schema_name: str) -> CompiledSchema:
+    """Compiled validator for a schema, built once per process."""
+    return CompiledSchema(load_schema(schema_name))
+
+
+def _expand_union_error(error) -> list:
+    """Replace a oneOf/anyOf failure with the errors of the branch the record meant.
+
+    The record schemas are unions discriminated by "type". Branches whose
+    "type" does not match are dropped; if exactly one branch is left, its own
+    errors are reported instead of the opaque "not valid under any" message.
+    """
+    if error.validator not in ("oneOf", "anyOf") or not error.context:
+        return [error]
+    branches: Dict[int, list] = {}
+    for sub in error.context:
+        branches.setdefault(sub.relative_schema_path[0], []).append(sub)
+    candidates = [
+        subs for subs in branches.values()
+        if not any(sub.json_path.endswith(".type") for sub in subs)
+    ]
+    if len(candidates) != 1:
+        return [error]
+    return [leaf for sub in candidates[0] for leaf in _expand_union_error(sub)]
+
+
+def schema_errors(obj, validator: CompiledSchema) -> List[str]:
+    """All validation errors for obj, ordered by location in the document."""
+    errors = sorted(
+        (leaf for error in validator.iter_errors(obj) for leaf in _expand_union_error(error)),
+        key=lambda e: e.json_path,
+    )
+    return [
+        f"Validation error: {e.message}" if e.json_path == "$"
+        else f"Validation error at {e.json_path}: {e.message}"
+        for e in errors
+    ]
+
+
+def validate_jsonl_line(
+    line_num: int, line: str, validator: CompiledSchema
+) -> Tuple[bool, List[str]]:
+    """Validate a single JSONL line against a compiled validator."""
     try:
-        obj = json.loads(line)
+        obj = json_loads(line)
     except json.JSONDecodeError as e:
-        return False, f"Line {line_num}: Invalid JSON: {e}"
+        return False, [f"Line {line_num}: Invalid JSON: {e}"]
 
-    try:
-        Draft202012Validator(schema).validate(obj)
-        return True, ""
-    except jsonschema.ValidationError as e:
-        return False, f"Line {line_num}: Validation error: {e.message}"
+    errors = [f"Line {line_num}: {error}" for error in schema_errors(obj, validator)]
+    return len(errors) == 0, errors
 
 
 def validate_jsonl_file(file_path: Path, schema_name: str) -> Tuple[bool, List[str]]:
     """Validate entire JSONL file."""
-    schema = load_schema(schema_name)
+    validator = get_validator(schema_name)
     errors = []
 
     with open(file_path) as f:
@@ -61,29 +144,32 @@ def validate_jsonl_file(file_path: Path, schema_name: str) -> Tuple[bool, List[s
             if not line:
                 continue
 
-            valid, error = validate_jsonl_line(line_num, line, schema)
+            valid, line_errors = validate_jsonl_line(line_num, line, validator)
             if not valid:
-                errors.append(error)
+                errors.extend(line_errors)
 
     return len(errors) == 0, errors
 
 
 def validate_json_file(file_path: Path, schema_name: str) -> Tuple[bool, List[str]]:
     """Validate entire JSON file."""
-    schema = load_schema(schema_name)
-    errors = []
+    validator = get_validator(schema_name)
 
     with open(file_path) as f:
         try:
-            obj = json.load(f)
+            obj = json_loads(f.read())
         except json.JSONDecodeError as e:
             return False, [f"Invalid JSON: {e}"]
 
-    try:
-        Draft202012Validator(schema).validate(obj)
-        return True, []
-    except jsonschema.ValidationError as e:
-        return False, [f"Validation error: {e.message}"]
+    errors = schema_errors(obj, validator)
+    return len(errors) == 0, errors
+
+
+def validate_file(file_path: Path, schema_name: str) -> Tuple[bool, List[str]]:
+    """Validate a JSONL or JSON file according to its suffix."""
+    if file_path.suffix == ".jsonl":
+        return validate_jsonl_file(file_path, schema_name)
+    return validate_json_file(file_path, schema_name)
 
 
 def detect_schema_type(file_path: Path) -> str:
@@ -102,38 +188,145 @@ def detect_schema_type(file_path: Path) -> str:
         raise ValueError(f"Cannot detect schema type for: {name}")
 
 
-def validate_directory(dir_path: Path) -> Tuple[int, int]:
-    """Validate all files in a review directory."""
-    total = 0
-    passed = 0
+@lru_cache(maxsize=None)
+def schema_hash(schema_name: str) -> str:
+    """sha256 of the schema file, so manifest entries expire when a schema changes."""
+    return hashlib.sha256((SCHEMA_DIR / SCHEMA_MAPPING[schema_name]).read_bytes()).hexdigest()
+
+
+def file_hash(file_path: Path) -> str:
+    return hashlib.sha256(file_path.read_bytes()).hexdigest()
+
+
+def manifest_entry(sha256: str, schema_name: str) -> dict:
+    """What a passed file is recorded as; any difference on a later run re-validates it.
 
-    for file_path in sorted(dir_path.glob("*.jsonl")) + sorted(dir_path.glob("*.json")):
+    Content only: identical bytes cannot start failing, so a checkout or touch
+    that changes mtime alone does not re-validate.
+    """
+    return {"sha256": sha256, "schema": schema_name, "schema_sha256": schema_hash(schema_name)}
+
+
+def load_manifest(manifest_path: Path) -> Dict[str, dict]:
+    """Previously passed files: resolved path → manifest_entry()."""
+    try:
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return manifest.get("passed", {}) if isinstance(manifest, dict) else {}
+
+
+def save_manifest(manifest_path: Path, passed: Dict[str, dict]) -> None:
+    """Write the manifest atomically, dropping entries for deleted files."""
+    passed = {key: entry for key, entry in sorted(passed.items()) if Path(key).exists()}
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=manifest_path.parent, prefix=".manifest-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump({"version": 1, "passed": passed}, f, indent=1)
+        os.replace(tmp, manifest_path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def find_targets(dir_path: Path, recursive: bool = False, out=sys.stdout) -> List[Tuple[Path, str]]:
+    """Schema-validatable files under dir_path, paired with their schema name."""
+    pattern = "**/*" if recursive else "*"
+    targets = []
+    for file_path in (
+        sorted(dir_path.glob(pattern + ".jsonl")) + sorted(dir_path.glob(pattern + ".json"))
+    ):
         # Skip markdown files
-        if file_path.suffix == ".md":
+        if file_path.suffix == ".md" or not file_path.is_file():
             continue
 
         try:
             schema_name = detect_schema_type(file_path)
         except ValueError as e:
-            print(f"⚠️  SKIP {file_path.name}: {e}")
+            print(f"⚠️  SKIP {file_path.relative_to(dir_path)}: {e}", file=out)
             continue
 
-        total += 1
-
-        if file_path.suffix == ".jsonl":
-            valid, errors = validate_jsonl_file(file_path, schema_name)
+        targets.append((file_path, schema_name))
+    return targets
+
+
+def validate_directory(
+    dir_path: Path,
+    jobs: int = 1,
+    recursive: bool = False,
+    manifest_path: Path | None = None,
+    out=sys.stdout,
+) -> Tuple[int, int, List[dict]]:
+    """Validate all files in a review directory (or, recursively, a review tree).
+
+    With jobs > 1, files are validated in parallel worker processes (each
+    compiles its validators once); results are printed in file order.
+
+    With a manifest, files whose content hash and schema hash match an earlier
+    pass are not re-validated, and newly passing files are recorded. The
+    manifest is saved even if the run is interrupted, so a rerun resumes.
+
+    Returns (total, passed, per-file results).
+    """
+    targets = find_targets(dir_path, recursive, out)
+    passed_manifest = load_manifest(manifest_path) if manifest_path else {}
+
+    results: List[dict] = []
+    pending = []
+    for file_path, schema_name in targets:
+        result = {
+            "path": file_path.relative_to(dir_path).as_posix(),
+            "schema": schema_name,
+            "sha256": file_hash(file_path),
+        }
+        results.append(result)
+        entry = passed_manifest.get(str(file_path.resolve()))
+        if entry == manifest_entry(result["sha256"], schema_name):
+            result.update(status="pass", cached=True, errors=[])
         else:
-            valid, errors = validate_json_file(file_path, schema_name)
+            pending.append((file_path, result))
 
+    def record(file_path: Path, result: dict, outcome: Tuple[bool, List[str]]) -> None:
+        valid, errors = outcome
+        result.update(status="pass" if valid else "fail", cached=False, errors=errors)
+        key = str(file_path.resolve())
         if valid:
-            print(f"✅ PASS {file_path.name} ({schema_name})")
+            passed_manifest[key] = manifest_entry(result["sha256"], result["schema"])
+        else:
+            passed_manifest.pop(key, None)
+
+    paths = [file_path for file_path, _ in pending]
+    schema_names = [result["schema"] for _, result in pending]
+    try:
+        if jobs > 1 and len(pending) > 1:
+            with ProcessPoolExecutor(max_workers=min(jobs, len(pending))) as pool:
+                for (file_path, result), outcome in zip(
+                    pending, pool.map(validate_file, paths, schema_names)
+                ):
+                    record(file_path, result, outcome)
+        else:
+            for (file_path, result), outcome in zip(
+                pending, map(validate_file, paths, schema_names)
+            ):
+                record(file_path, result, outcome)
+    finally:
+        if manifest_path:
+            save_manifest(manifest_path, passed_manifest)
+
+    passed = 0
+    for result in results:
+        label = f"{result['path']} ({result['schema']}{', cached' if result['cached'] else ''})"
+        if result["status"] == "pass":
+            print(f"✅ PASS {label}", file=out)
             passed += 1
         else:
-            print(f"❌ FAIL {file_path.name} ({schema_name})")
-            for error in errors:
-                print(f"   {error}")
+            print(f"❌ FAIL {label}", file=out)
+            for error in result["errors"]:
+                print(f"   {error}", file=out)
 
-    return total, passed
+    return len(results), passed, results
 
 
 def main():
@@ -141,6 +334,26 @@ def main():
     parser.add_argument("path", help="Directory or file to validate")
     parser.add_argument("--file", action="store_true", help="Treat path as single file")
     parser.add_argument("--schema", choices=SCHEMA_MAPPING.keys(), help="Schema type (for single file)")
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=1,
+        help="Validate directory files in N parallel processes (0 = one per CPU)",
+    )
+    parser.add_argument(
+        "--recursive", "-r", action="store_true",
+        help="Walk the whole directory tree; skip files that passed unchanged before",
+    )
+    parser.add_argument(
+        "--manifest", type=Path, default=DEFAULT_MANIFEST,
+        help=f"Passed-file manifest for --recursive (default: {DEFAULT_MANIFEST.name})",
+    )
+    parser.add_argument(
+        "--no-manifest", action="store_true",
+        help="Re-validate every file and leave the manifest untouched",
+    )
+    parser.add_argument(
+        "--json-summary", metavar="PATH",
+        help="Write a JSON summary of the directory run to PATH ('-' for stdout)",
+    )
 
     args = parser.parse_args()
     path = Path(args.path)
@@ -153,10 +366,7 @@ def main():
         # Single file validation
         schema_name = args.schema or detect_schema_type(path)
 
-        if path.suffix == ".jsonl":
-            valid, errors = validate_jsonl_file(path, schema_name)
-        else:
-            valid, errors = validate_json_file(path, schema_name)
+        valid, errors = validate_file(path, schema_name)
 
         if valid:
             print(f"✅ PASS {path.name} ({schema_name})")
@@ -172,12 +382,34 @@ def main():
             print(f"Error: Not a directory: {path}")
             sys.exit(1)
 
-        print(f"Validating directory: {path}\n")
-        total, passed = validate_directory(path)
-
-        print(f"\n{'='*60}")
-        print(f"Results: {passed}/{total} files passed")
-        print(f"{'='*60}")
+        # With the JSON summary on stdout, human-readable output goes to stderr.
+        out = sys.stderr if args.json_summary == "-" else sys.stdout
+        print(f"Validating directory: {path}\n", file=out)
+        jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+        manifest_path = args.manifest if args.recursive and not args.no_manifest else None
+        total, passed, results = validate_directory(
+            path, jobs=jobs, recursive=args.recursive, manifest_path=manifest_path, out=out,
+        )
+
+        print(f"\n{'='*60}", file=out)
+        print(f"Results: {passed}/{total} files passed", file=out)
+        print(f"{'='*60}", file=out)
+
+        if args.json_summary:
+            summary = {
+                "root": str(path),
+                "total": total,
+                "passed": passed,
+                "failed": total - passed,
+                "cached": sum(1 for result in results if result["cached"]),
+                "files": results,
+            }
+            if args.json_summary == "-":
+                json.dump(summary, sys.stdout, indent=2)
+                print()
+            else:
+                with open(args.json_summary, "w") as f:
+                    json.dump(summary, f, indent=2)
 
         sys.exit(0 if passed == total else 1)
 
@@ -13,6 +13,11 @@ from datetime import datetime
 from pathlib import Path
 from flask import Flask, render_template, request, jsonify
 
+try:
+    from evals.utils.json_codec import loads as json_loads
+except ImportError:  # UI venv without the evals package installed
+    json_loads = json.loads
+
 app = Flask(__name__)
 
 # Configuration
@@ -35,7 +40,7 @@ def load_findings():
     with open(INPUT_FILE, 'r') as f:
         for line in f:
             if line.strip():
-                finding = json.loads(line)
+                finding = json_loads(line)
                 if finding.get('severity') == 'Critical':
                     findings.append(finding)
 
@@ -51,7 +56,7 @@ def load_validated_findings():
     with open(OUTPUT_FILE, 'r') as f:
         for line in f:
             if line.strip():
-                finding = json.loads(line)
+                finding = json_loads(line)
                 validated[finding['id']] = finding
 
     return validated
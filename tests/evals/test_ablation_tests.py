@@ -0,0 +1,64 @@
+"""Tests for the ablation matrix — variant specs, prompt dedup, and the per-sample system prompt."""
+import pytest
+from inspect_ai import eval as inspect_eval
+from inspect_ai.model import ModelOutput, ModelUsage, get_model
+
+from evals.ablation_tests import (
+    CONTROL, DEFAULT_SOURCE, ablation_matrix, ablation_variants, load_source, normalise_ablations,
+)
+
+SKILL = "# Skill\n\n## Personas\nAssume Hunter\n\n## Verdict Logic\nIf critical...\n\n## Examples\nOne"
+
+
+def test_normalise_ablations_accepts_dict_or_header_list():
+    assert normalise_ablations(["## Verdict Logic", "**Voice rules:**"]) == {
+        "no_verdict_logic": ("## Verdict Logic",), "no_voice_rules": ("**Voice rules:**",),
+    }
+    assert normalise_ablations({"both": ["## Personas", "## Examples"], "one": "## Examples"}) == {
+        "both": ("## Personas", "## Examples"), "one": ("## Examples",),
+    }
+    with pytest.raises(ValueError):
+        normalise_ablations({CONTROL: ["## Personas"]})
+    with pytest.raises(ValueError):
+        normalise_ablations({"empty": []})
+
+
+def test_identical_variant_prompts_are_deduplicated():
+    unique = ablation_variants(SKILL, normalise_ablations({
+        "no_personas": ["## Personas"],
+        "no_personas_again": ["## Personas", "## Personas"],
+        "missing": ["## Synthesis"],
+        "combo": ["## Personas", "## Examples"],
+    }))
+    groups = [variant["variants"] for variant in unique.values()]
+    assert groups == [[CONTROL, "missing"], ["no_personas", "no_personas_again"], ["combo"]]
+    combo = next(v["prompt"] for v in unique.values() if v["variants"] == ["combo"])
+    assert "Assume Hunter" not in combo and "One" not in combo and "If critical" in combo
+
+
+def test_default_ablations_each_drop_a_real_section():
+    unique = ablation_variants(load_source(DEFAULT_SOURCE), normalise_ablations(None))
+    assert [variant["variants"] for variant in unique.values()] == [
+        [CONTROL], ["no_process"], ["no_examples"], ["no_limitations"],
+    ]
+
+
+def test_load_source_rejects_unknown_kind():
+    assert "Scope Guardian" in load_source("agent:scope-guardian")
+    with pytest.raises(ValueError):
+        load_source("requirements")
+
+
+def test_ablation_matrix_runs_each_unique_prompt_once(tmp_path):
+    task = ablation_matrix(ablations={"no_process": ["## Process"], "missing": ["## Personas"]})
+    assert [sample.id for sample in task.dataset] == [CONTROL, "no_process"]
+    assert task.dataset[0].metadata["ablations"] == [CONTROL, "missing"]
+
+    output = ModelOutput.from_content("mockllm/model", "")
+    output.usage = ModelUsage(input_tokens=10, output_tokens=2, total_tokens=12)
+    model = get_model("mockllm/model", custom_outputs=[output, output])
+    log, = inspect_eval(task, model=model, log_dir=str(tmp_path), display="none")
+    assert log.status == "success"
+    prompts = {sample.id: sample.messages[0].text for sample in log.samples}
+    assert "## Process" in prompts[CONTROL]
+    assert "## Process" not in prompts["no_process"]
@@ -39,3 +39,21 @@ def test_scope_guardian_eval_instantiates():
 def test_success_validator_eval_instantiates():
     task = success_validator_eval()
     assert isinstance(task, Task)
+
+
+def test_reviewer_suite_eval_has_one_sample_per_document():
+    from evals.reviewer_eval import reviewer_suite_eval
+
+    task = reviewer_suite_eval(reviewer="assumption-hunter")
+    assert isinstance(task, Task)
+    ids = [sample.id for sample in task.dataset]
+    assert len(ids) == len(set(ids)) >= 1
+    assert all("doc_content" not in sample.metadata for sample in task.dataset)
+
+
+def test_agent_eval_falls_back_to_full_ground_truth_for_unlisted_agent():
+    from evals.reviewer_eval import agent_eval
+
+    filtered = agent_eval(agent="assumption-hunter")
+    unfiltered = agent_eval(agent="edge-case-prober")
+    assert len(filtered.dataset[0].target) < len(unfiltered.dataset[0].target)
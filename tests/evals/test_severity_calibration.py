@@ -52,3 +52,11 @@ def test_drop_section_does_not_remove_prefix_matched_sections():
     assert "other content" in result
     assert "## Verdict Logic" in result
     assert "## Personas\n" not in result
+
+
+def test_drop_section_removes_bold_label_block():
+    content = "Intro\n\n**Voice rules:**\n- Active voice.\n\n**Review process:**\n1. Read\n\n## Output\nJSONL"
+    result = drop_section(content, "**Voice rules:**")
+    assert "Active voice" not in result
+    assert "**Review process:**\n1. Read" in result
+    assert drop_section(content, "**Review process:**").endswith("## Output\nJSONL")
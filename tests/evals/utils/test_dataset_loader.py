@@ -1,9 +1,22 @@
 import json
+import os
 import pytest
 from pathlib import Path
 from inspect_ai.dataset import MemoryDataset
 
-from evals.utils.dataset_loader import load_validated_findings, count_by_severity
+from evals.utils import dataset_loader
+from evals.utils.dataset_loader import (
+    count_by_severity,
+    discover_datasets,
+    document_reference,
+    iter_document_samples,
+    load_document,
+    load_document_suite,
+    load_parsed_dataset,
+    load_validated_findings,
+    read_document,
+    sample_document,
+)
 
 
 FIXTURES = Path("tests/fixtures")
@@ -373,3 +386,159 @@ def test_load_validated_findings_repo_relative_path_still_works(tmp_path):
 
     dataset = load_validated_findings(str(tmp_path))
     assert "# Legacy Doc" in dataset[0].input
+
+
+# ── Process-level dataset cache ──────────────────────────────────────────────
+
+def _write_reviewer_dataset(base: Path) -> None:
+    doc = base / "doc.md"
+    doc.write_text("# Doc")
+    findings = [
+        {"type": "finding", "id": "f-001", "title": "A", "severity": "Critical",
+         "validation_status": "real_flaw", "reviewer": "assumption-hunter"},
+        {"type": "finding", "id": "f-002", "title": "B", "severity": "Important",
+         "validation_status": "real_flaw", "reviewer": "scope-guardian"},
+    ]
+    metadata = {"source_review": "test", "design_doc_path": "doc.md"}
+    (base / "critical_findings.jsonl").write_text("\n".join(json.dumps(f) for f in findings) + "\n")
+    (base / "metadata.json").write_text(json.dumps(metadata))
+
+
+def test_dataset_parsed_once_across_reviewer_views(tmp_path, monkeypatch):
+    from evals.utils import dataset_loader
+
+    _write_reviewer_dataset(tmp_path)
+    calls = []
+    real_read_jsonl = dataset_loader.read_jsonl
+    monkeypatch.setattr(
+        dataset_loader, "read_jsonl", lambda path: calls.append(path) or real_read_jsonl(path)
+    )
+
+    full = load_validated_findings(str(tmp_path))
+    hunter = load_validated_findings(str(tmp_path), reviewer_filter="assumption-hunter")
+    guardian = load_validated_findings(str(tmp_path), reviewer_filter="scope-guardian")
+
+    assert len(calls) == 1
+    assert full[0].target == ["f-001", "f-002"]
+    assert hunter[0].target == ["f-001"]
+    assert guardian[0].metadata["severity_distribution"]["Important"] == 1
+
+
+def test_dataset_cache_reloads_when_files_change(tmp_path):
+    _write_reviewer_dataset(tmp_path)
+    assert load_validated_findings(str(tmp_path))[0].input == "# Doc"
+
+    doc = tmp_path / "doc.md"
+    doc.write_text("# Revised doc")
+    st = doc.stat()
+    os.utime(doc, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert load_validated_findings(str(tmp_path))[0].input == "# Revised doc"
+
+
+def test_dataset_views_do_not_share_finding_lists(tmp_path):
+    _write_reviewer_dataset(tmp_path)
+    first = load_validated_findings(str(tmp_path))[0].metadata["expected_findings"]
+    first.clear()
+    assert len(load_validated_findings(str(tmp_path))[0].metadata["expected_findings"]) == 2
+
+
+# ── Multi-document loader ────────────────────────────────────────────────────
+
+def _write_named_dataset(root: Path, name: str, doc_text: str, reviewer: str = "assumption-hunter") -> Path:
+    base = root / name
+    base.mkdir(parents=True)
+    (base / "doc.md").write_text(doc_text)
+    finding = {"type": "finding", "id": f"{name}-001", "title": "T", "severity": "Critical",
+               "validation_status": "real_flaw", "reviewer": reviewer}
+    (base / "critical_findings.jsonl").write_text(json.dumps(finding) + "\n")
+    (base / "metadata.json").write_text(json.dumps({"source_review": name, "design_doc_path": "doc.md"}))
+    return base
+
+
+def test_discover_datasets_finds_nested_dataset_dirs(tmp_path):
+    _write_named_dataset(tmp_path, "a", "# A")
+    _write_named_dataset(tmp_path / "group", "b", "# B")
+    (tmp_path / "notes").mkdir()
+    assert [p.name for p in discover_datasets(tmp_path)] == ["a", "b"]
+
+
+def test_document_suite_one_sample_per_document_referenced_by_hash(tmp_path):
+    _write_named_dataset(tmp_path, "a", "# A")
+    _write_named_dataset(tmp_path, "b", "# B")
+    dataset = load_document_suite(tmp_path)
+
+    assert [s.id for s in dataset] == ["a", "b"]
+    for sample, text in zip(dataset, ["# A", "# B"]):
+        assert "doc_content" not in sample.metadata
+        assert sample.input == document_reference(sample.metadata["doc_hash"])
+        assert read_document(sample.metadata["doc_hash"]) == text
+        assert sample_document(sample.metadata, sample.input) == text
+
+
+def test_document_suite_never_holds_document_text(tmp_path, monkeypatch):
+    _write_named_dataset(tmp_path, "a", "# A")
+    load_parsed_dataset(tmp_path / "a")  # parse (and hash) once, as a warm worker would
+
+    def no_reads(doc_hash):
+        raise AssertionError("document read while building samples")
+
+    monkeypatch.setattr(dataset_loader, "read_document", no_reads)
+    sample, = load_document_suite(tmp_path)
+    assert "# A" not in sample.input
+
+
+def test_load_document_solver_reads_text_per_sample(tmp_path):
+    from inspect_ai import Task, eval as inspect_eval
+    from inspect_ai.model import ModelOutput, ModelUsage, get_model
+    from inspect_ai.solver import generate
+
+    _write_named_dataset(tmp_path / "datasets", "a", "# Design A")
+    output = ModelOutput.from_content("mockllm/model", "")
+    output.usage = ModelUsage(input_tokens=1, output_tokens=1, total_tokens=2)
+    log, = inspect_eval(
+        Task(dataset=load_document_suite(tmp_path / "datasets"), solver=[load_document(), generate()]),
+        model=get_model("mockllm/model", custom_outputs=[output]),
+        log_dir=str(tmp_path / "logs"), display="none",
+    )
+    assert log.status == "success"
+    assert log.samples[0].messages[0].text == "# Design A"
+
+
+def test_sample_document_reregisters_from_doc_path(tmp_path):
+    _write_named_dataset(tmp_path, "a", "# A")
+    sample, = load_document_suite(tmp_path)
+    dataset_loader._DOCUMENTS.clear()  # a fresh process, e.g. tools/rescore.py
+    read_document.cache_clear()
+    assert sample_document(sample.metadata, sample.input) == "# A"
+    (tmp_path / "a" / "doc.md").write_text("# A, edited")
+    dataset_loader._DOCUMENTS.clear()
+    read_document.cache_clear()
+    with pytest.raises(KeyError):
+        sample_document(sample.metadata, sample.input)  # a reference is no fallback
+
+
+def test_document_suite_shards_partition_datasets(tmp_path):
+    for name in "abcde":
+        _write_named_dataset(tmp_path, name, f"# {name}")
+    shards = [[s.id for s in iter_document_samples(tmp_path, shard=i, num_shards=2)] for i in range(2)]
+    assert sorted(shards[0] + shards[1]) == list("abcde")
+    assert not set(shards[0]) & set(shards[1])
+    with pytest.raises(ValueError, match="shard"):
+        next(iter_document_samples(tmp_path, shard=2, num_shards=2))
+
+
+def test_document_suite_skips_datasets_without_reviewer_findings(tmp_path):
+    _write_named_dataset(tmp_path, "a", "# A", reviewer="assumption-hunter")
+    _write_named_dataset(tmp_path, "b", "# B", reviewer="scope-guardian")
+    assert [s.id for s in load_document_suite(tmp_path, reviewer_filter="scope-guardian")] == ["b"]
+    with pytest.raises(ValueError, match="No datasets"):
+        load_document_suite(tmp_path, reviewer_filter="problem-framer")
+
+
+def test_sample_document_falls_back_to_input_for_unknown_hash():
+    assert sample_document({"doc_hash": "0" * 64}, input_text="# Doc") == "# Doc"
+    with pytest.raises(KeyError):
+        sample_document({"doc_hash": "0" * 64})
+    with pytest.raises(KeyError):
+        sample_document({})
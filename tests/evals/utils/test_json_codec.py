@@ -0,0 +1,48 @@
+"""Tests for json_codec — backend parity, error type, typed finding decoder."""
+import json
+
+import pytest
+
+from evals.utils import json_codec
+
+FINDING_LINE = (
+    '{"type": "finding", "id": "v1-test-001", "title": "T\\u00e9st", "severity": "Critical", '
+    '"confidence": 85, "phase": {"primary": "design", "contributing": null}, '
+    '"section": "S", "issue": "I", "why_it_matters": "W", "suggestion": "Fix"}'
+)
+
+
+@pytest.mark.parametrize("backend", json_codec._available_backends())
+def test_backends_decode_identically(backend):
+    loads = json_codec.loads_with(backend)
+    assert loads(FINDING_LINE) == json.loads(FINDING_LINE)
+    assert loads(FINDING_LINE.encode()) == json.loads(FINDING_LINE)
+
+
+@pytest.mark.parametrize("backend", json_codec._available_backends())
+def test_backends_raise_json_decode_error(backend):
+    loads = json_codec.loads_with(backend)
+    for bad in ("not json", '{"type": "finding", "id": "trunc'):
+        with pytest.raises(json.JSONDecodeError):
+            loads(bad)
+
+
+def test_unknown_backend_rejected():
+    with pytest.raises(ValueError, match="not available"):
+        json_codec.select_backend("simdjson")
+
+
+def test_default_backend_is_fastest_installed():
+    assert json_codec.select_backend() == json_codec._available_backends()[0]
+    assert json_codec.select_backend("json") == "json"
+
+
+def test_finding_decoder_produces_typed_records():
+    decode = json_codec.finding_decoder()
+    if decode is None:
+        pytest.skip("msgspec not installed")
+    record = decode(FINDING_LINE)
+    assert record.id == "v1-test-001"
+    assert record.title == "Tést"
+    assert record.confidence == 85
+    assert record.reviewer is None
@@ -1,5 +1,15 @@
+import asyncio
+
 import pytest
-from evals.utils.output_parser import parse_review_output, strip_fences
+from evals.utils.output_parser import (
+    ParseStats,
+    ReviewStreamParser,
+    aiter_review_findings,
+    iter_review_findings,
+    parse_review_output,
+    render_findings_compact,
+    strip_fences,
+)
 
 
 def test_parse_single_finding():
@@ -86,3 +96,80 @@ def test_strip_fences_unclosed_fence_preserves_content():
     unclosed = '```json\n{"type": "finding", "id": "v1-test-001"}'
     result = strip_fences(unclosed)
     assert '{"type": "finding", "id": "v1-test-001"}' in result
+
+
+# ── Streaming parser ─────────────────────────────────────────────────────────
+
+FINDING_LINE_A = '{"type": "finding", "id": "v1-test-001", "title": "A", "severity": "Critical"}'
+FINDING_LINE_B = '{"type": "finding", "id": "v1-test-002", "title": "B", "severity": "Important"}'
+
+
+def test_stream_parser_yields_finding_when_line_completes():
+    parser = ReviewStreamParser()
+    assert parser.feed(FINDING_LINE_A[:20]) == []
+    assert parser.feed(FINDING_LINE_A[20:]) == []  # line not terminated yet
+    findings = parser.feed("\n" + FINDING_LINE_B[:10])
+    assert [f["id"] for f in findings] == ["v1-test-001"]
+    assert [f["id"] for f in parser.feed(FINDING_LINE_B[10:]) + parser.close()] == ["v1-test-002"]
+
+
+def test_iter_review_findings_matches_whole_string_parse():
+    completion = "\n".join([
+        "Here are my findings:",
+        "```json",
+        FINDING_LINE_A,
+        '{"type": "blind_spot_check", "content": "ok"}',
+        FINDING_LINE_B,
+        "```",
+    ])
+    for size in (1, 3, 17, len(completion)):
+        chunks = [completion[i:i + size] for i in range(0, len(completion), size)]
+        assert list(iter_review_findings(chunks)) == parse_review_output(completion)
+
+
+def test_iter_review_findings_applies_severity_filter_inline():
+    chunks = [FINDING_LINE_A + "\n", FINDING_LINE_B + "\n"]
+    findings = list(iter_review_findings(chunks, severity_filter="Important"))
+    assert [f["id"] for f in findings] == ["v1-test-002"]
+
+
+def test_parse_stats_counts_skipped_lines():
+    completion = "\n".join([
+        "```json", "preamble prose", FINDING_LINE_A, "[1, 2]",
+        '{"type": "blind_spot_check"}', '{"type": "finding", "id": "trunc', "```",
+    ])
+    stats = ParseStats()
+    findings = parse_review_output(completion, stats=stats)
+    assert len(findings) == 1
+    assert stats.as_dict() == {
+        "lines": 7, "fences": 2, "malformed": 3, "filtered": 1, "findings": 1,
+    }
+
+
+def test_stream_parser_handles_crlf_split_across_chunks():
+    chunks = [FINDING_LINE_A + "\r", "\n" + FINDING_LINE_B + "\r\n"]
+    assert len(list(iter_review_findings(chunks))) == 2
+
+
+def test_aiter_review_findings_consumes_async_stream():
+    async def stream():
+        for piece in (FINDING_LINE_A[:30], FINDING_LINE_A[30:] + "\n", FINDING_LINE_B):
+            yield piece
+
+    async def collect():
+        return [f["id"] async for f in aiter_review_findings(stream())]
+
+    assert asyncio.run(collect()) == ["v1-test-001", "v1-test-002"]
+
+
+def test_render_findings_compact_keeps_only_judge_fields():
+    findings = parse_review_output(
+        "Preamble.\n```\n"
+        '{"type": "finding", "id": "x-1", "title": "T1", "issue": "I1", "section": "S", "severity": "Critical"}\n'
+        '{"type": "finding", "id": "x-2", "title": "T2", "issue": "I2", "suggestion": "Fix it"}\n'
+        "```"
+    )
+    assert render_findings_compact(findings) == (
+        '{"title":"T1","issue":"I1","section":"S"}\n{"title":"T2","issue":"I2"}'
+    )
+    assert render_findings_compact([]) == ""
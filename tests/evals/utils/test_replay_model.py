@@ -0,0 +1,155 @@
+"""Tests for replay_model — request keys, the SQLite store, record/replay modes."""
+import asyncio
+import json
+import sqlite3
+import zlib
+
+import pytest
+from inspect_ai import Task, eval as inspect_eval
+from inspect_ai.dataset import Sample
+from inspect_ai.model import (
+    ChatMessageSystem, ChatMessageUser, GenerateConfig, ModelOutput, ModelUsage, get_model,
+)
+from inspect_ai.solver import generate
+
+from evals.utils.replay_model import (
+    ReplayMissError, ReplayStore, replay_model_name, request_key,
+)
+from scorers.severity_scorer import severity_calibration
+
+
+def recorded_output(text: str) -> ModelOutput:
+    output = ModelOutput.from_content("mockllm/model", text)
+    output.usage = ModelUsage(input_tokens=10, output_tokens=2, total_tokens=12)
+    return output
+
+
+def key_for(text: str, config: GenerateConfig = GenerateConfig()) -> str:
+    messages = [ChatMessageSystem(content="judge"), ChatMessageUser(content=text)]
+    return request_key("anthropic/claude-haiku-4-5", messages, [], "auto", config)
+
+
+def test_request_key_ignores_message_ids_and_transport_settings():
+    assert key_for("finding") == key_for("finding")  # fresh message ids each call
+    assert key_for("finding") == key_for("finding", GenerateConfig(max_retries=3, timeout=60))
+    assert key_for("finding") != key_for("other finding")
+    assert key_for("finding") != key_for("finding", GenerateConfig(max_tokens=150))
+
+
+def test_store_round_trips_outputs(tmp_path):
+    store = ReplayStore(tmp_path / "store.sqlite")
+    assert store.get("k") is None
+    store.put("k", "mockllm/model", recorded_output("YES"))
+    store.put("k", "mockllm/model", recorded_output("NO"), epoch=2)
+    assert store.get("k").completion == "YES"
+    assert store.get("k", epoch=2).completion == "NO"
+    assert store.get("k", epoch=3) is None
+    assert store.get("k").usage.input_tokens == 10
+    assert len(store) == 2
+    store.close()
+
+
+def test_store_keeps_unversioned_recordings_as_epoch_one(tmp_path):
+    path = tmp_path / "store.sqlite"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE responses (key TEXT PRIMARY KEY, model TEXT NOT NULL, output BLOB NOT NULL)")
+    blob = zlib.compress(recorded_output("YES").model_dump_json(exclude_none=True).encode("utf-8"))
+    conn.execute("INSERT INTO responses VALUES (?, ?, ?)", ("k", "mockllm/model", blob))
+    conn.commit()
+    conn.close()
+
+    store = ReplayStore(path)
+    assert store.get("k", epoch=1).completion == "YES"
+    store.put("k", "mockllm/model", recorded_output("NO"), epoch=2)
+    assert len(store) == 2
+    store.close()
+
+
+def test_record_then_replay_without_wrapped_model(tmp_path):
+    store = str(tmp_path / "store.sqlite")
+    recorder = get_model("replay/mockllm/model", mode="record", store=store,
+                         custom_outputs=[recorded_output("YES — genuine")])
+    assert asyncio.run(recorder.generate("is this genuine?")).completion == "YES — genuine"
+
+    # custom_outputs is gone, so any call to the wrapped mock would fail.
+    replayer = get_model("replay/mockllm/model", mode="replay", store=store)
+    replayed = asyncio.run(replayer.generate("is this genuine?"))
+    assert replayed.completion == "YES — genuine"
+    assert replayed.usage.output_tokens == 2
+    assert replayer.api._wrapped is None
+
+    with pytest.raises(ReplayMissError):
+        asyncio.run(replayer.generate("a request that was never recorded"))
+
+
+def test_auto_mode_records_only_misses(tmp_path):
+    store = str(tmp_path / "store.sqlite")
+    model = get_model("replay/mockllm/model", mode="auto", store=store,
+                      custom_outputs=[recorded_output("first")])
+    assert asyncio.run(model.generate("q")).completion == "first"
+    assert asyncio.run(model.generate("q")).completion == "first"  # served from the store
+
+
+def test_replay_model_name_follows_env(monkeypatch):
+    monkeypatch.delenv("PARALLAX_REPLAY", raising=False)
+    assert replay_model_name("anthropic/claude-haiku-4-5") == "anthropic/claude-haiku-4-5"
+    monkeypatch.setenv("PARALLAX_REPLAY", "replay")
+    assert replay_model_name("anthropic/claude-haiku-4-5") == "replay/anthropic/claude-haiku-4-5"
+    assert replay_model_name("replay/anthropic/claude-haiku-4-5") == "replay/anthropic/claude-haiku-4-5"
+    monkeypatch.setenv("PARALLAX_REPLAY", "sometimes")
+    with pytest.raises(ValueError):
+        replay_model_name("anthropic/claude-haiku-4-5")
+
+
+def test_eval_pipeline_replays_offline(tmp_path, monkeypatch):
+    monkeypatch.setenv("PARALLAX_REPLAY_STORE", str(tmp_path / "default-store.sqlite"))
+    finding = {"type": "finding", "id": "a", "title": "Cache latency assumption unstated",
+               "severity": "Critical", "issue": "x", "section": "s"}
+    expected = [{"id": "e1", "title": "Cache latency assumption unstated", "severity": "Critical"}]
+
+    def task() -> Task:
+        return Task(
+            dataset=[Sample(input="design doc", id="doc", metadata={"expected_findings": expected})],
+            solver=generate(),
+            scorer=severity_calibration(),
+        )
+
+    store = str(tmp_path / "store.sqlite")
+    recorder = get_model("replay/mockllm/model", mode="record", store=store,
+                         custom_outputs=[recorded_output(json.dumps(finding))])
+    replayer = get_model("replay/mockllm/model", mode="replay", store=store)
+    recorded, = inspect_eval(task(), model=recorder, log_dir=str(tmp_path / "logs"), display="none")
+    replayed, = inspect_eval(task(), model=replayer, log_dir=str(tmp_path / "logs"), display="none")
+    assert replayed.status == "success"
+    assert replayed.samples[0].output.completion == recorded.samples[0].output.completion
+    assert replayed.results.scores[0].metrics["accuracy"].value == 1.0
+    assert not (tmp_path / "default-store.sqlite").exists()
+
+
+def test_store_opens_on_first_generate(tmp_path, monkeypatch):
+    monkeypatch.setenv("PARALLAX_REPLAY_STORE", str(tmp_path / "store.sqlite"))
+    model = get_model("replay/mockllm/model", mode="auto", custom_outputs=[recorded_output("first")])
+    assert not (tmp_path / "store.sqlite").exists()
+    asyncio.run(model.generate("q"))
+    assert model.api.store.path == (tmp_path / "store.sqlite").resolve()
+    assert len(model.api.store) == 1
+
+
+def test_eval_pipeline_replays_every_epoch(tmp_path, monkeypatch):
+    monkeypatch.setenv("PARALLAX_REPLAY_STORE", str(tmp_path / "store.sqlite"))
+
+    def task() -> Task:
+        return Task(dataset=[Sample(input="design doc", id="doc")], solver=generate(), epochs=3)
+
+    recorder = get_model("replay/mockllm/model", mode="record",
+                         custom_outputs=[recorded_output(f"epoch output {i}") for i in range(3)])
+    replayer = get_model("replay/mockllm/model", mode="replay")
+    recorded, = inspect_eval(task(), model=recorder, log_dir=str(tmp_path / "logs"), display="none")
+    replayed, = inspect_eval(task(), model=replayer, log_dir=str(tmp_path / "logs"), display="none")
+
+    def by_epoch(log) -> dict[int, str]:
+        return {sample.epoch: sample.output.completion for sample in log.samples}
+
+    assert replayed.status == "success"
+    assert len(set(by_epoch(recorded).values())) == 3
+    assert by_epoch(replayed) == by_epoch(recorded)
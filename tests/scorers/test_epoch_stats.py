@@ -0,0 +1,101 @@
+"""Tests for epoch_stats — epoch reduction, min_recall enforcement, bootstrap CIs, paired tests."""
+import math
+
+import pytest
+from inspect_ai.scorer import SampleScore, Score
+
+from scorers.epoch_stats import (
+    bootstrap_ci, bootstrap_mean_ci, min_recall_met, paired_permutation_test, reviewer_epochs,
+)
+
+
+def recall_score(found: list[bool], min_recall: float = 0.8) -> Score:
+    find_results = [
+        {"must_find_id": f"mf-{i}", "must_find_title": f"Flaw {i}", "found": hit, "min_recall": min_recall}
+        for i, hit in enumerate(found)
+    ]
+    recall = sum(found) / len(found)
+    return Score(value=recall, metadata={"recall": recall, "find_results": find_results})
+
+
+def test_reducer_means_epochs_and_keeps_values():
+    reduced = reviewer_epochs()([Score(value=v, metadata={"precision": v}) for v in (1.0, 0.5, 0.75)])
+    assert reduced.value == pytest.approx(0.75)
+    assert reduced.metadata["epoch_values"] == [1.0, 0.5, 0.75]
+    assert reduced.metadata["precision"] == pytest.approx(0.75)
+    assert reduced.metadata["ci_lower"] <= 0.75 <= reduced.metadata["ci_upper"]
+
+
+def test_reducer_enforces_min_recall_from_three_epochs():
+    # mf-0 found 3/3, mf-1 found 1/3 — below min_recall 0.8
+    epochs = [recall_score([True, True]), recall_score([True, False]), recall_score([True, False])]
+    reduced = reviewer_epochs()(epochs)
+    rates = {r["must_find_id"]: r for r in reduced.metadata["must_find_rates"]}
+    assert rates["mf-0"]["hit_rate"] == 1.0 and rates["mf-0"]["meets_min_recall"] is True
+    assert rates["mf-1"]["hit_rate"] == pytest.approx(1 / 3)
+    assert rates["mf-1"]["meets_min_recall"] is False
+    assert reduced.metadata["min_recall_met"] is False
+    assert "Flaw 1" in reduced.explanation
+
+
+def test_reducer_does_not_enforce_min_recall_on_single_epoch():
+    reduced = reviewer_epochs()([recall_score([True, False])])
+    assert reduced.metadata["min_recall_met"] is None
+    assert reduced.metadata["ci_lower"] == reduced.metadata["ci_upper"] == 0.5
+
+
+def test_reducer_all_unscored_is_nan():
+    assert math.isnan(reviewer_epochs()([Score(value=math.nan)]).value)
+
+
+def test_bootstrap_ci_contains_mean_and_narrows_with_more_epochs():
+    few = bootstrap_mean_ci([[0.0, 1.0, 0.5, 1.0]])
+    many = bootstrap_mean_ci([[0.0, 1.0, 0.5, 1.0] * 10])
+    assert few[0] <= 0.625 <= few[1]
+    assert (many[1] - many[0]) < (few[1] - few[0])
+    assert bootstrap_mean_ci([]) is None
+    assert bootstrap_mean_ci([[0.4], [0.4]]) == (0.4, 0.4)
+
+
+def test_bootstrap_ci_metric_uses_epoch_values():
+    scores = [
+        SampleScore(score=reviewer_epochs()([Score(value=v) for v in values]), sample_id=i)
+        for i, values in enumerate([[1.0, 0.8, 0.9], [0.4, 0.6, 0.5]])
+    ]
+    ci = bootstrap_ci()(scores)
+    assert ci["ci_lower"] < 0.7 < ci["ci_upper"]
+
+
+def test_min_recall_met_metric_skips_samples_without_verdict():
+    met = reviewer_epochs()([recall_score([True])] * 3)
+    unmet = reviewer_epochs()([recall_score([False])] * 3)
+    single = reviewer_epochs()([recall_score([False])])
+    scores = [SampleScore(score=s, sample_id=i) for i, s in enumerate([met, unmet, single])]
+    assert min_recall_met()(scores) == {"min_recall_met": 0.5}
+    assert min_recall_met()(scores[2:]) == {}
+
+
+def test_reducer_ignores_checks_skipped_in_threshold_mode():
+    scores = [recall_score([True, True]) for _ in range(3)]
+    scores[0].metadata["find_results"][1].update(found=None, skipped=True)
+    rates = {r["must_find_id"]: r for r in reviewer_epochs()(scores).metadata["must_find_rates"]}
+    assert (rates["mf-1"]["found"], rates["mf-1"]["epochs"]) == (2, 2)
+    assert rates["mf-1"]["hit_rate"] == 1.0
+
+
+def test_paired_permutation_test_detects_consistent_drop():
+    pairs = [([0.9, 0.95, 0.9, 0.92, 0.9], [0.5, 0.55, 0.5, 0.52, 0.5]) for _ in range(3)]
+    delta, p_value = paired_permutation_test(pairs)
+    assert delta == pytest.approx(-0.4)
+    assert p_value < 0.01
+
+
+def test_paired_permutation_test_noise_is_not_significant():
+    pairs = [([0.6, 0.8, 0.7], [0.8, 0.6, 0.7]), ([0.5, 0.9], [0.9, 0.5])]
+    delta, p_value = paired_permutation_test(pairs)
+    assert delta == pytest.approx(0.0)
+    assert p_value > 0.5
+
+
+def test_paired_permutation_test_skips_unpaired_samples():
+    assert paired_permutation_test([([], [0.5]), ([0.5], [])]) is None
@@ -0,0 +1,170 @@
+"""Tests for judge_cache — content-addressed on-disk verdict cache."""
+import asyncio
+import os
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from scorers.judge_cache import (
+    CacheStats, JudgeCache, cached_verdict, content_hash, judge_cache_key,
+)
+from scorers.must_find_scorer import must_find_recall
+from scorers.reverse_judge_scorer import reverse_judge_precision
+
+
+def make_mock_model(response_text: str):
+    output = MagicMock()
+    output.completion = response_text
+    model = MagicMock()
+    model.generate = AsyncMock(return_value=output)
+    return model
+
+
+ACTUAL_JSONL = (
+    '{"type": "finding", "id": "problem-framer-001", '
+    '"title": "No success criteria defined", '
+    '"issue": "The document has no success criteria section.", '
+    '"severity": "Critical", "confidence": 85}'
+)
+
+MUST_FIND = {
+    "id": "mf-001",
+    "title": "No success criteria defined",
+    "issue": "The document has no success criteria section.",
+    "severity": "Critical",
+}
+
+
+# ── Key construction ─────────────────────────────────────────────────────────
+
+
+def test_cache_key_is_order_independent():
+    assert judge_cache_key(a="1", b="2") == judge_cache_key(b="2", a="1")
+
+
+def test_cache_key_changes_with_any_part():
+    base = judge_cache_key(judge="m", template="t", title="x", doc_hash="d")
+    assert base != judge_cache_key(judge="m2", template="t", title="x", doc_hash="d")
+    assert base != judge_cache_key(judge="m", template="t2", title="x", doc_hash="d")
+    assert base != judge_cache_key(judge="m", template="t", title="y", doc_hash="d")
+    assert base != judge_cache_key(judge="m", template="t", title="x", doc_hash="e")
+
+
+def test_content_hash_matches_sha256():
+    # Same algorithm as design_doc_hash in dataset metadata.json
+    assert content_hash("abc") == (
+        "ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad"
+    )
+
+
+# ── JudgeCache storage ───────────────────────────────────────────────────────
+
+
+def test_put_then_get_roundtrip(tmp_path):
+    cache = JudgeCache(tmp_path)
+    cache.put("ab" * 32, {"verdict": True, "reasoning": "ok"})
+    assert cache.get("ab" * 32) == {"verdict": True, "reasoning": "ok"}
+
+
+def test_get_missing_returns_none(tmp_path):
+    assert JudgeCache(tmp_path).get("cd" * 32) is None
+
+
+def test_expired_entry_is_a_miss(tmp_path):
+    cache = JudgeCache(tmp_path, max_age_s=60)
+    cache.put("ab" * 32, {"verdict": True, "reasoning": "ok"})
+    entry = cache._entry_path("ab" * 32)
+    old = time.time() - 120
+    os.utime(entry, (old, old))
+    assert cache.get("ab" * 32) is None
+    assert not entry.exists()
+
+
+def test_prune_evicts_oldest_over_size_budget(tmp_path):
+    cache = JudgeCache(tmp_path)
+    keys = [f"{i:02d}" * 32 for i in range(3)]
+    for i, key in enumerate(keys):
+        cache.put(key, {"verdict": True, "reasoning": "x" * 100})
+        stamp = time.time() - (10 - i)
+        os.utime(cache._entry_path(key), (stamp, stamp))
+    entry_size = cache._entry_path(keys[0]).stat().st_size
+
+    cache.max_bytes = entry_size * 2
+    assert cache.prune() == 1
+    assert cache.get(keys[0]) is None  # oldest evicted
+    assert cache.get(keys[2]) is not None
+
+
+def test_cached_verdict_counts_hits_and_misses(tmp_path):
+    cache = JudgeCache(tmp_path)
+    stats = CacheStats(enabled=True)
+    call = AsyncMock(return_value=(True, "GENUINE\nok"))
+
+    first = asyncio.run(cached_verdict(cache, "ef" * 32, call, stats))
+    second = asyncio.run(cached_verdict(cache, "ef" * 32, call, stats))
+
+    assert first == second == (True, "GENUINE\nok")
+    assert call.await_count == 1
+    assert (stats.hits, stats.misses) == (1, 1)
+
+
+# ── Scorer integration ───────────────────────────────────────────────────────
+
+
+def make_state(completion: str, metadata: dict):
+    state = MagicMock()
+    state.output.completion = completion
+    state.metadata = metadata
+    return state
+
+
+@patch("scorers.reverse_judge_scorer.get_model")
+def test_reverse_judge_second_run_served_from_cache(mock_get_model, tmp_path):
+    model = make_mock_model("GENUINE\nReal.")
+    mock_get_model.return_value = model
+    state = make_state(ACTUAL_JSONL, {"doc_content": "# Doc"})
+    score_fn = reverse_judge_precision(cache=True, cache_dir=str(tmp_path))
+
+    first = asyncio.run(score_fn(state, None))
+    second = asyncio.run(score_fn(state, None))
+
+    assert model.generate.await_count == 1
+    assert first.metadata["judge_cache"] == {"enabled": True, "hits": 0, "misses": 1}
+    assert second.metadata["judge_cache"] == {"enabled": True, "hits": 1, "misses": 0}
+    assert second.value == pytest.approx(1.0)
+
+
+@patch("scorers.reverse_judge_scorer.get_model")
+def test_reverse_judge_document_change_invalidates(mock_get_model, tmp_path):
+    model = make_mock_model("GENUINE\nReal.")
+    mock_get_model.return_value = model
+    score_fn = reverse_judge_precision(cache=True, cache_dir=str(tmp_path))
+
+    asyncio.run(score_fn(make_state(ACTUAL_JSONL, {"doc_content": "# Doc v1"}), None))
+    asyncio.run(score_fn(make_state(ACTUAL_JSONL, {"doc_content": "# Doc v2"}), None))
+
+    assert model.generate.await_count == 2
+
+
+@patch("scorers.reverse_judge_scorer.get_model")
+def test_reverse_judge_cache_disabled_by_default(mock_get_model):
+    mock_get_model.return_value = make_mock_model("GENUINE\nReal.")
+    state = make_state(ACTUAL_JSONL, {"doc_content": "# Doc"})
+    score = asyncio.run(reverse_judge_precision()(state, None))
+    assert score.metadata["judge_cache"] == {"enabled": False, "hits": 0, "misses": 0}
+
+
+@patch("scorers.must_find_scorer.get_model")
+def test_must_find_second_run_served_from_cache(mock_get_model, tmp_path):
+    model = make_mock_model("YES\nFound.")
+    mock_get_model.return_value = model
+    state = make_state(ACTUAL_JSONL, {"must_find_findings": [MUST_FIND]})
+    score_fn = must_find_recall(cache=True, cache_dir=str(tmp_path))
+
+    asyncio.run(score_fn(state, None))
+    second = asyncio.run(score_fn(state, None))
+
+    assert model.generate.await_count == 1
+    assert second.metadata["judge_cache"]["hits"] == 1
+    assert second.value == pytest.approx(1.0)
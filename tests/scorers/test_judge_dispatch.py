@@ -0,0 +1,117 @@
+"""Tests for judge_dispatch — concurrency ceiling, rate limiting, retry, stats."""
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from scorers.judge_dispatch import (
+    DispatchStats, JudgeDispatcher, TokenBucket, _percentile, is_rate_limit_error,
+)
+from scorers.reverse_judge_scorer import reverse_judge_precision
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+def test_concurrency_never_exceeds_ceiling():
+    dispatcher = JudgeDispatcher(max_concurrency=3)
+    in_flight = 0
+    peak = 0
+
+    async def call():
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return True
+
+    results = asyncio.run(dispatcher.gather("m", [call] * 12))
+    assert results == [True] * 12
+    assert peak == 3
+
+
+def test_rate_limit_error_is_retried():
+    dispatcher = JudgeDispatcher(base_delay_s=0.001, max_delay_s=0.001)
+    attempts = 0
+
+    async def flaky():
+        nonlocal attempts
+        attempts += 1
+        if attempts < 3:
+            raise RateLimitError("429 Too Many Requests")
+        return "ok"
+
+    stats = DispatchStats()
+    assert asyncio.run(dispatcher.call("m", flaky, stats)) == "ok"
+    assert attempts == 3
+    assert stats.retries == 2
+    assert stats.rate_limited == 2
+    assert len(stats.latencies_s) == 1
+
+
+def test_rate_limit_gives_up_after_max_retries():
+    dispatcher = JudgeDispatcher(max_retries=2, base_delay_s=0.001, max_delay_s=0.001)
+    call = AsyncMock(side_effect=RateLimitError("429"))
+    with pytest.raises(RateLimitError):
+        asyncio.run(dispatcher.call("m", call))
+    assert call.await_count == 3
+
+
+def test_non_rate_limit_error_is_not_retried():
+    dispatcher = JudgeDispatcher(base_delay_s=0.001)
+    call = AsyncMock(side_effect=ValueError("bad prompt"))
+    with pytest.raises(ValueError):
+        asyncio.run(dispatcher.call("m", call))
+    assert call.await_count == 1
+
+
+def test_is_rate_limit_error_detection():
+    assert is_rate_limit_error(RateLimitError())
+    assert is_rate_limit_error(Exception("Error code: 429 - rate_limit_error"))
+    assert not is_rate_limit_error(ValueError("malformed"))
+
+
+def test_token_bucket_spaces_requests_after_burst():
+    bucket = TokenBucket(rate=100.0, capacity=2)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.01, abs=0.005)
+
+
+def test_rate_limited_dispatcher_paces_calls():
+    dispatcher = JudgeDispatcher(requests_per_minute=60 * 50)  # 50/s, burst 50
+    call = AsyncMock(return_value=None)
+    t0 = time.monotonic()
+    asyncio.run(dispatcher.gather("m", [call] * 60))
+    assert time.monotonic() - t0 >= 0.15  # 10 calls beyond the burst at 50/s
+
+
+def test_percentile_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+    assert _percentile(values, 50) == 50.0
+    assert _percentile(values, 95) == 95.0
+    assert _percentile([], 50) is None
+
+
+@patch("scorers.reverse_judge_scorer.get_model")
+def test_scorer_reports_dispatch_stats(mock_get_model):
+    output = MagicMock()
+    output.completion = "GENUINE\nReal."
+    model = MagicMock()
+    model.generate = AsyncMock(return_value=output)
+    mock_get_model.return_value = model
+    state = MagicMock()
+    state.output.completion = (
+        '{"type": "finding", "id": "a-1", "title": "T", "issue": "I", "severity": "Critical"}'
+    )
+    state.metadata = {"doc_content": "# Doc"}
+
+    score = asyncio.run(reverse_judge_precision()(state, None))
+
+    dispatch = score.metadata["judge_dispatch"]
+    assert dispatch["calls"] == 1
+    assert dispatch["retries"] == 0
+    assert dispatch["latency_p50_s"] is not None
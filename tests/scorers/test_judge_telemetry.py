@@ -0,0 +1,101 @@
+"""Tests for judge_telemetry — per-scorer cost/latency aggregation and exports."""
+import json
+import os
+
+import pytest
+from inspect_ai.model import ModelUsage
+
+from scorers.judge_dispatch import DispatchStats
+from scorers.judge_telemetry import (
+    estimate_cost_usd, prometheus_text, record_judge_telemetry, reset_telemetry,
+    telemetry_registry, write_prometheus_textfile,
+)
+from scorers.judge_usage import TokenUsage
+
+HAIKU = "anthropic/claude-haiku-4-5-20251001"
+
+
+@pytest.fixture(autouse=True)
+def clean_registry(monkeypatch):
+    monkeypatch.delenv("PARALLAX_TELEMETRY_JSONL", raising=False)
+    monkeypatch.delenv("PARALLAX_TELEMETRY_PROM", raising=False)
+    monkeypatch.delenv("PARALLAX_JUDGE_PRICES", raising=False)
+    reset_telemetry()
+    yield
+    reset_telemetry()
+
+
+def make_usage(calls=2, uncached=1000, cache_read=9000, cache_write=0, output=100) -> TokenUsage:
+    usage = TokenUsage()
+    for _ in range(calls):
+        usage.add(ModelUsage(
+            input_tokens=uncached // calls, output_tokens=output // calls,
+            total_tokens=0, input_tokens_cache_read=cache_read // calls,
+            input_tokens_cache_write=cache_write // calls,
+        ))
+    return usage
+
+
+def make_dispatch(latencies=(0.2, 0.4), retries=1) -> DispatchStats:
+    stats = DispatchStats(retries=retries)
+    for latency in latencies:
+        stats.record(latency)
+    return stats
+
+
+def test_cost_uses_cache_aware_prices():
+    # 1000 uncached × $1 + 9000 cache reads × $0.10 + 100 output × $5, per million tokens
+    assert estimate_cost_usd(HAIKU, make_usage()) == pytest.approx(0.0024)
+    assert estimate_cost_usd("mockllm/model", make_usage()) is None
+
+
+def test_price_file_extends_table(tmp_path, monkeypatch):
+    prices = tmp_path / "prices.json"
+    prices.write_text(json.dumps({"mockllm/model": {"input": 2.0, "output": 4.0}}))
+    monkeypatch.setenv("PARALLAX_JUDGE_PRICES", str(prices))
+    # cache reads fall back to the input price when not listed
+    assert estimate_cost_usd("mockllm/model", make_usage()) == pytest.approx((10000 * 2 + 100 * 4) / 1e6)
+
+
+def test_record_summarises_and_aggregates_per_scorer():
+    record = record_judge_telemetry("must_find_recall", HAIKU, make_usage(), make_dispatch())
+    assert record["calls"] == 2
+    assert record["latency_p50_s"] == 0.2
+    assert record["latency_p95_s"] == 0.4
+    assert record["retries"] == 1
+    record_judge_telemetry("must_find_recall", HAIKU, make_usage(), make_dispatch((0.6,), 0))
+
+    totals = telemetry_registry()[("must_find_recall", HAIKU)]
+    assert (totals.scores, totals.calls, totals.retries) == (2, 4, 1)
+    assert totals.latencies_s == [0.2, 0.4, 0.6]
+    assert totals.cost_usd == pytest.approx(0.0048)
+
+
+def test_jsonl_export_appends_one_line_per_record(tmp_path, monkeypatch):
+    path = tmp_path / "telemetry.jsonl"
+    monkeypatch.setenv("PARALLAX_TELEMETRY_JSONL", str(path))
+    record_judge_telemetry("reverse_judge_precision", HAIKU, make_usage(), make_dispatch(), sample_id="doc")
+    record_judge_telemetry("must_find_recall", HAIKU, make_usage(), make_dispatch(), sample_id="doc")
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [line["scorer"] for line in lines] == ["reverse_judge_precision", "must_find_recall"]
+    assert lines[0]["sample_id"] == "doc"
+
+
+def test_prometheus_text_format():
+    record_judge_telemetry("must_find_recall", HAIKU, make_usage(), make_dispatch())
+    text = prometheus_text()
+    labels = f'scorer="must_find_recall",judge="{HAIKU}"'
+    assert "# TYPE parallax_judge_calls_total counter" in text
+    assert f"parallax_judge_calls_total{{{labels}}} 2" in text
+    assert f'parallax_judge_input_tokens_total{{{labels},kind="cache_read"}} 9000' in text
+    assert f'parallax_judge_latency_seconds{{{labels},quantile="0.95"}} 0.4' in text
+    assert f"parallax_judge_latency_seconds_count{{{labels}}} 2" in text
+
+
+def test_prometheus_textfile_in_directory_is_per_process(tmp_path, monkeypatch):
+    monkeypatch.setenv("PARALLAX_TELEMETRY_PROM", str(tmp_path))
+    record_judge_telemetry("must_find_recall", HAIKU, make_usage(), make_dispatch())
+    written = tmp_path / f"parallax_judge_{os.getpid()}.prom"
+    assert "parallax_judge_cost_usd_total" in written.read_text()
+    assert write_prometheus_textfile(tmp_path / "x.prom") == tmp_path / "x.prom"
+    assert not list(tmp_path.glob("*.tmp"))
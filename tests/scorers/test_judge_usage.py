@@ -0,0 +1,48 @@
+"""Tests for judge_usage — token accounting across judge calls."""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from inspect_ai.model import ModelUsage
+
+from scorers.judge_usage import TokenUsage, UsageRecordingModel, estimate_tokens
+
+
+def test_token_usage_sums_cache_read_and_write():
+    usage = TokenUsage()
+    usage.add(ModelUsage(input_tokens=10, output_tokens=5, input_tokens_cache_write=1000))
+    usage.add(ModelUsage(input_tokens=12, output_tokens=6, input_tokens_cache_read=1000))
+    d = usage.as_dict()
+    assert d["calls"] == 2
+    assert d["input_tokens_uncached"] == 22
+    assert d["input_tokens_cache_write"] == 1000
+    assert d["input_tokens_cache_read"] == 1000
+    assert d["output_tokens"] == 11
+    assert d["cached_input_fraction"] == pytest.approx(1000 / 2022)
+
+
+def test_token_usage_without_provider_usage_counts_calls_only():
+    usage = TokenUsage()
+    usage.add(None)
+    assert usage.as_dict()["calls"] == 1
+    assert usage.as_dict()["cached_input_fraction"] is None
+
+
+def test_recording_model_passes_through_output():
+    output = MagicMock()
+    output.usage = ModelUsage(input_tokens=3, output_tokens=4)
+    inner = MagicMock()
+    inner.generate = AsyncMock(return_value=output)
+    usage = TokenUsage()
+
+    result = asyncio.run(UsageRecordingModel(inner, usage).generate(["msg"], config=None))
+
+    assert result is output
+    inner.generate.assert_awaited_once_with(["msg"], config=None)
+    assert usage.input_tokens == 3
+
+
+def test_estimate_tokens_rounds_up_characters_over_four():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("abc") == 1
+    assert estimate_tokens("x" * 400) == 100
@@ -0,0 +1,59 @@
+"""Tests for lexical_prefilter — BM25 routing of must-find checks."""
+import json
+
+from scorers.lexical_prefilter import BM25Index, FindingPrefilter, tokenize
+
+
+FINDINGS = [
+    {"id": "r-001", "title": "Missing success criteria",
+     "issue": "No explicit success criteria are defined for phase one.", "section": "Goals"},
+    {"id": "r-002", "title": "Cache invalidation unspecified",
+     "issue": "The design never says when cached judge verdicts expire.", "section": "Caching"},
+    {"id": "r-003", "title": "Rollback plan absent",
+     "issue": "Deployment has no rollback procedure.", "section": "Operations"},
+]
+
+
+def test_tokenize_drops_stopwords_and_folds_suffixes():
+    assert tokenize("The caches are expiring when Verdicts expired") == [
+        "cach", "expir", "verdict", "expir",
+    ]
+    assert tokenize("cache cached caching") == ["cach"] * 3
+
+
+def test_bm25_ranks_matching_document_first():
+    index = BM25Index([tokenize(f["title"] + " " + f["issue"]) for f in FINDINGS])
+    scores = index.scores(tokenize("cached verdicts never expire"))
+    assert max(range(3), key=scores.__getitem__) == 1
+    assert scores[2] == 0
+
+
+def test_strong_match_is_narrowed_to_best_finding():
+    prefilter = FindingPrefilter(FINDINGS)
+    routed = prefilter.route({"title": "No success criteria defined",
+                              "issue": "The document has no success criteria."})
+    assert routed.route == "narrowed"
+    assert routed.best_id == "r-001"
+    assert json.loads(prefilter.render(routed.best_index)) == {
+        "title": "Missing success criteria",
+        "issue": "No explicit success criteria are defined for phase one.",
+        "section": "Goals",
+    }
+
+
+def test_unrelated_flaw_is_flagged_non_match():
+    routed = FindingPrefilter(FINDINGS).route({"title": "Kubernetes autoscaling", "issue": "HPA metrics."})
+    assert routed.route == "non_match"
+    assert routed.coverage == 0.0
+
+
+def test_partial_overlap_keeps_full_output():
+    routed = FindingPrefilter(FINDINGS).route({
+        "title": "Deployment rollback sequencing",
+        "issue": "Service migration order and traffic cutover are undefined.",
+    })
+    assert routed.route == "full"
+
+
+def test_no_parsed_findings_falls_back_to_full():
+    assert FindingPrefilter([]).route({"title": "x", "issue": "y"}).route == "full"
@@ -11,7 +11,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from scorers.must_find_scorer import must_find_recall
+from scorers.must_find_history import MissHistory
+from scorers.must_find_scorer import judge_until_decided, must_find_recall, required_hits
 
 
 # ── Fixtures ────────────────────────────────────────────────────────────────
@@ -164,3 +165,243 @@ def test_must_find_missed_titles_in_metadata(mock_get_model):
     score = run_scorer(must_find_recall, state)
     assert "No success criteria defined" in score.metadata["missed_titles"]
     assert "Phase 2 prerequisites unspecified" in score.metadata["missed_titles"]
+
+
+@patch("scorers.must_find_scorer.get_model")
+def test_must_find_reviewer_output_in_cacheable_system_prefix(mock_get_model):
+    """Reviewer output is the shared system prefix; each must-find item trails it."""
+    model = make_mock_model("YES\nFound it.")
+    mock_get_model.return_value = model
+    state = make_state(ACTUAL_JSONL, [MUST_FIND_A, MUST_FIND_B])
+    score = run_scorer(must_find_recall, state)
+
+    systems = [call[0][0][0].content for call in model.generate.call_args_list]
+    users = [call[0][0][1].content for call in model.generate.call_args_list]
+    assert systems[0] == systems[1]
+    assert "Missing success criteria" in systems[0]
+    assert all("Missing success criteria" not in u for u in users)
+    assert model.generate.call_args[1]["config"].cache_prompt is True
+    assert score.metadata["judge_usage"]["calls"] == 2
+
+
+# ── threshold mode ───────────────────────────────────────────────────────────
+
+
+def make_must_finds(n: int) -> list[dict]:
+    return [
+        {"id": f"mf-{i:03d}", "title": f"Flaw {i}", "issue": f"Issue {i}.", "min_recall": 0.8}
+        for i in range(n)
+    ]
+
+
+def make_staggered_model(answer: str):
+    """Judge whose i-th call takes i × 20ms, so verdicts arrive in call order."""
+    calls = {"started": [], "finished": 0}
+
+    async def generate(messages, config=None):
+        index = len(calls["started"])
+        calls["started"].append(messages[1].content)
+        await asyncio.sleep(0.02 * index)
+        calls["finished"] += 1
+        out = MagicMock()
+        out.completion = f"{answer}\nReason."
+        return out
+
+    model = MagicMock()
+    model.generate = generate
+    return model, calls
+
+
+def test_required_hits_rounds_up():
+    assert required_hits(0.8, 5) == 4
+    assert required_hits(0.75, 4) == 3
+    assert required_hits(0.7, 10) == 7
+    assert required_hits(0.0, 3) == 0
+
+
+@patch("scorers.must_find_scorer.get_model")
+def test_threshold_pass_never_starts_undecisive_checks(mock_get_model):
+    model, calls = make_staggered_model("YES")
+    mock_get_model.return_value = model
+    state = make_state(ACTUAL_JSONL, make_must_finds(4))
+    score = run_scorer(lambda: must_find_recall(threshold=0.5), state)
+
+    assert score.value == 1.0
+    assert score.metadata["threshold_passed"] is True
+    assert len(calls["started"]) == calls["finished"] == 2
+    assert score.metadata["skipped"] == 2
+    assert [r["found"] for r in score.metadata["find_results"]] == [True, True, None, None]
+    assert score.metadata["find_results"][3]["skipped"] is True
+    assert (score.metadata["recall_lower"], score.metadata["recall_upper"]) == (0.5, 1.0)
+    assert "recall" not in score.metadata
+
+
+@patch("scorers.must_find_scorer.get_model")
+def test_threshold_fail_stops_once_unreachable(mock_get_model):
+    model, calls = make_staggered_model("NO")
+    mock_get_model.return_value = model
+    state = make_state(ACTUAL_JSONL, make_must_finds(4))
+    score = run_scorer(lambda: must_find_recall(threshold=0.75), state)
+
+    assert score.value == 0.0
+    assert len(calls["started"]) == calls["finished"] == 2  # two misses: 3 of 4 no longer possible
+    assert score.metadata["skipped_titles"] == ["Flaw 2", "Flaw 3"]
+    assert score.metadata["missed_titles"] == ["Flaw 0", "Flaw 1"]
+
+
+@patch("scorers.must_find_scorer.get_model")
+def test_threshold_orders_checks_by_miss_history(mock_get_model, tmp_path):
+    history_path = tmp_path / "history.json"
+    MissHistory(history_path).record([("mf-002", False)] * 3 + [("mf-000", True)] * 3)
+    model, calls = make_staggered_model("YES")
+    mock_get_model.return_value = model
+    state = make_state(ACTUAL_JSONL, make_must_finds(3))
+    run_scorer(
+        lambda: must_find_recall(threshold=1.0, history=True, history_path=str(history_path)),
+        state,
+    )
+
+    assert [("Flaw 2" in p, "Flaw 1" in p, "Flaw 0" in p) for p in calls["started"]] == [
+        (True, False, False), (False, True, False), (False, False, True),
+    ]
+    counts = MissHistory(history_path).counts
+    assert counts["mf-002"] == {"judged": 4, "missed": 3}
+    assert counts["mf-001"] == {"judged": 1, "missed": 0}
+
+
+def test_judge_until_decided_window_refills_as_verdicts_arrive():
+    answers = [True, False, True, False, True, True]
+    in_flight = {"now": 0, "peak": 0, "started": 0}
+
+    def call(found: bool):
+        async def run():
+            in_flight["started"] += 1
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            await asyncio.sleep(0.001)
+            in_flight["now"] -= 1
+            return found, ""
+        return run
+
+    # needed 3 of 6: window starts at min(3, 4) = 3; settles after the fifth verdict.
+    results = asyncio.run(judge_until_decided([call(a) for a in answers], needed=3))
+    assert [r is not None for r in results] == [True] * 5 + [False]
+    assert in_flight["started"] == 5
+    assert in_flight["peak"] <= 3
+
+
+def test_judge_until_decided_with_zero_needed_makes_no_calls():
+    async def never():
+        raise AssertionError("judge should not be called")
+
+    assert asyncio.run(judge_until_decided([never, never], needed=0)) == [None, None]
+
+
+# ── lexical pre-filter ───────────────────────────────────────────────────────
+
+
+PREFILTER_OUTPUT = "Here is my review.\n```jsonl\n" + "\n".join([
+    ACTUAL_JSONL,
+    '{"type": "finding", "id": "problem-framer-002", "title": "Rollback plan absent", '
+    '"issue": "Deployment has no rollback procedure.", "severity": "Important"}',
+]) + "\n```\nLet me know if you need more."
+
+
+def make_recording_model(answers: list[str]):
+    model = MagicMock()
+    model.generate = AsyncMock(side_effect=[
+        MagicMock(completion=f"{answer}\nReason.") for answer in answers
+    ])
+    return model
+
+
+@patch("scorers.must_find_scorer.get_model")
+def test_prefilter_narrows_strong_match_to_best_finding(mock_get_model):
+    model = make_recording_model(["YES"])
+    mock_get_model.return_value = model
+    state = make_state(PREFILTER_OUTPUT, [MUST_FIND_A])
+    score = run_scorer(lambda: must_find_recall(prefilter=True), state)
+
+    assert score.value == 1.0
+    [call] = model.generate.call_args_list
+    system = call[0][0][0].content
+    assert "Missing success criteria" in system
+    assert "Rollback" not in system
+    route = score.metadata["find_results"][0]["prefilter"]
+    assert (route["route"], route["best_finding_id"]) == ("narrowed", "problem-framer-001")
+    chars = score.metadata["prefilter"]["prompt_chars"]
+    assert chars["sent"] < chars["full"]
+
+
+@patch("scorers.must_find_scorer.get_model")
+def test_prefilter_rechecks_narrowed_no_against_full_output(mock_get_model):
+    model = make_recording_model(["NO", "YES"])
+    mock_get_model.return_value = model
+    state = make_state(PREFILTER_OUTPUT, [MUST_FIND_A])
+    score = run_scorer(lambda: must_find_recall(prefilter=True), state)
+
+    assert score.value == 1.0
+    systems = [call[0][0][0].content for call in model.generate.call_args_list]
+    assert "Rollback" not in systems[0]
+    assert "Rollback" in systems[1]
+    assert score.metadata["prefilter"]["confirmed_with_full_output"] == 1
+
+
+@patch("scorers.must_find_scorer.get_model")
+def test_prefilter_flags_non_match_and_optionally_skips_judge(mock_get_model):
+    unrelated = {"id": "mf-009", "title": "Kubernetes autoscaling", "issue": "HPA metrics."}
+    model = make_recording_model(["NO"])
+    mock_get_model.return_value = model
+
+    flagged = run_scorer(lambda: must_find_recall(prefilter=True), make_state(PREFILTER_OUTPUT, [unrelated]))
+    assert flagged.metadata["find_results"][0]["prefilter"]["route"] == "non_match"
+    assert model.generate.call_count == 1  # still judged on the full output
+
+    skipped = run_scorer(
+        lambda: must_find_recall(prefilter=True, skip_non_matches=True),
+        make_state(PREFILTER_OUTPUT, [unrelated]),
+    )
+    assert skipped.value == 0.0
+    assert "judge not asked" in skipped.metadata["find_results"][0]["reasoning"]
+    assert model.generate.call_count == 1
+
+
+# ── compact judge rendering ──────────────────────────────────────────────────
+
+
+@patch("scorers.must_find_scorer.get_model")
+def test_judge_sees_compact_rendering_built_once(mock_get_model):
+    model = make_mock_model("YES\nFound it.")
+    mock_get_model.return_value = model
+    state = make_state(PREFILTER_OUTPUT, [MUST_FIND_A, MUST_FIND_B])
+    score = run_scorer(must_find_recall, state)
+
+    systems = {call[0][0][0].content for call in model.generate.call_args_list}
+    assert len(systems) == 1
+    [system] = systems
+    assert "Here is my review" not in system and "```" not in system
+    assert '"severity"' not in system and '"id"' not in system
+    assert '{"title":"Rollback plan absent","issue":"Deployment has no rollback procedure."}' in system
+    rendering = score.metadata["judge_output"]
+    assert rendering["rendering"] == "compact"
+    assert rendering["parsed_findings"] == 2
+    assert rendering["tokens_sent"] < rendering["tokens_raw"]
+
+
+@patch("scorers.must_find_scorer.get_model")
+def test_unparseable_output_is_judged_raw(mock_get_model):
+    model = make_mock_model("NO\nNot found.")
+    mock_get_model.return_value = model
+    prose = "I reviewed the document and found no success criteria anywhere."
+    score = run_scorer(must_find_recall, make_state(prose, [MUST_FIND_A]))
+
+    assert prose in model.generate.call_args[0][0][0].content
+    assert score.metadata["judge_output"]["rendering"] == "raw"
+
+
+@patch("scorers.must_find_scorer.get_model")
+def test_compact_false_keeps_raw_completion(mock_get_model):
+    model = make_mock_model("YES\nFound it.")
+    mock_get_model.return_value = model
+    run_scorer(lambda: must_find_recall(compact=False), make_state(PREFILTER_OUTPUT, [MUST_FIND_A]))
+    assert PREFILTER_OUTPUT in model.generate.call_args[0][0][0].content
@@ -7,11 +7,15 @@ Direction is REVERSED from llm_judge_match (which asks "did the reviewer find
 this expected finding?"). Here we ask "is the reviewer's finding real?"
 """
 import asyncio
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from inspect_ai.model import ModelUsage
 
-from scorers.reverse_judge_scorer import _reverse_judge_one, reverse_judge_precision
+from scorers.reverse_judge_scorer import (
+    _parse_batched_verdicts, _reverse_judge_one, reverse_judge_precision,
+)
 
 
 # ── Fixtures ────────────────────────────────────────────────────────────────
@@ -250,6 +254,25 @@ def test_precision_missing_doc_content_raises_clearly(mock_get_model):
         run_scorer(reverse_judge_precision, state)
 
 
+@patch("scorers.reverse_judge_scorer.get_model")
+def test_precision_resolves_document_by_hash(mock_get_model, tmp_path):
+    """Multi-document samples carry doc_hash instead of doc_content; the judge still gets the doc."""
+    from evals.utils.dataset_loader import register_document
+
+    doc = tmp_path / "doc.md"
+    doc.write_text("# Hashed doc")
+    model = make_mock_model("GENUINE\nOk.")
+    mock_get_model.return_value = model
+    state = MagicMock()
+    state.output.completion = ACTUAL_JSONL
+    state.metadata = {"doc_hash": register_document(doc)}
+
+    run_scorer(reverse_judge_precision, state)
+
+    system_message = model.generate.call_args[0][0][0]
+    assert "# Hashed doc" in system_message.content
+
+
 # ── Confidence-stratified precision tests ────────────────────────────────────
 
 
@@ -343,3 +366,160 @@ def test_per_finding_result_includes_confidence(mock_get_model):
     score = run_scorer(reverse_judge_precision, state)
     result = score.metadata["judge_results"][0]
     assert result["confidence"] == 85
+
+
+# ── Batched prompt style ─────────────────────────────────────────────────────
+
+
+def _batched_response(*verdicts: str) -> str:
+    return json.dumps([
+        {"index": i, "verdict": v, "reasoning": f"Reason {i}."}
+        for i, v in enumerate(verdicts, start=1)
+    ])
+
+
+def test_parse_batched_verdicts_valid():
+    parsed = _parse_batched_verdicts(_batched_response("GENUINE", "NOT_GENUINE"), 2)
+    assert [v for v, _ in parsed] == [True, False]
+    assert parsed[1][1].startswith("NOT_GENUINE")
+
+
+def test_parse_batched_verdicts_tolerates_fences():
+    text = "```json\n" + _batched_response("GENUINE") + "\n```"
+    assert _parse_batched_verdicts(text, 1) == [(True, "GENUINE\nReason 1.")]
+
+
+def test_parse_batched_verdicts_incomplete_returns_none():
+    assert _parse_batched_verdicts(_batched_response("GENUINE"), 2) is None
+    assert _parse_batched_verdicts("GENUINE\nNot JSON at all.", 1) is None
+    assert _parse_batched_verdicts('[{"index": 1, "verdict": "MAYBE"}]', 1) is None
+
+
+@patch("scorers.reverse_judge_scorer.get_model")
+def test_batched_sends_document_once_per_batch(mock_get_model):
+    """Three findings, batch_size=10 → one judge call containing every finding."""
+    model = make_mock_model(_batched_response("GENUINE", "NOT_GENUINE", "GENUINE"))
+    mock_get_model.return_value = model
+    three = "\n".join(ACTUAL_JSONL.replace("001", f"00{i}") for i in range(1, 4))
+    state = make_state(three, DOC_CONTENT)
+
+    score = run_scorer(lambda: reverse_judge_precision(prompt_style="batched"), state)
+
+    assert model.generate.await_count == 1
+    messages = model.generate.call_args[0][0]
+    combined = " ".join(m.content for m in messages)
+    assert combined.count("Phase Map") == 1
+    assert "Finding 3:" in combined
+    assert score.value == pytest.approx(2 / 3)
+    assert score.metadata["batching"] == {"batch_size": 10, "batches": 1, "fallback_batches": 0}
+
+
+@patch("scorers.reverse_judge_scorer.get_model")
+def test_batched_respects_batch_size(mock_get_model):
+    model = make_mock_model(_batched_response("GENUINE", "GENUINE"))
+    mock_get_model.return_value = model
+    four = "\n".join(ACTUAL_JSONL.replace("001", f"00{i}") for i in range(1, 5))
+    state = make_state(four, DOC_CONTENT)
+
+    score = run_scorer(lambda: reverse_judge_precision(prompt_style="batched", batch_size=2), state)
+
+    assert model.generate.await_count == 2
+    assert score.metadata["total"] == 4
+    assert score.value == pytest.approx(1.0)
+
+
+@patch("scorers.reverse_judge_scorer.get_model")
+def test_batched_parse_failure_falls_back_to_per_finding(mock_get_model):
+    """Unparseable batch response → each finding judged with the direct prompt."""
+    responses = iter(["I cannot produce JSON.", "GENUINE\nReal.", "NOT_GENUINE\nFake."])
+
+    async def generate(messages, config=None):
+        out = MagicMock()
+        out.completion = next(responses)
+        return out
+
+    model = MagicMock()
+    model.generate = generate
+    mock_get_model.return_value = model
+    two = "\n".join([ACTUAL_JSONL, ACTUAL_JSONL.replace("001", "002")])
+    state = make_state(two, DOC_CONTENT)
+
+    score = run_scorer(lambda: reverse_judge_precision(prompt_style="batched"), state)
+
+    assert score.value == pytest.approx(0.5)
+    assert score.metadata["batching"]["fallback_batches"] == 1
+
+
+@patch("scorers.reverse_judge_scorer.get_model")
+def test_batched_fallback_counts_misses_once_and_caches_batched_key(mock_get_model, tmp_path):
+    responses = iter(["I cannot produce JSON.", "GENUINE\nReal.", "NOT_GENUINE\nFake."])
+    calls = []
+
+    async def generate(messages, config=None):
+        calls.append(messages)
+        out = MagicMock()
+        out.completion = next(responses)
+        return out
+
+    model = MagicMock()
+    model.generate = generate
+    mock_get_model.return_value = model
+    two = "\n".join([ACTUAL_JSONL, ACTUAL_JSONL_LOW_CONFIDENCE])
+    score_fn = lambda: reverse_judge_precision(  # noqa: E731
+        prompt_style="batched", cache=True, cache_dir=str(tmp_path),
+    )
+
+    first = run_scorer(score_fn, make_state(two, DOC_CONTENT))
+    assert first.metadata["judge_cache"] == {"enabled": True, "hits": 0, "misses": 2}
+
+    second = run_scorer(score_fn, make_state(two, DOC_CONTENT))
+    assert len(calls) == 3  # the rerun is served from the batched key
+    assert second.metadata["judge_cache"] == {"enabled": True, "hits": 2, "misses": 0}
+    assert second.metadata["batching"]["batches"] == 0
+    assert second.value == pytest.approx(0.5)
+
+
+# ── Prompt-prefix caching ────────────────────────────────────────────────────
+
+
+def test_reverse_judge_one_document_in_cacheable_system_prefix():
+    """Document lives in the system message; the finding trails it in the user message."""
+    model = make_mock_model("GENUINE\nOk.")
+    asyncio.run(_reverse_judge_one(model, GENUINE_FINDING, DOC_CONTENT))
+    messages = model.generate.call_args[0][0]
+    config = model.generate.call_args[1]["config"]
+    assert DOC_CONTENT in messages[0].content
+    assert DOC_CONTENT not in messages[1].content
+    assert "No success criteria defined" in messages[1].content
+    assert config.cache_prompt is True
+
+
+def test_system_prefix_identical_across_findings():
+    """Prefix must be byte-identical per document for the provider cache to hit."""
+    model = make_mock_model("GENUINE\nOk.")
+    asyncio.run(_reverse_judge_one(model, GENUINE_FINDING, DOC_CONTENT))
+    asyncio.run(_reverse_judge_one(model, HALLUCINATED_FINDING, DOC_CONTENT))
+    first, second = (call[0][0][0].content for call in model.generate.call_args_list)
+    assert first == second
+
+
+@patch("scorers.reverse_judge_scorer.get_model")
+def test_precision_metadata_reports_cached_token_counts(mock_get_model):
+    output = MagicMock()
+    output.completion = "GENUINE\nReal."
+    output.usage = ModelUsage(
+        input_tokens=40, output_tokens=12, total_tokens=5052,
+        input_tokens_cache_read=5000, input_tokens_cache_write=0,
+    )
+    model = MagicMock()
+    model.generate = AsyncMock(return_value=output)
+    mock_get_model.return_value = model
+
+    two = "\n".join([ACTUAL_JSONL, ACTUAL_JSONL.replace("001", "002")])
+    score = run_scorer(reverse_judge_precision, make_state(two, DOC_CONTENT))
+
+    usage = score.metadata["judge_usage"]
+    assert usage["calls"] == 2
+    assert usage["input_tokens_uncached"] == 80
+    assert usage["input_tokens_cache_read"] == 10_000
+    assert usage["cached_input_fraction"] == pytest.approx(10_000 / 10_080)
@@ -1,5 +1,8 @@
+import random
+from difflib import SequenceMatcher
+
 import pytest
-from scorers.severity_scorer import match_findings, calculate_metrics
+from scorers.severity_scorer import _candidate_pairs, match_findings, calculate_metrics
 
 
 FINDING_A = {
@@ -136,3 +139,63 @@ def test_calculate_metrics_zero_actual():
     assert recall == 0.0
     assert precision == 0.0
     assert f1 == 0.0
+
+
+def test_match_findings_optimal_assignment_beats_greedy_order():
+    """Greedy lets exp_a take the only actual exp_b can use; optimal matches both."""
+    exp_a = {"id": "e1", "title": "API key rotation undefined", "severity": "Critical"}
+    exp_b = {"id": "e2", "title": "API key rotation policy is undefined here", "severity": "Critical"}
+    act_1 = {"id": "a1", "title": "API key rotation policy undefined", "severity": "Critical"}
+    act_2 = {"id": "a2", "title": "API key rotation undefined", "severity": "Critical"}
+    actual = [act_1, act_2]  # act_1 matches both expected; act_2 only exp_a
+
+    greedy, _ = match_findings(actual=actual, expected=[exp_a, exp_b], strategy="greedy")
+    optimal, consumed = match_findings(actual=actual, expected=[exp_a, exp_b])
+
+    assert greedy == [exp_a]
+    assert optimal == [exp_a, exp_b]
+    assert consumed == {"a1", "a2"}
+
+
+def test_match_findings_maximises_match_count():
+    """An actual similar to two expected goes to the one with no other option."""
+    exp_a = {"id": "e1", "title": "Missing success criteria", "severity": "Critical"}
+    exp_b = {"id": "e2", "title": "Missing success criterion", "severity": "Critical"}
+    act_1 = {"id": "a1", "title": "Missing success criteria", "severity": "Critical"}
+    act_2 = {"id": "a2", "title": "Missing success criterion", "severity": "Critical"}
+    # act_1 is listed first and is also >=0.8 similar to exp_b
+    detected, consumed = match_findings(actual=[act_1, act_2], expected=[exp_b, exp_a])
+    assert len(detected) == 2
+    assert consumed == {"a1", "a2"}
+
+
+def test_match_findings_severity_disagreement_blocks_match_by_default():
+    exp = {"id": "e1", "title": "API key security undefined", "severity": "Critical"}
+    act = {"id": "a1", "title": "API key security undefined", "severity": "Important"}
+    assert match_findings(actual=[act], expected=[exp])[0] == []
+    detected, _ = match_findings(actual=[act], expected=[exp], require_severity=False)
+    assert detected == [exp]
+
+
+def test_match_findings_threshold_is_configurable():
+    exp = {"id": "e1", "title": "Ground truth validity assumed", "severity": "Critical"}
+    act = {"id": "a1", "title": "Ground truth is never validated", "severity": "Critical"}
+    assert match_findings(actual=[act], expected=[exp])[0] == []
+    assert match_findings(actual=[act], expected=[exp], threshold=0.5)[0] == [exp]
+
+
+def test_candidate_pruning_is_exact_against_all_pairs():
+    """Bigram count filter never drops a pair SequenceMatcher would accept."""
+    rng = random.Random(7)
+    alphabet = "abcde "
+    for _ in range(500):
+        actual = ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 10))) for _ in range(4)]
+        expected = ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 10))) for _ in range(4)]
+        threshold = rng.choice([0.6, 0.8, 0.9])
+        brute = {
+            (i, j)
+            for i, e in enumerate(expected)
+            for j, a in enumerate(actual)
+            if SequenceMatcher(None, a, e).ratio() >= threshold
+        }
+        assert set(_candidate_pairs(actual, expected, threshold)) == brute
@@ -0,0 +1,179 @@
+"""Tests for scripts/validate-schemas.py — compiled validators, error reporting, type dispatch."""
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+_REPO_ROOT = Path(__file__).parent.parent.parent
+FIXTURES = _REPO_ROOT / "tests" / "fixtures"
+VALID = FIXTURES / "valid-finding.jsonl"
+INVALID = FIXTURES / "invalid-finding.jsonl"
+
+
+def _load_script():
+    # Hyphenated script name; registered in sys.modules so worker processes can unpickle it.
+    spec = importlib.util.spec_from_file_location(
+        "validate_schemas", _REPO_ROOT / "scripts" / "validate-schemas.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+vs = _load_script()
+
+
+def records(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines() if line.strip()]
+
+
+def test_validator_is_compiled_once_per_schema():
+    assert vs.get_validator("reviewer-findings") is vs.get_validator("reviewer-findings")
+    assert vs.get_validator("run-metadata") is not vs.get_validator("reviewer-findings")
+
+
+def test_union_branches_are_dispatched_by_type():
+    validator = vs.get_validator("reviewer-findings")
+    assert set(validator.by_type) == {"finding", "blind_spot_check", "reviewer_metadata"}
+    for record in records(VALID):
+        assert list(validator.iter_errors(record)) == []
+        assert list(validator.validator.iter_errors(record)) == []  # same verdict as the oneOf
+
+
+def test_unknown_type_falls_back_to_full_union():
+    validator = vs.get_validator("reviewer-findings")
+    errors = list(validator.iter_errors({"type": "nonsense"}))
+    assert [error.validator for error in errors] == ["oneOf"]
+    assert vs.schema_errors({"type": "nonsense"}, validator) == [
+        f"Validation error: {errors[0].message}"
+    ]
+
+
+def test_schema_errors_reports_every_violation_in_path_order():
+    invalid, = records(INVALID)
+    errors = vs.schema_errors(invalid, vs.get_validator("reviewer-findings"))
+    assert len(errors) == 7
+    assert errors[-3:] == [
+        "Validation error at $.id: 'invalid-id-format' does not match '^v\\\\d+-[a-z-]+-\\\\d{3}$'",
+        "Validation error at $.phase: 'contributing' is a required property",
+        "Validation error at $.severity: 'VeryBad' is not one of ['Critical', 'Important', 'Minor']",
+    ]
+    assert "Validation error: 'confidence' is a required property" in errors
+
+
+def test_union_error_expands_to_the_intended_branch():
+    invalid, = records(INVALID)
+    validator = vs.get_validator("reviewer-findings")
+    union_error, = validator.validator.iter_errors(invalid)  # full oneOf, no dispatch
+    assert union_error.validator == "oneOf"
+    expanded = vs._expand_union_error(union_error)
+    assert sorted(e.message for e in expanded) == sorted(
+        e.message for e in validator.iter_errors(invalid)
+    )
+
+
+def test_validate_jsonl_file_prefixes_line_numbers():
+    assert vs.validate_jsonl_file(VALID, "reviewer-findings") == (True, [])
+    valid, errors = vs.validate_jsonl_file(INVALID, "reviewer-findings")
+    assert not valid
+    assert len(errors) == 7 and all(error.startswith("Line 1: ") for error in errors)
+
+
+def test_invalid_json_line_is_reported():
+    valid, errors = vs.validate_jsonl_line(3, "{not json", vs.get_validator("reviewer-findings"))
+    assert not valid and errors[0].startswith("Line 3: Invalid JSON")
+
+
+# ── directory runs ───────────────────────────────────────────────────────────
+
+def review_tree(root: Path) -> Path:
+    """docs/reviews-style tree: one review per topic, a nested iteration, an unknown file."""
+    (root / "topic-a" / "iter-2").mkdir(parents=True)
+    (root / "topic-b").mkdir()
+    (root / "top.jsonl").write_text(VALID.read_text())
+    (root / "topic-a" / "assumption-hunter.jsonl").write_text(VALID.read_text())
+    (root / "topic-a" / "iter-2" / "scope-guardian.jsonl").write_text(VALID.read_text())
+    (root / "topic-b" / "problem-framer.jsonl").write_text(INVALID.read_text())
+    (root / "topic-b" / "notes.json").write_text("{}")
+    return root
+
+
+def run_directory(root: Path, **kwargs) -> tuple[int, int, list[dict]]:
+    with open(os.devnull, "w") as out:
+        return vs.validate_directory(root, out=out, **kwargs)
+
+
+def test_recursive_walk_finds_nested_files(tmp_path):
+    root = review_tree(tmp_path)
+    total, passed, _ = run_directory(root)
+    assert (total, passed) == (1, 1)
+
+    total, passed, results = run_directory(root, recursive=True)
+    assert (total, passed) == (4, 3)
+    assert [r["path"] for r in results] == [
+        "top.jsonl", "topic-a/assumption-hunter.jsonl",
+        "topic-a/iter-2/scope-guardian.jsonl", "topic-b/problem-framer.jsonl",
+    ]
+    failed, = [r for r in results if r["status"] == "fail"]
+    assert len(failed["errors"]) == 7
+
+
+def test_manifest_skips_unchanged_content_and_revalidates_changes(tmp_path):
+    root = review_tree(tmp_path / "reviews")
+    manifest = tmp_path / "manifest.json"
+    nested = root / "topic-a" / "iter-2" / "scope-guardian.jsonl"
+
+    def cached() -> dict:
+        _, _, results = run_directory(root, recursive=True, manifest_path=manifest)
+        return {r["path"]: r["cached"] for r in results}
+
+    assert not any(cached().values())
+    second = cached()
+    assert second["topic-a/iter-2/scope-guardian.jsonl"] is True
+    assert second["topic-b/problem-framer.jsonl"] is False  # failures are never recorded
+
+    stat = nested.stat()
+    os.utime(nested, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))  # touched, unchanged
+    assert cached()["topic-a/iter-2/scope-guardian.jsonl"] is True
+    nested.write_text(nested.read_text())  # rewritten with identical bytes
+    assert cached()["topic-a/iter-2/scope-guardian.jsonl"] is True
+
+    nested.write_text(VALID.read_text().splitlines()[0] + "\n")
+    assert cached()["topic-a/iter-2/scope-guardian.jsonl"] is False
+    nested.write_text(INVALID.read_text())
+    _, _, results = run_directory(root, recursive=True, manifest_path=manifest)
+    assert {r["path"]: r["status"] for r in results}["topic-a/iter-2/scope-guardian.jsonl"] == "fail"
+    assert str(nested.resolve()) not in json.loads(manifest.read_text())["passed"]
+
+
+def test_parallel_jobs_match_serial_results(tmp_path):
+    root = review_tree(tmp_path)
+    assert run_directory(root, recursive=True, jobs=3) == run_directory(root, recursive=True)
+
+
+def test_json_summary_shape(tmp_path):
+    root = review_tree(tmp_path / "reviews")
+    proc = subprocess.run(
+        [sys.executable, str(_REPO_ROOT / "scripts" / "validate-schemas.py"), str(root),
+         "--recursive", "--jobs", "2", "--manifest", str(tmp_path / "manifest.json"),
+         "--json-summary", "-"],
+        capture_output=True, text=True,
+    )
+    assert proc.returncode == 1  # problem-framer.jsonl fails
+    summary = json.loads(proc.stdout)
+    assert {k: summary[k] for k in ("root", "total", "passed", "failed", "cached")} == {
+        "root": str(root), "total": 4, "passed": 3, "failed": 1, "cached": 0,
+    }
+    assert set(summary["files"][0]) == {"path", "schema", "sha256", "status", "cached", "errors"}
+    assert "SKIP topic-b/notes.json" in proc.stderr
+
+    proc = subprocess.run(
+        [sys.executable, str(_REPO_ROOT / "scripts" / "validate-schemas.py"), str(root),
+         "--recursive", "--no-manifest", "--manifest", str(tmp_path / "manifest.json"),
+         "--json-summary", str(tmp_path / "summary.json")],
+        capture_output=True, text=True,
+    )
+    assert json.loads((tmp_path / "summary.json").read_text())["cached"] == 0
@@ -0,0 +1,52 @@
+import pytest
+from inspect_ai.log import EvalConfig, EvalDataset, EvalLog, EvalSample, EvalSpec, write_eval_log
+from inspect_ai.scorer import Score
+
+from tools.ablation_report import ablation_rows, latest_matrix_log
+
+
+def sample(sample_id: str, digest: str, variants: list[str], recall: float) -> EvalSample:
+    return EvalSample(
+        id=sample_id, epoch=1, input="doc", target="",
+        metadata={"ablation_prompt": digest, "ablations": variants},
+        scores={"severity_calibration": Score(value=0.0, metadata={"recall": recall})},
+    )
+
+
+def matrix_log(samples: list[EvalSample], task: str = "ablation_matrix") -> EvalLog:
+    return EvalLog(
+        eval=EvalSpec(task=task, created="2026-01-01T00:00:00+00:00", model="mockllm/model",
+                      dataset=EvalDataset(), config=EvalConfig()),
+        status="success",
+        samples=samples,
+    )
+
+
+def test_rows_report_deltas_against_control():
+    rows = ablation_rows(matrix_log([
+        sample("no_process", "b" * 64, ["no_process"], 0.2),
+        sample("control", "a" * 64, ["control", "missing"], 0.8),
+        sample("control", "a" * 64, ["control", "missing"], 0.6),
+        sample("no_examples", "c" * 64, ["no_examples"], 0.6),
+    ]))
+    assert [row["variants"] for row in rows] == [["control", "missing"], ["no_process"], ["no_examples"]]
+    control, process, examples = rows
+    assert control["samples"] == 2 and control["detection"] == pytest.approx(0.7)
+    assert process["delta"] == pytest.approx(-0.5)
+    assert process["meets_drop"] is True
+    assert examples["relative_drop"] == pytest.approx(1 / 7)
+    assert examples["meets_drop"] is False
+
+
+def test_rows_require_control():
+    with pytest.raises(ValueError):
+        ablation_rows(matrix_log([sample("x", "b" * 64, ["x"], 0.2)]))
+
+
+def test_latest_matrix_log_skips_other_tasks(tmp_path):
+    write_eval_log(matrix_log([], task="ablation_matrix"), str(tmp_path / "a.eval"))
+    write_eval_log(matrix_log([], task="severity_calibration_eval"), str(tmp_path / "b.eval"))
+    assert latest_matrix_log([tmp_path]) == tmp_path / "a.eval"
+    (tmp_path / "empty").mkdir()
+    with pytest.raises(FileNotFoundError):
+        latest_matrix_log([tmp_path / "empty"])
@@ -1,7 +1,13 @@
 import json
+import zipfile
 import pytest
 from pathlib import Path
-from tools.compare_to_baseline import compare_runs, RegressionStatus
+from tools.compare_to_baseline import (
+    ALPHA, FAIL_THRESHOLD, RegressionStatus, compare_batch, compare_runs, compare_samples,
+    compare_scorers, expand_paths, load_run, worst_status,
+)
+from tools import compare_to_baseline
+from tools.eval_index import connect
 
 
 def _make_result(recall: float, precision: float, f1: float) -> dict:
@@ -42,3 +48,203 @@ def test_delta_values_correct():
     assert delta["recall"] == pytest.approx(-0.05, abs=1e-4)
     assert delta["precision"] == pytest.approx(-0.05, abs=1e-4)
     assert delta["f1"] == pytest.approx(-0.05, abs=1e-4)
+
+
+def write_log(
+    path: Path, task: str, scores: dict[str, dict[str, list[float]]], git: str = "abc1234",
+    created: str = "2026-02-01T00:00:00",
+) -> Path:
+    """Minimal .eval archive; scores maps scorer -> sample id -> epoch values."""
+    header = {
+        "status": "success",
+        "eval": {"task": task, "model": "anthropic/claude-sonnet-4-5", "created": created,
+                 "tags": [f"git={git}"], "task_args": {}},
+        "results": {"scores": [
+            {
+                "name": scorer, "reducer": "reviewer_epochs",
+                "metrics": {"mean": {"name": "mean", "value": sum(
+                    sum(v) / len(v) for v in samples.values()) / len(samples)}},
+            }
+            for scorer, samples in scores.items()
+        ]},
+    }
+    reductions = [
+        {
+            "scorer": scorer, "reducer": "reviewer_epochs",
+            "samples": [
+                {"sample_id": sample_id, "value": sum(values) / len(values),
+                 "metadata": {"epoch_values": values}}
+                for sample_id, values in samples.items()
+            ],
+        }
+        for scorer, samples in scores.items()
+    ]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("header.json", json.dumps(header))
+        zf.writestr("reductions.json", json.dumps(reductions))
+        zf.writestr("samples/doc_epoch_1.json", "not json — never read")
+    return path
+
+
+def _statuses(rows: list[dict]) -> dict:
+    return {(row["scorer"], row["metric"]): row["status"] for row in rows}
+
+
+def test_load_run_reads_header_and_reductions_only(tmp_path):
+    run = load_run(write_log(tmp_path / "a.eval", "scope_guardian_eval", {
+        "reverse_judge_precision": {"doc": [0.8]},
+        "must_find_recall": {"doc": [1.0]},
+    }))
+    assert run["reviewer"] == "scope-guardian"
+    assert run["git"] == "abc1234"
+    assert run["metrics"]["must_find_recall"] == {"mean": 1.0}
+    assert run["samples"]["reverse_judge_precision"] == {"doc": [0.8]}
+
+
+def test_load_run_accepts_legacy_json_baseline(tmp_path):
+    path = tmp_path / "baseline.json"
+    path.write_text(json.dumps({**_make_result(0.9, 0.8, 0.85), "metadata": {"git": "old"}}))
+    run = load_run(path)
+    assert run["metrics"] == {"severity_calibration": {"recall": 0.9, "precision": 0.8, "f1": 0.85}}
+    assert run["git"] == "old"
+
+
+def test_compare_scorers_covers_every_scorer(tmp_path):
+    baseline = load_run(write_log(tmp_path / "b.eval", "scope_guardian_eval", {
+        "reverse_judge_precision": {"doc": [0.8]}, "must_find_recall": {"doc": [1.0]},
+    }))
+    current = load_run(write_log(tmp_path / "c.eval", "scope_guardian_eval", {
+        "reverse_judge_precision": {"doc": [0.82]}, "must_find_recall": {"doc": [0.5]},
+    }))
+    statuses = _statuses(compare_scorers(baseline, current))
+    assert statuses == {
+        ("must_find_recall", "mean"): RegressionStatus.FAIL,
+        ("reverse_judge_precision", "mean"): RegressionStatus.PASS,
+    }
+
+
+def test_compare_scorers_fails_on_missing_scorer(tmp_path):
+    baseline = load_run(write_log(tmp_path / "b.eval", "t_eval", {
+        "reverse_judge_precision": {"doc": [0.8]}, "must_find_recall": {"doc": [1.0]},
+    }))
+    current = load_run(write_log(tmp_path / "c.eval", "t_eval", {
+        "reverse_judge_precision": {"doc": [0.8]},
+    }))
+    rows = compare_scorers(baseline, current)
+    missing = next(row for row in rows if row["metric"] is None)
+    assert (missing["scorer"], missing["missing"], missing["status"]) == (
+        "must_find_recall", "current", RegressionStatus.FAIL,
+    )
+    rows = compare_scorers(current, baseline)
+    missing = next(row for row in rows if row["metric"] is None)
+    assert (missing["missing"], missing["status"]) == ("baseline", RegressionStatus.FAIL)
+
+
+def write_severity_log(path: Path, recall: float) -> Path:
+    """A severity_calibration log failing its threshold either way (accuracy 0)."""
+    header = {
+        "status": "success",
+        "eval": {"task": "severity_calibration_eval", "created": "2026-02-01T00:00:00", "task_args": {}},
+        "results": {"scores": [{"name": "severity_calibration",
+                                "metrics": {"accuracy": {"name": "accuracy", "value": 0.0}}}]},
+    }
+    reductions = [{"scorer": "severity_calibration", "samples": [
+        {"sample_id": "doc", "value": 0.0,
+         "metadata": {"recall": recall, "precision": 0.5, "f1": 2 * recall * 0.5 / (recall + 0.5)}},
+    ]}]
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("header.json", json.dumps(header))
+        zf.writestr("reductions.json", json.dumps(reductions))
+    return path
+
+
+def test_recall_drop_in_reductions_metadata_fails(tmp_path):
+    baseline = load_run(write_severity_log(tmp_path / "b.eval", recall=1.0))
+    current = load_run(write_severity_log(tmp_path / "c.eval", recall=0.2))
+    assert baseline["metrics"]["severity_calibration"]["recall"] == 1.0
+    statuses = _statuses(compare_scorers(baseline, current))
+    assert statuses[("severity_calibration", "accuracy")] == RegressionStatus.PASS
+    assert statuses[("severity_calibration", "recall")] == RegressionStatus.FAIL
+
+
+def test_legacy_baseline_gates_severity_calibration_log(tmp_path):
+    path = tmp_path / "baseline.json"
+    path.write_text(json.dumps(_make_result(1.0, 0.5, 0.667)))
+    current = load_run(write_severity_log(tmp_path / "c.eval", recall=0.2))
+    rows = compare_scorers(load_run(path), current)
+    assert {row["metric"] for row in rows} == {"recall", "precision", "f1"}
+    assert worst_status(row["status"] for row in rows) == RegressionStatus.FAIL
+
+
+def test_noisy_epoch_drop_is_downgraded_to_warn(tmp_path):
+    baseline = load_run(write_log(tmp_path / "b.eval", "t_eval", {
+        "must_find_recall": {"doc": [1.0, 0.5, 1.0]},
+    }))
+    current = load_run(write_log(tmp_path / "c.eval", "t_eval", {
+        "must_find_recall": {"doc": [0.5, 1.0, 0.5]},
+    }))
+    [row] = compare_scorers(baseline, current)
+    assert row["delta"] < -FAIL_THRESHOLD
+    assert row["p_value"] > ALPHA
+    assert row["status"] == RegressionStatus.WARN
+
+
+def test_consistent_epoch_drop_fails(tmp_path):
+    samples_b = {f"doc{i}": [0.9, 0.95, 0.9, 0.92] for i in range(4)}
+    samples_c = {f"doc{i}": [0.5, 0.55, 0.5, 0.52] for i in range(4)}
+    baseline = load_run(write_log(tmp_path / "b.eval", "t_eval", {"must_find_recall": samples_b}))
+    current = load_run(write_log(tmp_path / "c.eval", "t_eval", {"must_find_recall": samples_c}))
+    [row] = compare_scorers(baseline, current)
+    assert row["p_value"] < ALPHA
+    assert row["status"] == RegressionStatus.FAIL
+
+
+def test_compare_samples_reports_per_sample_deltas(tmp_path):
+    baseline = load_run(write_log(tmp_path / "b.eval", "t_eval", {
+        "must_find_recall": {"doc1": [1.0], "doc2": [0.5]},
+    }))
+    current = load_run(write_log(tmp_path / "c.eval", "t_eval", {
+        "must_find_recall": {"doc1": [0.5, 0.7], "doc3": [1.0]},
+    }))
+    rows = {row["sample_id"]: row for row in compare_samples(baseline, current)}
+    assert rows["doc1"]["delta"] == pytest.approx(-0.4)
+    assert rows["doc1"]["epochs"] == (1, 2)
+    assert rows["doc2"]["current"] is None
+    assert rows["doc3"]["baseline"] is None
+
+
+def test_batch_matches_runs_to_baseline_of_same_task(tmp_path):
+    baselines = [
+        load_run(write_log(tmp_path / "b1.eval", "scope_guardian_eval", {"must_find_recall": {"d": [1.0]}})),
+        load_run(write_log(tmp_path / "b2.eval", "problem_framer_eval", {"must_find_recall": {"d": [0.5]}})),
+    ]
+    runs = [
+        load_run(write_log(tmp_path / "runs" / "r1.eval", "problem_framer_eval", {"must_find_recall": {"d": [0.5]}})),
+        load_run(write_log(tmp_path / "runs" / "r2.eval", "scope_guardian_eval", {"must_find_recall": {"d": [0.5]}})),
+        load_run(write_log(tmp_path / "runs" / "r3.eval", "other_eval", {"must_find_recall": {"d": [0.5]}})),
+    ]
+    results = compare_batch(baselines, runs)
+    assert [r["baseline"]["path"] if r["baseline"] else None for r in results] == [
+        str(tmp_path / "b2.eval"), str(tmp_path / "b1.eval"), None,
+    ]
+    assert [r["status"] for r in results] == [RegressionStatus.PASS, RegressionStatus.FAIL, None]
+
+
+def test_single_baseline_is_compared_to_every_run(tmp_path):
+    baseline = load_run(write_log(tmp_path / "b.eval", "a_eval", {"must_find_recall": {"d": [1.0]}}))
+    for i in range(3):
+        write_log(tmp_path / "runs" / f"shard{i}" / "r.eval", f"t{i}_eval", {"must_find_recall": {"d": [1.0]}})
+    runs = [load_run(path) for path in expand_paths([tmp_path / "runs"])]
+    assert len(runs) == 3
+    assert all(r["baseline"] is baseline for r in compare_batch([baseline], runs))
+
+
+def test_latest_log_is_top_level_run_not_newer_shard(tmp_path, monkeypatch):
+    logs = tmp_path / "logs"
+    run = write_log(logs / "run.eval", "severity_calibration", {"severity_calibration": {"doc": [1.0]}})
+    write_log(logs / "runs" / "20260202T000000Z" / "logs" / "shard" / "shard.eval", "agent_eval",
+              {"must_find_recall": {"doc": [1.0]}}, created="2026-02-02T00:00:00")
+    monkeypatch.setattr(compare_to_baseline, "LOGS_DIR", logs)
+    monkeypatch.setattr(compare_to_baseline, "connect", lambda: connect(tmp_path / "index.sqlite"))
+    assert compare_to_baseline._latest_log() == run
@@ -0,0 +1,59 @@
+import json
+import math
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from tools.eval_archive import EvalArchive
+
+
+def write_archive(path: Path, compression: int = zipfile.ZIP_DEFLATED) -> Path:
+    with zipfile.ZipFile(path, "w", compression=compression) as zf:
+        zf.writestr("header.json", json.dumps({"status": "success", "eval": {"task": "t_eval"}}))
+        zf.writestr("reductions.json", json.dumps([{"scorer": "s", "samples": []}]))
+        for sample_id in ("doc-a", "doc-b"):
+            for epoch in (1, 2):
+                zf.writestr(
+                    f"samples/{sample_id}_epoch_{epoch}.json",
+                    json.dumps({"id": sample_id, "epoch": epoch, "scores": {"s": {"value": math.nan}}}),
+                )
+    return path
+
+
+@pytest.mark.parametrize("compression", [zipfile.ZIP_DEFLATED, zipfile.ZIP_ZSTANDARD])
+def test_reads_header_and_reductions(tmp_path, compression):
+    with EvalArchive(write_archive(tmp_path / "a.eval", compression)) as archive:
+        assert archive.header()["eval"]["task"] == "t_eval"
+        assert archive.reductions()[0]["scorer"] == "s"
+        assert archive.summaries() == []
+        assert "header.json" in archive
+
+
+def test_lists_members_and_sample_keys(tmp_path):
+    with EvalArchive(write_archive(tmp_path / "a.eval")) as archive:
+        names = [member.name for member in archive.members()]
+        assert names[:2] == ["header.json", "reductions.json"]
+        assert archive.sample_keys() == [("doc-a", 1), ("doc-a", 2), ("doc-b", 1), ("doc-b", 2)]
+
+
+def test_iter_samples_filters_and_keeps_nan(tmp_path):
+    with EvalArchive(write_archive(tmp_path / "a.eval")) as archive:
+        samples = list(archive.iter_samples(sample_ids=["doc-b"], epochs=[2]))
+        assert [(s["id"], s["epoch"]) for s in samples] == [("doc-b", 2)]
+        assert math.isnan(samples[0]["scores"]["s"]["value"])
+        assert len(list(archive.iter_samples())) == 4
+
+
+def test_missing_member_raises_key_error(tmp_path):
+    with EvalArchive(write_archive(tmp_path / "a.eval")) as archive:
+        with pytest.raises(KeyError):
+            archive.read_sample("doc-c")
+
+
+@pytest.mark.parametrize("content", [b"", b"not a zip"])
+def test_unreadable_file_raises_bad_zip(tmp_path, content):
+    path = tmp_path / "partial.eval"
+    path.write_bytes(content)
+    with pytest.raises(zipfile.BadZipFile):
+        EvalArchive(path)
@@ -0,0 +1,136 @@
+import io
+import json
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+from tools.eval_archive import EvalArchive
+from tools.eval_index import compare, connect, latest_log, trend, update_index
+
+
+def write_log(
+    path: Path, task: str, git: str, created: str, precision: float,
+    task_args: dict | None = None,
+) -> Path:
+    header = {
+        "status": "success",
+        "eval": {
+            "task": task, "model": "anthropic/claude-sonnet-4-5", "created": created,
+            "run_id": created, "tags": [f"git={git}"], "task_args": task_args or {},
+        },
+        "results": {"scores": [{
+            "name": "reverse_judge_precision", "reducer": "mean",
+            "metrics": {"mean": {"name": "mean", "value": precision}},
+        }]},
+    }
+    reductions = [{
+        "scorer": "reverse_judge_precision", "reducer": "mean",
+        "samples": [{"sample_id": 1, "value": precision, "metadata": {"precision": precision}}],
+    }]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("header.json", json.dumps(header))
+        zf.writestr("reductions.json", json.dumps(reductions))
+        zf.writestr("samples/1_epoch_1.json", json.dumps({"big": "x" * 1000}))
+    return path
+
+
+def test_index_extracts_header_metrics_and_sample_scores(tmp_path):
+    logs = tmp_path / "logs"
+    write_log(logs / "a.eval", "scope_guardian_eval", "abc1234", "2026-02-01T00:00:00", 0.8)
+    conn = connect(tmp_path / "index.sqlite")
+
+    assert update_index(conn, logs) == (1, 0)
+
+    log = dict(conn.execute("SELECT task, reviewer, git, model FROM logs").fetchone())
+    assert log == {
+        "task": "scope_guardian_eval", "reviewer": "scope-guardian",
+        "git": "abc1234", "model": "anthropic/claude-sonnet-4-5",
+    }
+    sample = conn.execute("SELECT value, metadata FROM sample_scores").fetchone()
+    assert sample["value"] == 0.8
+    assert json.loads(sample["metadata"]) == {"precision": 0.8}
+
+
+def test_reindex_never_reopens_unchanged_archives(tmp_path):
+    logs = tmp_path / "logs"
+    write_log(logs / "a.eval", "scope_guardian_eval", "abc1234", "2026-02-01T00:00:00", 0.8)
+    conn = connect(tmp_path / "index.sqlite")
+    update_index(conn, logs)
+
+    write_log(logs / "b.eval", "scope_guardian_eval", "def5678", "2026-02-02T00:00:00", 0.9)
+    opened = []
+    real_archive = EvalArchive
+    with patch("tools.eval_index.EvalArchive", lambda p: opened.append(Path(p).name) or real_archive(p)):
+        assert update_index(conn, logs) == (1, 1)
+    assert opened == ["b.eval"]
+
+
+def test_trend_compare_and_latest(tmp_path):
+    logs = tmp_path / "logs"
+    write_log(logs / "a.eval", "agent_eval", "aaa", "2026-02-01T00:00:00", 0.6, {"agent": "problem-framer"})
+    write_log(logs / "b.eval", "agent_eval", "bbb", "2026-02-02T00:00:00", 0.9, {"agent": "problem-framer"})
+    conn = connect(tmp_path / "index.sqlite")
+    update_index(conn, logs)
+
+    values = [row["value"] for row in trend(conn, "reverse_judge_precision", reviewer="problem-framer")]
+    assert values == [0.6, 0.9]
+    (row,) = compare(conn, "aaa", "bbb")
+    assert row["reviewer"] == "problem-framer"
+    assert round(row["delta"], 6) == 0.3
+    assert latest_log(conn).endswith("b.eval")
+
+
+def test_latest_top_level_log_ignores_newer_nested_logs(tmp_path):
+    logs = tmp_path / "logs"
+    write_log(logs / "a.eval", "agent_eval", "aaa", "2026-02-01T00:00:00", 0.6)
+    write_log(logs / "runs" / "20260203T000000Z" / "logs" / "shard" / "s.eval",
+              "agent_eval", "bbb", "2026-02-03T00:00:00", 0.9)
+    write_log(logs / "rescored" / "a.eval", "agent_eval", "aaa", "2026-02-04T00:00:00", 0.7)
+    conn = connect(tmp_path / "index.sqlite")
+    update_index(conn, logs)
+
+    assert latest_log(conn).endswith("rescored/a.eval")
+    assert latest_log(conn, top_level=logs) == str(logs / "a.eval")
+    assert latest_log(conn, top_level=logs / "empty") is None
+
+
+def test_json_logs_are_indexed_and_other_json_ignored(tmp_path):
+    logs = tmp_path / "logs"
+    write_log(logs / "a.eval", "severity_calibration_eval", "aaa", "2026-02-01T00:00:00", 0.6)
+    with zipfile.ZipFile(logs / "a.eval") as zf:
+        header = json.loads(zf.read("header.json"))
+        reductions = json.loads(zf.read("reductions.json"))
+    header["eval"]["created"] = "2026-02-02T00:00:00"
+    (logs / "b.json").write_text(json.dumps({**header, "samples": [{"id": 1}], "reductions": reductions}))
+    (logs / "runs").mkdir()
+    (logs / "runs" / "summary.json").write_text(json.dumps({"shards": 1}))
+    conn = connect(tmp_path / "index.sqlite")
+
+    out = io.StringIO()
+    assert update_index(conn, logs, out=out) == (2, 0)
+    assert out.getvalue() == ""
+    assert latest_log(conn).endswith("b.json")
+    scores = conn.execute("SELECT value FROM sample_scores ORDER BY log_id").fetchall()
+    assert [row["value"] for row in scores] == [0.6, 0.6]
+    assert update_index(conn, logs) == (0, 2)
+
+
+def test_unreadable_archive_is_skipped_and_retried(tmp_path):
+    logs = tmp_path / "logs"
+    logs.mkdir()
+    (logs / "partial.eval").write_bytes(b"not a zip")
+    conn = connect(tmp_path / "index.sqlite")
+    assert update_index(conn, logs, out=io.StringIO()) == (0, 0)
+    assert conn.execute("SELECT COUNT(*) FROM logs").fetchone()[0] == 0
+
+
+def test_deleted_archives_are_dropped_from_index(tmp_path):
+    logs = tmp_path / "logs"
+    log = write_log(logs / "a.eval", "scope_guardian_eval", "abc", "2026-02-01T00:00:00", 0.8)
+    conn = connect(tmp_path / "index.sqlite")
+    update_index(conn, logs)
+    log.unlink()
+    update_index(conn, logs)
+    assert conn.execute("SELECT COUNT(*) FROM logs").fetchone()[0] == 0
+    assert conn.execute("SELECT COUNT(*) FROM sample_scores").fetchone()[0] == 0
@@ -0,0 +1,122 @@
+import asyncio
+import json
+
+import pytest
+from inspect_ai.log import (
+    EvalConfig, EvalDataset, EvalLog, EvalMetric, EvalResults, EvalSample, EvalScore, EvalSpec,
+    read_eval_log, write_eval_log,
+)
+from inspect_ai.log._log import EvalScorer
+from inspect_ai.model import ModelOutput
+from inspect_ai.scorer import Score
+
+from tools.rescore import (
+    drop_scores, logged_params, logged_scorers, parse_scorer_args, rescore_logs, scorer_params,
+)
+
+FINDING = {"type": "finding", "id": "a", "title": "Cache latency assumption unstated",
+           "severity": "Critical", "issue": "x", "section": "s"}
+EXPECTED = [
+    {"id": "e1", "title": "Cache latency assumption unstated", "severity": "Critical"},
+    {"id": "e2", "title": "Retry budget never bounded", "severity": "Critical"},
+]
+
+
+def write_log(path, scorers: list[EvalScorer] | None = None) -> None:
+    """A scored log with one completion, as inspect eval would leave it."""
+    sample = EvalSample(
+        id="doc", epoch=1, input="design doc", target="",
+        output=ModelOutput.from_content("mockllm/model", json.dumps(FINDING)),
+        metadata={"expected_findings": EXPECTED},
+        scores={"severity_calibration": Score(value=0.0), "other": Score(value=0.5)},
+    )
+    write_eval_log(EvalLog(
+        eval=EvalSpec(task="severity", created="2026-01-01T00:00:00+00:00", model="mockllm/model",
+                      dataset=EvalDataset(), config=EvalConfig(), scorers=scorers),
+        status="success",
+        samples=[sample],
+        results=EvalResults(total_samples=1, completed_samples=1, scores=[
+            EvalScore(name="severity_calibration", scorer="severity_calibration",
+                      metrics={"accuracy": EvalMetric(name="accuracy", value=0.0)}),
+            EvalScore(name="other", scorer="other", metrics={"mean": EvalMetric(name="mean", value=0.5)}),
+        ]),
+    ), str(path))
+
+
+def test_parse_scorer_args_decodes_json_values():
+    assert parse_scorer_args(["cache=false", "recall_threshold=0.8", "prompt_style=geval"]) == {
+        "cache": False, "recall_threshold": 0.8, "prompt_style": "geval",
+    }
+    with pytest.raises(ValueError):
+        parse_scorer_args(["cache"])
+
+
+def test_scorer_params_routes_args_and_keeps_cache_default():
+    params = scorer_params(["reverse_judge_precision", "severity_calibration"],
+                           {"prompt_style": "geval", "recall_threshold": 0.8})
+    assert params["reverse_judge_precision"] == {"cache": True, "prompt_style": "geval"}
+    assert params["severity_calibration"] == {"recall_threshold": 0.8}
+    with pytest.raises(ValueError, match="threshold"):
+        scorer_params(["severity_calibration"], {"threshold": 0.5})  # must_find_recall only
+
+
+def test_scorer_params_layers_logged_args_under_cli_args():
+    logged = {"severity_calibration": {"recall_threshold": 0.5, "precision_threshold": 0.5, "retired": 1}}
+    params = scorer_params(["severity_calibration", "reverse_judge_precision"], {"recall_threshold": 0.9}, logged)
+    assert params["severity_calibration"] == {"recall_threshold": 0.9, "precision_threshold": 0.5}
+    assert params["reverse_judge_precision"] == {"cache": True}
+    logged = {"reverse_judge_precision": {"cache": False, "prompt_style": "geval"}}
+    assert scorer_params(["reverse_judge_precision"], {}, logged)["reverse_judge_precision"] == {
+        "cache": False, "prompt_style": "geval",
+    }
+
+
+def test_drop_scores_keeps_other_scorers(tmp_path):
+    write_log(tmp_path / "run.eval")
+    log = read_eval_log(str(tmp_path / "run.eval"))
+    assert logged_scorers(log) == ["severity_calibration"]
+    drop_scores(log, {"severity_calibration"})
+    assert list(log.samples[0].scores) == ["other"]
+    assert [s.name for s in log.results.scores] == ["other"]
+
+
+def test_rescore_reapplies_scorer_with_new_args(tmp_path):
+    write_log(tmp_path / "run.eval")
+    rows = asyncio.run(rescore_logs(
+        [tmp_path / "run.eval"], scorer_args={"recall_threshold": 0.5, "precision_threshold": 0.5},
+    ))
+    assert rows[0]["before"]["severity_calibration"] == {"accuracy": 0.0}
+    assert rows[0]["after"]["severity_calibration"] == {"accuracy": 1.0}
+
+    rescored = read_eval_log(rows[0]["output"])
+    assert rows[0]["output"] == str(tmp_path / "rescored" / "run.eval")
+    assert sorted(s.name for s in rescored.results.scores) == ["other", "severity_calibration"]
+    scores = rescored.samples[0].scores
+    assert scores["other"].value == 0.5
+    assert scores["severity_calibration"].metadata["recall"] == 0.5
+    assert rescored.eval.metadata["rescored_from"] == str(tmp_path / "run.eval")
+    assert read_eval_log(str(tmp_path / "run.eval")).samples[0].scores["severity_calibration"].value == 0.0
+
+
+def test_rescore_reports_unreadable_logs_as_errors(tmp_path):
+    (tmp_path / "broken.eval").write_bytes(b"not a zip")
+    rows = asyncio.run(rescore_logs([tmp_path / "broken.eval"], output_dir=tmp_path / "out"))
+    assert "error" in rows[0]
+
+
+def test_rescore_reuses_logged_scorer_args(tmp_path):
+    logged = {"recall_threshold": 0.5, "precision_threshold": 0.5}
+    write_log(tmp_path / "run.eval", scorers=[EvalScorer(name="severity_calibration", options=logged)])
+    assert logged_params(read_eval_log(str(tmp_path / "run.eval"))) == {"severity_calibration": logged}
+
+    rows = asyncio.run(rescore_logs([tmp_path / "run.eval"], output_dir=tmp_path / "same"))
+    assert rows[0]["params"]["severity_calibration"] == logged
+    assert rows[0]["after"]["severity_calibration"] == {"accuracy": 1.0}
+    rescored = read_eval_log(rows[0]["output"], header_only=True)
+    assert logged_params(rescored)["severity_calibration"] == logged
+
+    rows = asyncio.run(rescore_logs(
+        [tmp_path / "run.eval"], scorer_args={"recall_threshold": 0.8}, output_dir=tmp_path / "override",
+    ))
+    assert rows[0]["params"]["severity_calibration"] == {"recall_threshold": 0.8, "precision_threshold": 0.5}
+    assert rows[0]["after"]["severity_calibration"] == {"accuracy": 0.0}
@@ -0,0 +1,83 @@
+from pathlib import Path
+
+from tools.run_suite import Shard, build_command, git_revision, merge_results, plan_shards, shard_env
+
+
+def test_plan_shards_covers_agents_and_datasets():
+    shards = plan_shards(["a", "b"], ["d1", "d2", "d3"], ["m"], epochs=3)
+    assert len(shards) == 6
+    assert {(s.agent, s.dataset) for s in shards} == {(a, d) for a in "ab" for d in ("d1", "d2", "d3")}
+    assert all(s.epochs == 3 for s in shards)
+
+
+def test_plan_shards_split_epochs_and_round_robin_models():
+    shards = plan_shards(["a"], ["d"], ["m1", "m2"], epochs=4, split_epochs=True)
+    assert [s.epoch_index for s in shards] == [0, 1, 2, 3]
+    assert all(s.epochs == 1 for s in shards)
+    assert [s.model for s in shards] == ["m1", "m2", "m1", "m2"]
+    assert len({s.shard_id for s in shards}) == 4
+
+
+def test_build_command_targets_agent_eval_with_shard_log_dir():
+    shard = Shard(agent="scope-guardian", dataset="ds", model="anthropic/x", epochs=2)
+    cmd = build_command(shard, Path("/runs/r1"), ["--max-samples", "1"])
+    assert "evals/reviewer_eval.py@agent_eval" in cmd
+    assert "epochs=2" in cmd
+    assert cmd[cmd.index("--log-dir") + 1] == f"/runs/r1/logs/{shard.shard_id}"
+    assert cmd[-2:] == ["--max-samples", "1"]
+
+
+def test_build_command_tags_every_shard_with_git_revision():
+    shards = plan_shards(["a", "b"], ["d"], ["m"])
+    commands = [build_command(shard, Path("/runs/r1")) for shard in shards]
+    tags = [cmd[cmd.index("--tags") + 1] for cmd in commands]
+    assert git_revision()
+    assert all(tag.split(",")[-1] == f"git={git_revision()}" for tag in tags)
+    assert tags[0].startswith(f"run=r1,shard={shards[0].shard_id},")
+
+
+def test_shard_env_splits_judge_limits(monkeypatch):
+    monkeypatch.delenv("PARALLAX_JUDGE_CONCURRENCY", raising=False)
+    monkeypatch.setenv("PARALLAX_JUDGE_RPM", "100")
+    env = shard_env(jobs=4)
+    assert env["PARALLAX_JUDGE_CONCURRENCY"] == "2"
+    assert env["PARALLAX_JUDGE_RPM"] == "25"
+    monkeypatch.setenv("PARALLAX_JUDGE_RPM", "37.5")
+    assert shard_env(jobs=4)["PARALLAX_JUDGE_RPM"] == "9.375"
+    assert shard_env(jobs=100)["PARALLAX_JUDGE_RPM"] == "0.375"
+
+
+def test_merge_results_weights_by_samples_and_flags_failures():
+    def row(agent, shard_id, samples, precision, returncode=0, status="success"):
+        return {
+            "agent": agent, "shard_id": shard_id, "returncode": returncode,
+            "status": status, "samples": samples,
+            "scores": {"reverse_judge_precision": {"mean": precision}},
+        }
+
+    merged = merge_results([
+        row("a", "s1", 1, 1.0),
+        row("a", "s2", 3, 0.6),
+        row("b", "s3", 1, 0.5, returncode=1, status="error"),
+    ])
+    assert merged["by_agent"]["a"]["scores"]["reverse_judge_precision"]["mean"] == 0.7
+    assert merged["by_agent"]["b"]["succeeded"] == 0
+    assert merged["failed"] == ["s3"]
+    assert merged["overall"]["reverse_judge_precision"]["mean"] == 0.7
+
+
+def test_merge_results_drops_interval_metrics():
+    def row(shard_id, samples, value, ci):
+        return {
+            "agent": "a", "shard_id": shard_id, "returncode": 0, "status": "success",
+            "samples": samples,
+            "scores": {
+                "must_find": {"mean": value, "ci_lower": ci[0], "ci_upper": ci[1], "stderr": 0.1},
+                "severity_calibration": {"accuracy": value},
+            },
+        }
+
+    merged = merge_results([row("s1", 1, 1.0, (0.9, 1.0)), row("s2", 1, 0.0, (0.0, 0.1))])
+    assert merged["overall"]["must_find"] == {"mean": 0.5}
+    assert merged["overall"]["severity_calibration"] == {"accuracy": 0.5}
+    assert merged["by_agent"]["a"]["scores"] == merged["overall"]
@@ -0,0 +1,89 @@
+import json
+import random
+import re
+from pathlib import Path
+
+import pytest
+from jsonschema import Draft202012Validator
+
+from evals.utils.dataset_loader import clear_dataset_cache, load_validated_findings, read_jsonl
+from evals.utils.output_parser import parse_review_output
+from scorers.severity_scorer import match_findings
+from tools.synth_dataset import SynthConfig, finding_id, generate_dataset, reword
+
+SCHEMA = Path(__file__).parent.parent.parent / "schemas" / "reviewer-findings-v1.0.0.schema.json"
+
+
+@pytest.fixture(autouse=True)
+def fresh_dataset_cache():
+    clear_dataset_cache()
+    yield
+    clear_dataset_cache()
+
+
+def small(**overrides) -> SynthConfig:
+    return SynthConfig(**{"findings": 60, "doc_kb": 8, **overrides})
+
+
+def test_finding_id_matches_schema_pattern_past_1000():
+    pattern = re.compile(r"^v\d+-[a-z-]+-\d{3}$")
+    assert finding_id("scope-guardian", 7) == "v1-scope-guardian-007"
+    assert finding_id("scope-guardian", 1007) == "v2-scope-guardian-007"
+    assert all(pattern.match(finding_id("problem-framer", i)) for i in (0, 999, 1000, 123456))
+
+
+def test_generated_findings_are_schema_valid(tmp_path):
+    root = generate_dataset(tmp_path, "ds", small())
+    validator = Draft202012Validator(json.loads(SCHEMA.read_text()))
+    records = read_jsonl(root / "critical_findings.jsonl")
+    for path in (root / "completions").glob("*.jsonl"):
+        records += read_jsonl(path)
+    assert records
+    assert [r["id"] for r in records if list(validator.iter_errors(r))] == []
+
+
+def test_dataset_loads_with_configured_proportions(tmp_path):
+    root = generate_dataset(tmp_path, "ds", small(false_positive_rate=0.5, must_find_rate=0.25))
+    sample = load_validated_findings(str(root))[0]
+    assert len(sample.metadata["expected_findings"]) == 60
+    assert len(sample.metadata["must_find_findings"]) == 15
+    assert len(read_jsonl(root / "critical_findings.jsonl")) == 90
+    assert len({r["id"] for r in read_jsonl(root / "critical_findings.jsonl")}) == 90
+    doc = (root / "design.md").read_text()
+    for finding in sample.metadata["expected_findings"]:
+        assert f"## {finding['section']}\n" in doc
+        assert finding["issue"].split(";")[0] in doc
+
+
+def test_generation_is_deterministic_per_seed(tmp_path):
+    a = generate_dataset(tmp_path / "a", "ds", small())
+    b = generate_dataset(tmp_path / "b", "ds", small())
+    c = generate_dataset(tmp_path / "c", "ds", small(seed=1))
+    assert (a / "critical_findings.jsonl").read_text() == (b / "critical_findings.jsonl").read_text()
+    assert (a / "critical_findings.jsonl").read_text() != (c / "critical_findings.jsonl").read_text()
+
+
+def test_completion_overlap_and_noise_control_matches(tmp_path):
+    reviewer = "scope-guardian"
+
+    def matched(**overrides) -> tuple[int, int]:
+        root = generate_dataset(tmp_path / str(len(list(tmp_path.iterdir()))), "ds",
+                                small(findings=200, reviewers=[reviewer], **overrides))
+        expected = load_validated_findings(str(root))[0].metadata["expected_findings"]
+        actual = parse_review_output((root / "completions" / f"{reviewer}.jsonl").read_text())
+        return len(match_findings(actual, expected)[0]), len(actual)
+
+    assert matched(overlap=1.0, noise=0.0, fabricated=0.0) == (200, 200)
+    assert matched(overlap=0.0) == (0, 0)
+    exact, _ = matched(overlap=0.5, noise=0.0, fabricated=0.0)
+    noisy, reported = matched(overlap=0.5, noise=0.6, fabricated=1.0)
+    assert 70 < exact < 130
+    assert noisy < exact
+    assert reported > noisy * 2
+
+
+def test_reword_keeps_length_and_changes_with_noise():
+    title = "Unbounded retry budget in Kalomar"
+    assert reword(title, 0.0, random.Random(0)) == title
+    noisy = reword(title, 0.8, random.Random(0))
+    assert noisy != title and len(noisy.split()) == len(title.split())
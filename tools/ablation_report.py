@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Detection deltas for an ablation_matrix run, against its unablated control.
+
+Reads one evals/ablation_tests.py@ablation_matrix log (or the newest one under
+a directory) and prints one row per unique variant prompt. Detection is the
+mean severity_calibration recall over that prompt's samples (and epochs).
+Variants deduplicated onto the control's prompt are reported as such: their
+sections were not found, so the ablation measured nothing.
+
+Usage:
+    python tools/ablation_report.py logs/                    # newest ablation_matrix log
+    python tools/ablation_report.py run.eval --check         # exit 1 if any drop < --min-drop
+    python tools/ablation_report.py run.eval --json
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+from statistics import mean
+
+_REPO_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(_REPO_ROOT))
+
+from inspect_ai.log import EvalLog, read_eval_log  # noqa: E402
+
+from evals.ablation_tests import CONTROL  # noqa: E402
+from tools.compare_to_baseline import expand_paths  # noqa: E402
+
+MATRIX_TASK = "ablation_matrix"
+SCORER = "severity_calibration"
+DEFAULT_MIN_DROP = 0.5  # FR4: an ablated section should cost over half the detection rate
+
+
+def latest_matrix_log(paths: list[Path]) -> Path:
+    """Newest ablation_matrix log among paths (files are taken as given)."""
+    candidates = []
+    for path in expand_paths(paths):
+        if path in paths:
+            return path
+        header = read_eval_log(str(path), header_only=True)
+        if header.eval.task.split("/")[-1] == MATRIX_TASK:
+            candidates.append((header.eval.created, path))
+    if not candidates:
+        raise FileNotFoundError(f"No {MATRIX_TASK} logs under {', '.join(map(str, paths))}")
+    return max(candidates)[1]
+
+
+def ablation_rows(log: EvalLog, min_drop: float = DEFAULT_MIN_DROP) -> list[dict]:
+    """One row per variant prompt, control first, with detection and its delta."""
+    groups: dict[str, dict] = {}
+    for sample in log.samples or []:
+        digest = (sample.metadata or {}).get("ablation_prompt")
+        score = (sample.scores or {}).get(SCORER)
+        if digest is None or score is None or not score.metadata:
+            continue
+        group = groups.setdefault(digest, {"variants": sample.metadata["ablations"], "recall": []})
+        group["recall"].append(score.metadata["recall"])
+
+    control = next((g for g in groups.values() if CONTROL in g["variants"]), None)
+    if control is None:
+        raise ValueError(f"Log has no scored {CONTROL} samples")
+    baseline = mean(control["recall"])
+
+    rows = []
+    for digest, group in sorted(groups.items(), key=lambda item: CONTROL not in item[1]["variants"]):
+        detection = mean(group["recall"])
+        is_control = CONTROL in group["variants"]
+        drop = (baseline - detection) / baseline if baseline else None
+        rows.append({
+            "variants": group["variants"],
+            "prompt": digest[:12],
+            "samples": len(group["recall"]),
+            "detection": detection,
+            "delta": detection - baseline,
+            "relative_drop": drop,
+            "control": is_control,
+            "meets_drop": None if is_control or drop is None else drop >= min_drop,
+        })
+    return rows
+
+
+def _print_rows(rows: list[dict], source: str, min_drop: float) -> None:
+    print(f"{source}\n")
+    print(f"{'Variant':<32} {'Samples':>7} {'Detection':>9} {'Δ':>7} {'Drop':>6}")
+    print("-" * 66)
+    for row in rows:
+        if row["control"]:
+            print(f"{CONTROL:<32} {row['samples']:>7} {row['detection']:>9.2%}")
+            for name in row["variants"][1:]:
+                print(f"  = {name:<28} identical to control (sections not found)")
+            continue
+        drop = "—" if row["relative_drop"] is None else f"{row['relative_drop']:.0%}"
+        flag = "" if row["meets_drop"] is None else ("" if row["meets_drop"] else f"  < {min_drop:.0%}")
+        print(f"{' = '.join(row['variants']):<32} {row['samples']:>7} {row['detection']:>9.2%} "
+              f"{row['delta']:>+7.2%} {drop:>6}{flag}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Detection deltas for an ablation_matrix run")
+    parser.add_argument("paths", nargs="+", type=Path, help=".eval log or directories to search")
+    parser.add_argument("--min-drop", type=float, default=DEFAULT_MIN_DROP,
+                        help="Relative detection drop each ablation is expected to cause")
+    parser.add_argument("--check", action="store_true",
+                        help="Exit 1 if any ablation (including ones identical to control) misses --min-drop")
+    parser.add_argument("--json", action="store_true", help="Print rows as JSON")
+    args = parser.parse_args()
+
+    path = latest_matrix_log(args.paths)
+    rows = ablation_rows(read_eval_log(str(path)), args.min_drop)
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        _print_rows(rows, str(path), args.min_drop)
+    if args.check:
+        control = next(row for row in rows if row["control"])
+        failed = len(control["variants"]) > 1 or any(row["meets_drop"] is False for row in rows)
+        sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
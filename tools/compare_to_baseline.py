@@ -1,8 +1,28 @@
 #!/usr/bin/env python3
 """
-Compare latest eval run to stored baseline.
-Usage: python tools/compare_to_baseline.py [baseline_path] [current_path]
+Compare eval runs to a stored baseline.
+
+Every scorer in the logs is compared (reverse_judge_precision, must_find_recall,
+...), metric by metric and sample by sample. When either side ran with
+epochs > 1, the mean of each scorer is also checked with a paired permutation
+test (scorers.epoch_stats.paired_permutation_test); a drop past the FAIL
+threshold that is not significant at --alpha is downgraded to WARN. Scorers
+that record recall / precision / f1 in their sample metadata
+(severity_calibration) are also gated on the sample means of those, and a
+scorer present on only one side fails the comparison.
+
+Only header.json and reductions.json are read from each .eval archive.
+
+Usage:
+    python tools/compare_to_baseline.py [baseline_path] [current_path]     # default: latest log
+    python tools/compare_to_baseline.py --baseline BASELINE RUN [RUN ...]  # batch, one pass
+    python tools/compare_to_baseline.py --baseline evals/baselines/ logs/runs/<ts>/ --samples
+
+Directories expand to the .eval files under them. With one baseline, every
+run is compared to it; with several, each run is matched to the baseline of
+the same task, reviewer and dataset.
 """
+import argparse
 import json
 import sys
 import zipfile
@@ -11,10 +31,24 @@ from pathlib import Path
 
 
 _REPO_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(_REPO_ROOT))
+
+from scorers.epoch_stats import paired_permutation_test  # noqa: E402
+from tools.eval_index import (  # noqa: E402
+    _float_or_none, _git_for, _reviewer_for, connect, latest_log, read_log_summary, update_index,
+)
+
 BASELINE_PATH = _REPO_ROOT / "evals" / "baselines" / "v3_critical_baseline.json"
 LOGS_DIR = _REPO_ROOT / "logs"
 WARN_THRESHOLD = 0.05
 FAIL_THRESHOLD = 0.10
+ALPHA = 0.05
+LEGACY_SCORER = "severity_calibration"  # what the legacy internal shape recorded
+# Per-sample metadata values gated alongside the header metrics.
+_METADATA_METRICS = ("recall", "precision", "f1")
+
+# Spread and interval metrics are reported but never gate a run.
+_UNGATED_METRICS = {"stderr", "std", "var", "ci_lower", "ci_upper"}
 
 
 class RegressionStatus(Enum):
@@ -23,36 +57,11 @@ class RegressionStatus(Enum):
     FAIL = "FAIL"
 
 
-def _load_eval_log(path: Path) -> dict:
-    """
-    Load an Inspect AI log file and normalise it to the internal dict shape:
-
-        {"results": [{"scores": [{"metadata": {recall, precision, f1}}]}]}
-
-    Inspect AI writes logs as ZIP archives (*.eval) containing several JSON
-    files.  The per-sample scorer metadata we need lives in reductions.json:
-
-        reductions[0]["samples"][0]["metadata"] -> {recall, precision, f1, ...}
-
-    Plain JSON files (e.g. hand-crafted baselines) are loaded as-is and must
-    already conform to the internal shape.
-    """
-    if not zipfile.is_zipfile(path):
-        return json.loads(path.read_text())
-
-    with zipfile.ZipFile(path) as zf:
-        reductions = json.loads(zf.read("reductions.json"))
-    # reductions is a list of scorer dicts; aggregate across samples by
-    # averaging so that multi-sample runs produce a single metric set.
-    samples = reductions[0]["samples"]
-    keys = ("recall", "precision", "f1")
-    agg = {k: sum(s["metadata"][k] for s in samples) / len(samples)
-           for k in keys}
-    return {"results": [{"scores": [{"metadata": agg}]}]}
+_SEVERITY = {RegressionStatus.PASS: 0, RegressionStatus.WARN: 1, RegressionStatus.FAIL: 2}
 
 
 def _extract_metrics(run: dict) -> dict:
-    """Extract recall/precision/f1 from the internal run dict."""
+    """Extract recall/precision/f1 from the legacy internal run dict."""
     try:
         scores = run["results"][0]["scores"][0]["metadata"]
         return {
@@ -64,68 +73,334 @@ def _extract_metrics(run: dict) -> dict:
         raise ValueError(f"Cannot extract metrics from run: {e}")
 
 
+def _status(delta: float, threshold: float, warn_threshold: float) -> RegressionStatus:
+    if delta < -threshold:
+        return RegressionStatus.FAIL
+    if delta < -warn_threshold:
+        return RegressionStatus.WARN
+    return RegressionStatus.PASS
+
+
+def worst_status(statuses) -> RegressionStatus:
+    return max(statuses, key=_SEVERITY.__getitem__, default=RegressionStatus.PASS)
+
+
 def compare_runs(
     baseline: dict,
     current: dict,
     threshold: float = FAIL_THRESHOLD,
     warn_threshold: float = WARN_THRESHOLD,
 ) -> tuple[RegressionStatus, dict]:
+    """Compare two runs in the legacy {"results": [{"scores": [{"metadata": ...}]}]} shape."""
     b = _extract_metrics(baseline)
     c = _extract_metrics(current)
 
     delta = {k: c[k] - b[k] for k in b}
-    worst_drop = min(delta.values())
+    return _status(min(delta.values()), threshold, warn_threshold), delta
 
-    if worst_drop < -threshold:
-        status = RegressionStatus.FAIL
-    elif worst_drop < -warn_threshold:
-        status = RegressionStatus.WARN
-    else:
-        status = RegressionStatus.PASS
 
-    return status, delta
+def _sample_values(reductions: list[dict]) -> dict[str, dict[str, list[float]]]:
+    """scorer -> sample id -> epoch values (a single value when not reduced over epochs)."""
+    samples: dict[str, dict[str, list[float]]] = {}
+    for reduction in reductions:
+        if reduction["scorer"] in samples:  # first reducer per scorer
+            continue
+        by_sample = samples[reduction["scorer"]] = {}
+        for sample in reduction.get("samples") or []:
+            values = (sample.get("metadata") or {}).get("epoch_values")
+            if values is None:
+                value = _float_or_none(sample.get("value"))
+                values = [] if value is None else [value]
+            by_sample[str(sample.get("sample_id"))] = values
+    return samples
 
 
-def _format_metrics(label: str, metrics: dict) -> str:
-    """Format a single metrics line for console output."""
-    return f"  {label}  recall={metrics['recall']:.2f}  precision={metrics['precision']:.2f}  f1={metrics['f1']:.2f}"
+def _metadata_metrics(reductions: list[dict]) -> dict[str, dict[str, float]]:
+    """scorer -> mean of each _METADATA_METRICS value that every reduced sample records."""
+    metrics: dict[str, dict[str, float]] = {}
+    for reduction in reductions:
+        if reduction["scorer"] in metrics:  # first reducer per scorer
+            continue
+        samples = [sample.get("metadata") or {} for sample in reduction.get("samples") or []]
+        metrics[reduction["scorer"]] = {
+            key: sum(values) / len(values)
+            for key in _METADATA_METRICS
+            if samples and None not in (values := [_float_or_none(m.get(key)) for m in samples])
+        }
+    return metrics
 
 
-def main():
-    baseline_path = Path(sys.argv[1]) if len(sys.argv) > 1 else BASELINE_PATH
-    if not baseline_path.exists():
-        print(f"No baseline found at {baseline_path}. Run 'make baseline' first.")
-        sys.exit(1)
+def _run_from_log(path: Path, header: dict, reductions: list[dict]) -> dict:
+    eval_spec = header.get("eval", {})
+    task_args = eval_spec.get("task_args") or {}
+    results = header.get("results") or {}
+    metadata_metrics = _metadata_metrics(reductions)
+    return {
+        "path": str(path),
+        "task": eval_spec.get("task"),
+        "reviewer": _reviewer_for(eval_spec.get("task"), task_args),
+        "dataset": task_args.get("dataset"),
+        "model": eval_spec.get("model"),
+        "created": eval_spec.get("created"),
+        "git": _git_for(eval_spec) or "unknown",
+        "metrics": {
+            score["name"]: {
+                **metadata_metrics.get(score["name"], {}),
+                **{
+                    name: _float_or_none(metric.get("value"))
+                    for name, metric in (score.get("metrics") or {}).items()
+                },
+            }
+            for score in results.get("scores") or []
+        },
+        "samples": _sample_values(reductions),
+    }
 
-    # Find most recent log -- Inspect AI writes *.eval (ZIP) files, not *.json
-    logs = sorted(
-        list(LOGS_DIR.glob("*.eval")) + list(LOGS_DIR.glob("*.json")),
-        key=lambda p: p.stat().st_mtime,
-        reverse=True,
-    )
-    if not logs:
-        print(f"No eval logs found in {LOGS_DIR}/. Run 'make eval' first.")
-        sys.exit(1)
 
-    current_path = Path(sys.argv[2]) if len(sys.argv) > 2 else logs[0]
+def load_run(path: Path) -> dict:
+    """Per-scorer metrics and per-sample values of one log.
+
+    .eval archives are read for header.json and reductions.json only; JSON
+    Inspect logs (--log-format json) are parsed whole. Sample-mean recall,
+    precision and f1 from reductions metadata join each scorer's header
+    metrics. Hand-crafted baselines in the legacy internal shape hold
+    severity_calibration's recall/precision/f1.
+    """
+    path = Path(path)
+    if zipfile.is_zipfile(path):
+        header, reductions = read_log_summary(path)
+        return _run_from_log(path, header, reductions)
+    data = json.loads(path.read_text())
+    if "eval" in data:
+        return _run_from_log(path, data, data.get("reductions") or [])
+    return {
+        "path": str(path), "task": None, "reviewer": None, "dataset": None,
+        "model": None, "created": None,
+        "git": data.get("metadata", {}).get("git", "unknown"),
+        "metrics": {LEGACY_SCORER: _extract_metrics(data)},
+        "samples": {},
+    }
+
+
+def _mean(values: list[float]) -> float | None:
+    return sum(values) / len(values) if values else None
+
+
+def paired_test(baseline_samples: dict, current_samples: dict) -> dict | None:
+    """Permutation test over samples present in both runs; None without epochs."""
+    pairs = [
+        (baseline_samples[sample_id], current_samples[sample_id])
+        for sample_id in sorted(baseline_samples.keys() & current_samples.keys())
+    ]
+    if not any(len(values) > 1 for pair in pairs for values in pair):
+        return None
+    result = paired_permutation_test(pairs)
+    if result is None:
+        return None
+    return {"samples": len(pairs), "delta": result[0], "p_value": result[1]}
+
 
-    baseline = _load_eval_log(baseline_path)
-    current = _load_eval_log(current_path)
+def compare_scorers(
+    baseline: dict,
+    current: dict,
+    threshold: float = FAIL_THRESHOLD,
+    warn_threshold: float = WARN_THRESHOLD,
+    alpha: float = ALPHA,
+) -> list[dict]:
+    """One row per scorer × metric. A scorer missing from either run FAILs."""
+    rows = []
+    for scorer in sorted(baseline["metrics"].keys() | current["metrics"].keys()):
+        b_metrics = baseline["metrics"].get(scorer)
+        c_metrics = current["metrics"].get(scorer)
+        if b_metrics is None or c_metrics is None:
+            rows.append({
+                "scorer": scorer, "metric": None, "baseline": None, "current": None,
+                "delta": None, "p_value": None,
+                "missing": "current" if c_metrics is None else "baseline",
+                "status": RegressionStatus.FAIL,
+            })
+            continue
+        test = paired_test(
+            baseline["samples"].get(scorer, {}), current["samples"].get(scorer, {})
+        )
+        for metric in sorted(b_metrics.keys() & c_metrics.keys()):
+            b, c = b_metrics[metric], c_metrics[metric]
+            delta = c - b if None not in (b, c) else None
+            p_value = test["p_value"] if test and metric == "mean" else None
+            status = RegressionStatus.PASS
+            if delta is not None and metric not in _UNGATED_METRICS:
+                status = _status(delta, threshold, warn_threshold)
+                if status == RegressionStatus.FAIL and p_value is not None and p_value >= alpha:
+                    status = RegressionStatus.WARN  # a drop this size is within epoch noise
+            rows.append({
+                "scorer": scorer, "metric": metric, "baseline": b, "current": c,
+                "delta": delta, "p_value": p_value, "status": status,
+            })
+    return rows
+
+
+def compare_samples(baseline: dict, current: dict) -> list[dict]:
+    """One row per scorer × sample present in either run, mean over epochs."""
+    rows = []
+    for scorer in sorted(baseline["samples"].keys() & current["samples"].keys()):
+        b_samples, c_samples = baseline["samples"][scorer], current["samples"][scorer]
+        for sample_id in sorted(b_samples.keys() | c_samples.keys()):
+            b = _mean(b_samples.get(sample_id, []))
+            c = _mean(c_samples.get(sample_id, []))
+            rows.append({
+                "scorer": scorer, "sample_id": sample_id, "baseline": b, "current": c,
+                "delta": c - b if None not in (b, c) else None,
+                "epochs": (len(b_samples.get(sample_id, [])), len(c_samples.get(sample_id, []))),
+            })
+    return rows
+
+
+def _run_key(run: dict) -> tuple:
+    return run["task"], run["reviewer"], run["dataset"]
+
+
+def pair_runs(baselines: list[dict], runs: list[dict]) -> list[tuple[dict | None, dict]]:
+    """Baseline for each run: the only baseline, else the newest one with the same key."""
+    if len(baselines) == 1:
+        return [(baselines[0], run) for run in runs]
+    by_key = {}
+    for baseline in sorted(baselines, key=lambda b: b["created"] or ""):
+        by_key[_run_key(baseline)] = baseline
+    return [(by_key.get(_run_key(run)), run) for run in runs]
+
+
+def compare_batch(
+    baselines: list[dict],
+    runs: list[dict],
+    threshold: float = FAIL_THRESHOLD,
+    warn_threshold: float = WARN_THRESHOLD,
+    alpha: float = ALPHA,
+) -> list[dict]:
+    """Compare every run to its baseline; each log is loaded once by the caller."""
+    results = []
+    for baseline, run in pair_runs(baselines, runs):
+        result = {"run": run, "baseline": baseline, "rows": [], "samples": [], "status": None}
+        if baseline is not None:
+            result["rows"] = compare_scorers(baseline, run, threshold, warn_threshold, alpha)
+            result["samples"] = compare_samples(baseline, run)
+            result["status"] = worst_status(row["status"] for row in result["rows"])
+        results.append(result)
+    return results
+
+
+def expand_paths(paths: list[Path]) -> list[Path]:
+    expanded = []
+    for path in paths:
+        expanded.extend(sorted(path.rglob("*.eval")) if path.is_dir() else [path])
+    return expanded
+
+
+def _fmt(value, spec: str = ".3f") -> str:
+    return "—" if value is None else format(value, spec)
+
+
+def _print_result(result: dict, show_samples: bool) -> None:
+    run, baseline = result["run"], result["baseline"]
+    label = run["task"] or "legacy"
+    if run["reviewer"]:
+        label += f" [{run['reviewer']}]"
+    if baseline is None:
+        print(f"\n{label}: no matching baseline — {run['path']}")
+        return
+    print(f"\n{label}  git:{baseline['git']} → git:{run['git']}  {run['path']}")
+    print(f"  {'scorer':<26} {'metric':<15} {'baseline':>8} {'current':>8} {'delta':>7} {'p':>6}  status")
+    for row in result["rows"]:
+        if row["metric"] is None:
+            print(f"  {row['scorer']:<26} {'(missing from ' + row['missing'] + ')':<49}  {row['status'].value}")
+            continue
+        print(
+            f"  {row['scorer']:<26} {row['metric']:<15} {_fmt(row['baseline']):>8} "
+            f"{_fmt(row['current']):>8} {_fmt(row['delta'], '+.3f'):>7} "
+            f"{_fmt(row['p_value'], '.3f'):>6}  {row['status'].value}"
+        )
+    if show_samples and result["samples"]:
+        print(f"  {'scorer':<26} {'sample':<15} {'baseline':>8} {'current':>8} {'delta':>7} epochs")
+        for row in result["samples"]:
+            print(
+                f"  {row['scorer']:<26} {row['sample_id']:<15} {_fmt(row['baseline']):>8} "
+                f"{_fmt(row['current']):>8} {_fmt(row['delta'], '+.3f'):>7} "
+                f"{row['epochs'][0]}/{row['epochs'][1]}"
+            )
+    print(f"  Status: {result['status'].value}")
+
+
+def _report(results: list[dict]) -> list[dict]:
+    """JSON-serialisable form of compare_batch output."""
+    def clean(rows):
+        return [
+            {**row, "status": row["status"].value} if "status" in row else row
+            for row in rows
+        ]
+
+    return [
+        {
+            "run": result["run"]["path"],
+            "baseline": result["baseline"]["path"] if result["baseline"] else None,
+            "task": result["run"]["task"],
+            "reviewer": result["run"]["reviewer"],
+            "git": result["run"]["git"],
+            "status": result["status"].value if result["status"] else None,
+            "scorers": clean(result["rows"]),
+            "samples": result["samples"],
+        }
+        for result in results
+    ]
+
+
+def _latest_log() -> Path | None:
+    conn = connect()
+    update_index(conn, LOGS_DIR, out=sys.stderr)
+    path = latest_log(conn, top_level=LOGS_DIR)  # not a shard under runs/ or a rescored/ copy
+    return Path(path) if path else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare eval runs to a stored baseline")
+    parser.add_argument("paths", nargs="*", type=Path,
+                        help="[baseline] [current ...] (without --baseline, the first path is the baseline)")
+    parser.add_argument("--baseline", action="append", type=Path,
+                        help="Baseline log or directory (repeat for one baseline per task)")
+    parser.add_argument("--samples", action="store_true", help="Print per-sample deltas")
+    parser.add_argument("--threshold", type=float, default=FAIL_THRESHOLD)
+    parser.add_argument("--warn-threshold", type=float, default=WARN_THRESHOLD)
+    parser.add_argument("--alpha", type=float, default=ALPHA,
+                        help="Significance level for the paired test when epochs > 1")
+    parser.add_argument("--json", type=Path, help="Also write the comparison as JSON")
+    args = parser.parse_args()
 
-    b_metrics = _extract_metrics(baseline)
-    c_metrics = _extract_metrics(current)
-    status, delta = compare_runs(baseline, current)
+    baseline_paths = args.baseline
+    run_paths = list(args.paths)
+    if not baseline_paths:
+        baseline_paths = [run_paths.pop(0) if run_paths else BASELINE_PATH]
+    for path in baseline_paths:
+        if not path.exists():
+            print(f"No baseline found at {path}. Run 'make baseline' first.")
+            sys.exit(1)
+    if not run_paths:
+        latest = _latest_log()
+        if latest is None:
+            print(f"No eval logs found in {LOGS_DIR}/. Run 'make eval' first.")
+            sys.exit(1)
+        run_paths = [latest]
 
-    b_git = baseline.get("metadata", {}).get("git", "unknown")
-    c_git = current.get("metadata", {}).get("git", "unknown")
+    baselines = [load_run(path) for path in expand_paths(baseline_paths)]
+    runs = [load_run(path) for path in expand_paths(run_paths)]
+    results = compare_batch(baselines, runs, args.threshold, args.warn_threshold, args.alpha)
 
-    print(f"\nComparing to baseline: {baseline_path}")
-    print(f"\n{_format_metrics(f'Baseline (git:{b_git}):', b_metrics)}")
-    print(_format_metrics(f"Current  (git:{c_git}):", c_metrics))
-    print(f"\n  Delta: recall={delta['recall']:+.2f}  precision={delta['precision']:+.2f}  f1={delta['f1']:+.2f}")
-    print(f"  Status: {status.value}")
+    print(f"Comparing {len(runs)} run(s) to {len(baselines)} baseline(s)")
+    for result in results:
+        _print_result(result, args.samples)
+    if args.json:
+        args.json.write_text(json.dumps(_report(results), indent=2))
 
-    if status == RegressionStatus.FAIL:
+    overall = worst_status(r["status"] for r in results if r["status"] is not None)
+    print(f"\nOverall: {overall.value}")
+    if overall == RegressionStatus.FAIL:
         sys.exit(1)
 
 
@@ -0,0 +1,129 @@
+"""
+Partial reads of Inspect .eval archives.
+
+An .eval log is a ZIP of JSON members: header.json, reductions.json,
+summaries.json and one samples/<id>_epoch_<n>.json per sample and epoch.
+read_eval_log() builds the whole log in memory. EvalArchive instead
+memory-maps the file and decompresses one member at a time, so reading the
+header of a multi-hundred-MB log touches a few KB of it, and iterating
+samples holds a single sample in memory.
+
+    with EvalArchive(path) as archive:
+        header = archive.header()
+        for sample in archive.iter_samples(epochs=[1]):
+            ...
+
+Members are decoded with stdlib json: Inspect writes NaN for unscored
+samples, which the json_codec fast backends reject.
+"""
+import json
+import mmap
+import re
+import zipfile
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any
+
+import inspect_ai.log  # noqa: F401 — registers zstd support in zipfile for .eval archives
+
+
+_SAMPLE_MEMBER = re.compile(r"^samples/(?P<id>.+)_epoch_(?P<epoch>\d+)\.json$")
+
+
+@dataclass(frozen=True)
+class Member:
+    name: str
+    size: int
+    compressed_size: int
+
+
+class EvalArchive:
+    """Read-only, member-at-a-time view of one .eval archive."""
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            if self.path.stat().st_size == 0:
+                raise zipfile.BadZipFile(f"{self.path} is empty")
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                self._zip = zipfile.ZipFile(self._map)
+            except ValueError as e:  # mmap raises ValueError where a file would raise OSError
+                raise zipfile.BadZipFile(f"{self.path}: {e}") from None
+        except BaseException:
+            self.close()
+            raise
+        self._names = set(self._zip.namelist())
+
+    def close(self) -> None:
+        for attr in ("_zip", "_map", "_file"):
+            handle = getattr(self, attr, None)
+            if handle is not None:
+                handle.close()
+                setattr(self, attr, None)
+
+    def __enter__(self) -> "EvalArchive":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def members(self) -> list[Member]:
+        return [
+            Member(info.filename, info.file_size, info.compress_size)
+            for info in self._zip.infolist()
+        ]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._names
+
+    def open(self, name: str) -> IO[bytes]:
+        """Decompressing stream over one member."""
+        return self._zip.open(name)
+
+    def read_json(self, name: str, default: Any = None) -> Any:
+        """One member parsed as JSON; default if the member is absent."""
+        if name not in self._names:
+            if default is not None:
+                return default
+            raise KeyError(f"{name} not in {self.path}")
+        with self.open(name) as stream:
+            return json.load(stream)
+
+    def header(self) -> dict:
+        return self.read_json("header.json")
+
+    def reductions(self) -> list[dict]:
+        return self.read_json("reductions.json", default=[])
+
+    def summaries(self) -> list[dict]:
+        return self.read_json("summaries.json", default=[])
+
+    def sample_keys(self) -> list[tuple[str, int]]:
+        """(sample id, epoch) of every sample member, in archive order."""
+        keys = []
+        for info in self._zip.infolist():
+            match = _SAMPLE_MEMBER.match(info.filename)
+            if match:
+                keys.append((match["id"], int(match["epoch"])))
+        return keys
+
+    def read_sample(self, sample_id: str | int, epoch: int = 1) -> dict:
+        return self.read_json(f"samples/{sample_id}_epoch_{epoch}.json")
+
+    def iter_samples(
+        self,
+        sample_ids: Iterable[str | int] | None = None,
+        epochs: Iterable[int] | None = None,
+    ) -> Iterator[dict]:
+        """Samples one member at a time, optionally restricted to ids / epochs."""
+        wanted_ids = {str(i) for i in sample_ids} if sample_ids is not None else None
+        wanted_epochs = set(epochs) if epochs is not None else None
+        for sample_id, epoch in self.sample_keys():
+            if wanted_ids is not None and sample_id not in wanted_ids:
+                continue
+            if wanted_epochs is not None and epoch not in wanted_epochs:
+                continue
+            yield self.read_sample(sample_id, epoch)
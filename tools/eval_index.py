@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Incremental SQLite index of Inspect logs, with a query CLI.
+
+Both .eval archives and JSON logs (--log-format json) are indexed; other
+JSON files under logs/ (e.g. run_suite's summary.json) are ignored. Each log
+is opened once: its header (task, model, git tag, metrics)
+and reductions (per-sample reduced scores and scorer metadata) are copied into
+logs/eval_index.sqlite. Later runs only stat the log directory and index new
+or modified files, so trend and comparison queries never reopen archives.
+
+Usage:
+    python tools/eval_index.py index                       # index new logs in logs/
+    python tools/eval_index.py latest [--task TASK]        # newest indexed log
+    python tools/eval_index.py trend --scorer must_find_recall [--reviewer scope-guardian]
+    python tools/eval_index.py compare GIT_A GIT_B [--scorer reverse_judge_precision]
+    python tools/eval_index.py sql "SELECT task, COUNT(*) FROM logs GROUP BY task"
+
+Rows are keyed by git tag (the Makefile's --tags git=<sha>, falling back to
+the revision Inspect records), task, model and reviewer (the task's agent /
+reviewer argument, else derived from the task name).
+"""
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import zipfile
+from pathlib import Path
+
+_REPO_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(_REPO_ROOT))
+
+from tools.eval_archive import EvalArchive  # noqa: E402
+
+LOGS_DIR = _REPO_ROOT / "logs"
+INDEX_PATH = LOGS_DIR / "eval_index.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS logs (
+    id          INTEGER PRIMARY KEY,
+    path        TEXT UNIQUE NOT NULL,
+    size        INTEGER NOT NULL,
+    mtime_ns    INTEGER NOT NULL,
+    status      TEXT,
+    created     TEXT,
+    run_id      TEXT,
+    task        TEXT,
+    model       TEXT,
+    reviewer    TEXT,
+    git         TEXT,
+    tags        TEXT,
+    task_args   TEXT
+);
+CREATE TABLE IF NOT EXISTS metrics (
+    log_id   INTEGER NOT NULL REFERENCES logs(id) ON DELETE CASCADE,
+    scorer   TEXT NOT NULL,
+    reducer  TEXT,
+    metric   TEXT NOT NULL,
+    value    REAL
+);
+CREATE TABLE IF NOT EXISTS sample_scores (
+    log_id     INTEGER NOT NULL REFERENCES logs(id) ON DELETE CASCADE,
+    scorer     TEXT NOT NULL,
+    reducer    TEXT,
+    sample_id  TEXT,
+    value      REAL,
+    metadata   TEXT
+);
+CREATE INDEX IF NOT EXISTS logs_key ON logs(git, task, model, reviewer);
+CREATE INDEX IF NOT EXISTS metrics_log ON metrics(log_id, scorer);
+CREATE INDEX IF NOT EXISTS sample_scores_log ON sample_scores(log_id, scorer);
+"""
+
+
+def connect(index_path: Path = INDEX_PATH) -> sqlite3.Connection:
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(index_path)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def _reviewer_for(task: str | None, task_args: dict) -> str | None:
+    for key in ("agent", "reviewer"):
+        if task_args.get(key):
+            return task_args[key]
+    if task and task.endswith("_eval"):
+        return task.removesuffix("_eval").rsplit("/", 1)[-1].replace("_", "-")
+    return None
+
+
+def _git_for(eval_spec: dict) -> str | None:
+    for tag in eval_spec.get("tags") or []:
+        if tag.startswith("git="):
+            return tag.removeprefix("git=")
+    commit = (eval_spec.get("revision") or {}).get("commit")
+    return commit[:7] if commit else None
+
+
+def _float_or_none(value) -> float | None:
+    return float(value) if isinstance(value, int | float) else None
+
+
+class NotALogError(ValueError):
+    """A .json file under the logs directory that is not an Inspect log."""
+
+
+def read_log_summary(path: Path) -> tuple[dict, list[dict]]:
+    """Header and reductions of one log.
+
+    .eval archives are read for header.json and reductions.json only (no
+    sample members); JSON logs are parsed whole and their samples dropped.
+    """
+    if path.suffix == ".json":
+        data = json.loads(path.read_text())
+        if not isinstance(data, dict) or "eval" not in data:
+            raise NotALogError(f"{path} is not an Inspect log")
+        reductions = data.pop("reductions", None) or []
+        data.pop("samples", None)
+        return data, reductions
+    with EvalArchive(path) as archive:
+        return archive.header(), archive.reductions()
+
+
+def index_log(conn: sqlite3.Connection, path: Path, stat: os.stat_result) -> None:
+    header, reductions = read_log_summary(path)
+    eval_spec = header.get("eval", {})
+    task_args = eval_spec.get("task_args") or {}
+    conn.execute("DELETE FROM logs WHERE path = ?", (str(path),))
+    log_id = conn.execute(
+        """INSERT INTO logs (path, size, mtime_ns, status, created, run_id, task, model,
+                             reviewer, git, tags, task_args)
+           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+        (
+            str(path), stat.st_size, stat.st_mtime_ns, header.get("status"),
+            eval_spec.get("created"), eval_spec.get("run_id"), eval_spec.get("task"),
+            eval_spec.get("model"), _reviewer_for(eval_spec.get("task"), task_args),
+            _git_for(eval_spec), json.dumps(eval_spec.get("tags") or []), json.dumps(task_args),
+        ),
+    ).lastrowid
+    results = header.get("results") or {}
+    conn.executemany(
+        "INSERT INTO metrics (log_id, scorer, reducer, metric, value) VALUES (?, ?, ?, ?, ?)",
+        [
+            (log_id, score["name"], score.get("reducer"), name, _float_or_none(metric.get("value")))
+            for score in results.get("scores") or []
+            for name, metric in (score.get("metrics") or {}).items()
+        ],
+    )
+    conn.executemany(
+        """INSERT INTO sample_scores (log_id, scorer, reducer, sample_id, value, metadata)
+           VALUES (?, ?, ?, ?, ?, ?)""",
+        [
+            (
+                log_id, reduction["scorer"], reduction.get("reducer"),
+                str(sample.get("sample_id")), _float_or_none(sample.get("value")),
+                json.dumps(sample.get("metadata") or {}),
+            )
+            for reduction in reductions
+            for sample in reduction.get("samples") or []
+        ],
+    )
+
+
+def update_index(
+    conn: sqlite3.Connection, logs_dir: Path = LOGS_DIR, out=sys.stdout
+) -> tuple[int, int]:
+    """Index .eval and JSON logs that are new or changed since they were indexed.
+
+    Returns (indexed, skipped). Unreadable logs (e.g. a run still being
+    written) are reported and retried on the next update; rows for logs
+    deleted from logs_dir are dropped.
+    """
+    known = {
+        row["path"]: (row["size"], row["mtime_ns"])
+        for row in conn.execute("SELECT path, size, mtime_ns FROM logs")
+    }
+    paths = sorted([*logs_dir.rglob("*.eval"), *logs_dir.rglob("*.json")])
+    present = {str(path) for path in paths}
+    with conn:
+        conn.executemany(
+            "DELETE FROM logs WHERE path = ?",
+            [(path,) for path in known if path not in present and Path(path).is_relative_to(logs_dir)],
+        )
+    indexed = skipped = 0
+    for path in paths:
+        stat = path.stat()
+        if known.get(str(path)) == (stat.st_size, stat.st_mtime_ns):
+            skipped += 1
+            continue
+        try:
+            with conn:
+                index_log(conn, path, stat)
+            indexed += 1
+        except NotALogError:
+            continue
+        except (zipfile.BadZipFile, KeyError, json.JSONDecodeError) as e:
+            print(f"⚠️  SKIP {path}: {e}", file=out)
+    return indexed, skipped
+
+
+def latest_log(
+    conn: sqlite3.Connection, task: str | None = None, top_level: Path | None = None
+) -> str | None:
+    """Newest indexed log; with top_level, only logs directly in that directory.
+
+    top_level leaves out nested logs such as run_suite shards (runs/<ts>/) and
+    rescore output (rescored/), which are indexed but are not runs of their own.
+    """
+    rows = conn.execute(
+        "SELECT path FROM logs WHERE (? IS NULL OR task = ?) ORDER BY created DESC, id DESC",
+        (task, task),
+    )
+    for row in rows:
+        if top_level is None or Path(row["path"]).parent == top_level:
+            return row["path"]
+    return None
+
+
+def trend(
+    conn: sqlite3.Connection,
+    scorer: str,
+    metric: str = "mean",
+    task: str | None = None,
+    reviewer: str | None = None,
+    model: str | None = None,
+) -> list[dict]:
+    """One row per log, oldest first: created, git, task, reviewer, model, value."""
+    rows = conn.execute(
+        """SELECT l.created, l.git, l.task, l.reviewer, l.model, m.value
+           FROM metrics m JOIN logs l ON l.id = m.log_id
+           WHERE m.scorer = ? AND m.metric = ?
+             AND (? IS NULL OR l.task = ?) AND (? IS NULL OR l.reviewer = ?)
+             AND (? IS NULL OR l.model = ?)
+           ORDER BY l.created, l.id""",
+        (scorer, metric, task, task, reviewer, reviewer, model, model),
+    )
+    return [dict(row) for row in rows]
+
+
+def compare(
+    conn: sqlite3.Connection,
+    git_a: str,
+    git_b: str,
+    scorer: str | None = None,
+    metric: str = "mean",
+) -> list[dict]:
+    """Per task / reviewer / model / scorer: mean metric at each git tag and the delta."""
+    rows = conn.execute(
+        """SELECT l.task, l.reviewer, l.model, m.scorer,
+                  AVG(CASE WHEN l.git = ? THEN m.value END) AS a,
+                  AVG(CASE WHEN l.git = ? THEN m.value END) AS b
+           FROM metrics m JOIN logs l ON l.id = m.log_id
+           WHERE m.metric = ? AND l.git IN (?, ?) AND (? IS NULL OR m.scorer = ?)
+           GROUP BY l.task, l.reviewer, l.model, m.scorer
+           ORDER BY l.task, m.scorer""",
+        (git_a, git_b, metric, git_a, git_b, scorer, scorer),
+    )
+    return [
+        {**dict(row), "delta": row["b"] - row["a"] if None not in (row["a"], row["b"]) else None}
+        for row in rows
+    ]
+
+
+def _print_rows(rows: list[dict]) -> None:
+    if not rows:
+        print("(no rows)")
+        return
+    columns = list(rows[0].keys())
+
+    def fmt(value):
+        return f"{value:.3f}" if isinstance(value, float) else ("" if value is None else str(value))
+
+    widths = {c: max(len(c), *(len(fmt(r[c])) for r in rows)) for c in columns}
+    print("  ".join(c.ljust(widths[c]) for c in columns))
+    print("  ".join("-" * widths[c] for c in columns))
+    for row in rows:
+        print("  ".join(fmt(row[c]).ljust(widths[c]) for c in columns))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Index and query Inspect logs (.eval and JSON)")
+    parser.add_argument("--logs-dir", type=Path, default=LOGS_DIR)
+    parser.add_argument("--index", type=Path, default=INDEX_PATH, help="SQLite index path")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("index", help="Index new or changed logs")
+    p_latest = sub.add_parser("latest", help="Print the newest indexed log path")
+    p_latest.add_argument("--task")
+    p_trend = sub.add_parser("trend", help="Metric over time")
+    p_trend.add_argument("--scorer", required=True)
+    p_trend.add_argument("--metric", default="mean")
+    p_trend.add_argument("--task")
+    p_trend.add_argument("--reviewer")
+    p_trend.add_argument("--model")
+    p_compare = sub.add_parser("compare", help="Metric at two git tags")
+    p_compare.add_argument("git_a")
+    p_compare.add_argument("git_b")
+    p_compare.add_argument("--scorer")
+    p_compare.add_argument("--metric", default="mean")
+    p_sql = sub.add_parser("sql", help="Run a read-only SQL query against the index")
+    p_sql.add_argument("query")
+    args = parser.parse_args()
+
+    conn = connect(args.index)
+    # Every query sees up-to-date data; already-indexed archives are only stat'ed.
+    indexed, skipped = update_index(conn, args.logs_dir, out=sys.stderr)
+
+    if args.command == "index":
+        print(f"Indexed {indexed} new logs ({skipped} unchanged) → {args.index}")
+    elif args.command == "latest":
+        path = latest_log(conn, args.task)
+        if path is None:
+            print(f"No indexed logs in {args.logs_dir}/.")
+            sys.exit(1)
+        print(path)
+    elif args.command == "trend":
+        _print_rows(trend(conn, args.scorer, args.metric, args.task, args.reviewer, args.model))
+    elif args.command == "compare":
+        _print_rows(compare(conn, args.git_a, args.git_b, args.scorer, args.metric))
+    elif args.command == "sql":
+        conn.execute("PRAGMA query_only = ON")
+        _print_rows([dict(row) for row in conn.execute(args.query)])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Re-score logged reviewer completions without re-running generation.
+
+Reads existing .eval logs, re-applies the chosen scorers to the completions
+they already contain (inspect_ai.score_async), and writes each result as a
+new .eval log. Iterating on a judge prompt or a matching threshold then costs
+only judge calls (severity_calibration costs nothing).
+
+Re-applied scorers replace their previous scores; every other scorer in the
+log is kept, so the rescored log compares scorer-by-scorer against the
+original with tools/compare_to_baseline.py. Logs are re-scored concurrently
+(--jobs at a time), and samples within a log concurrently. Judge calls from
+all of them share the process-wide judge dispatcher limits. Judge scorers
+default to cache=True, as in reviewer_eval. The cache key covers the system
+prompt and template, so only verdicts whose prompt changed are re-judged.
+
+Usage:
+    python tools/rescore.py logs/runs/<ts>/                        # every known scorer in each log
+    python tools/rescore.py run.eval --scorer reverse_judge_precision -S prompt_style=geval
+    python tools/rescore.py run.eval --scorer severity_calibration -S recall_threshold=0.8
+    python tools/rescore.py logs/ --output-dir logs/rescored/judge-v2 --jobs 8
+
+Each scorer is re-created with the arguments recorded for it in the log
+header (log.eval.scorers[*].options), so a rescore with no -S arguments
+reproduces the original configuration. -S key=value overrides them for every
+selected scorer that accepts key; values are parsed as JSON when possible
+(true, 0.8, null), else kept as strings.
+"""
+import argparse
+import asyncio
+import inspect
+import json
+import sys
+from pathlib import Path
+
+_REPO_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(_REPO_ROOT))
+
+from inspect_ai import score_async  # noqa: E402
+from inspect_ai.log import EvalLog, read_eval_log_async, write_eval_log_async  # noqa: E402
+
+from scorers.epoch_stats import reviewer_epochs  # noqa: E402,F401  (registers the logged reducer)
+from scorers.must_find_scorer import must_find_recall  # noqa: E402
+from scorers.reverse_judge_scorer import reverse_judge_precision  # noqa: E402
+from scorers.severity_scorer import severity_calibration  # noqa: E402
+from tools.compare_to_baseline import expand_paths  # noqa: E402
+
+SCORERS = {
+    "severity_calibration": severity_calibration,
+    "reverse_judge_precision": reverse_judge_precision,
+    "must_find_recall": must_find_recall,
+}
+# Defaults applied before logged and -S arguments, matching the reviewer_eval task.
+SCORER_DEFAULTS = {
+    "reverse_judge_precision": {"cache": True},
+    "must_find_recall": {"cache": True},
+}
+OUTPUT_SUBDIR = "rescored"
+
+
+def parse_scorer_args(pairs: list[str]) -> dict:
+    """["key=value", ...] → {key: value}, JSON-decoding values where possible."""
+    args = {}
+    for pair in pairs:
+        key, sep, raw = pair.partition("=")
+        if not sep or not key:
+            raise ValueError(f"Scorer argument must be key=value: {pair!r}")
+        try:
+            args[key] = json.loads(raw)
+        except json.JSONDecodeError:
+            args[key] = raw
+    return args
+
+
+def scorer_params(names: list[str], scorer_args: dict, logged: dict[str, dict] | None = None) -> dict[str, dict]:
+    """
+    Keyword arguments for each named scorer; every -S argument must fit one of them.
+
+    Precedence: SCORER_DEFAULTS < logged (the scorer's arguments in the original
+    run) < scorer_args. Logged arguments the scorer no longer accepts are dropped.
+    """
+    params = {}
+    unused = set(scorer_args)
+    for name in names:
+        accepted = inspect.signature(SCORERS[name]).parameters
+        params[name] = {
+            **SCORER_DEFAULTS.get(name, {}),
+            **{k: v for k, v in (logged or {}).get(name, {}).items() if k in accepted},
+            **{k: v for k, v in scorer_args.items() if k in accepted},
+        }
+        unused -= set(accepted)
+    if unused:
+        raise ValueError(f"No selected scorer accepts: {', '.join(sorted(unused))}")
+    return params
+
+
+def logged_scorers(log: EvalLog) -> list[str]:
+    """Scorers in the log that this tool can re-apply, in log order."""
+    names = [s.name for s in (log.eval.scorers or [])] or [
+        s.name for s in (log.results.scores if log.results else [])
+    ]
+    return [name for name in dict.fromkeys(names) if name in SCORERS]
+
+
+def logged_params(log: EvalLog) -> dict[str, dict]:
+    """Arguments each scorer was created with, as recorded in the log header."""
+    return {s.name: dict(s.options or {}) for s in (log.eval.scorers or [])}
+
+
+def drop_scores(log: EvalLog, names: set[str]) -> None:
+    """Remove the named scorers' sample scores, results and reductions from log."""
+    for sample in log.samples or []:
+        if sample.scores:
+            sample.scores = {k: v for k, v in sample.scores.items() if k not in names}
+    if log.results:
+        log.results.scores = [s for s in log.results.scores if s.name not in names]
+    if log.reductions:
+        log.reductions = [r for r in log.reductions if r.scorer not in names]
+    if log.eval.scorers:
+        log.eval.scorers = [s for s in log.eval.scorers if s.name not in names]
+
+
+def metric_values(log: EvalLog) -> dict[str, dict[str, float]]:
+    return {
+        score.name: {name: metric.value for name, metric in score.metrics.items()}
+        for score in (log.results.scores if log.results else [])
+    }
+
+
+def output_path(source: Path, output_dir: Path | None) -> Path:
+    return (output_dir or source.parent / OUTPUT_SUBDIR) / source.name
+
+
+async def rescore_log(
+    source: Path,
+    names: list[str] | None = None,
+    scorer_args: dict | None = None,
+    output_dir: Path | None = None,
+) -> dict:
+    """Re-score one log and write the result; returns a summary row."""
+    log = await read_eval_log_async(str(source))
+    if not log.samples:
+        raise ValueError(f"{source}: log has no samples to re-score")
+    names = names or logged_scorers(log)
+    if not names:
+        raise ValueError(f"{source}: no re-scorable scorers (expected one of {', '.join(SCORERS)})")
+    params = scorer_params(names, scorer_args or {}, logged_params(log))
+    before = metric_values(log)
+
+    drop_scores(log, set(names))
+    log = await score_async(
+        log,
+        [SCORERS[name](**params[name]) for name in names],
+        action="append",
+        display="none",
+        copy=False,
+    )
+    log.eval.metadata = {**(log.eval.metadata or {}), "rescored_from": str(source), "rescored": names}
+
+    target = output_path(source, output_dir)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    await write_eval_log_async(log, str(target))
+    after = metric_values(log)
+    return {
+        "source": str(source),
+        "output": str(target),
+        "scorers": names,
+        "params": params,
+        "samples": len(log.samples),
+        "before": {name: before.get(name, {}) for name in names},
+        "after": {name: after.get(name, {}) for name in names},
+    }
+
+
+async def rescore_logs(
+    sources: list[Path],
+    names: list[str] | None = None,
+    scorer_args: dict | None = None,
+    output_dir: Path | None = None,
+    jobs: int = 4,
+) -> list[dict]:
+    """Re-score logs concurrently, at most jobs at a time; failures become error rows."""
+    limit = asyncio.Semaphore(jobs)
+
+    async def run(source: Path) -> dict:
+        async with limit:
+            try:
+                return await rescore_log(source, names, scorer_args, output_dir)
+            except Exception as e:
+                return {"source": str(source), "error": f"{type(e).__name__}: {e}"}
+
+    return await asyncio.gather(*(run(source) for source in sources))
+
+
+def _headline(metrics: dict) -> tuple[str, float] | None:
+    name = "mean" if "mean" in metrics else next(iter(metrics), None)
+    return (name, metrics[name]) if name else None
+
+
+def _print_rows(rows: list[dict]) -> None:
+    for row in rows:
+        if "error" in row:
+            print(f"\nFAILED {row['source']}: {row['error']}")
+            continue
+        print(f"\n{row['source']} → {row['output']}  ({row['samples']} samples)")
+        for name in row["scorers"]:
+            after = _headline(row["after"][name])
+            if after is None:
+                print(f"  {name:<26} no score")
+                continue
+            before = row["before"][name].get(after[0])
+            shown = "—" if before is None else f"{before:.3f}"
+            print(f"  {name:<26} {after[0]} {shown} → {after[1]:.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-score logged completions without re-running generation")
+    parser.add_argument("paths", nargs="+", type=Path, help=".eval logs or directories of them")
+    parser.add_argument("--scorer", action="append", choices=sorted(SCORERS),
+                        help="Scorer to re-apply (repeatable; default: every known scorer in each log)")
+    parser.add_argument("-S", "--scorer-arg", action="append", default=[], metavar="KEY=VALUE",
+                        help="Argument for the selected scorers (repeatable)")
+    parser.add_argument("--output-dir", type=Path,
+                        help=f"Where to write rescored logs (default: {OUTPUT_SUBDIR}/ next to each log)")
+    parser.add_argument("--jobs", "-j", type=int, default=4, help="Logs re-scored concurrently")
+    parser.add_argument("--json", action="store_true", help="Print summary rows as JSON")
+    args = parser.parse_args()
+
+    try:
+        scorer_args = parse_scorer_args(args.scorer_arg)
+        if args.scorer:
+            scorer_params(args.scorer, scorer_args)  # fail fast on stray -S arguments
+    except ValueError as e:
+        parser.error(str(e))
+    # Directories skip earlier rescored/ output; explicitly named logs are always taken.
+    sources = [
+        p for p in expand_paths(args.paths)
+        if p in args.paths or OUTPUT_SUBDIR not in p.parent.parts
+    ]
+
+    rows = asyncio.run(rescore_logs(sources, args.scorer, scorer_args, args.output_dir, args.jobs))
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        _print_rows(rows)
+    sys.exit(1 if any("error" in row for row in rows) else 0)
+
+
+if __name__ == "__main__":
+    main()
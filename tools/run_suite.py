@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Run the reviewer eval suite as parallel shards and merge the results.
+
+Each shard is one `inspect eval evals/reviewer_eval.py@agent_eval` subprocess
+for an (agent, dataset[, epoch]) combination. Shards run in a local pool of
+--jobs workers and are spread round-robin across every --model given (e.g.
+the same model on two endpoints), so a full sweep takes roughly as long as
+the slowest shard rather than the sum. All .eval logs land in one run
+directory alongside a merged summary.json.
+
+Usage:
+    python tools/run_suite.py --jobs 6                              # all agents × all datasets
+    python tools/run_suite.py --agents scope-guardian,problem-framer --epochs 5 --split-epochs
+    python tools/run_suite.py --model anthropic/claude-sonnet-4-5 --model bedrock/... --dry-run
+    python tools/run_suite.py -- --max-samples 2                    # extra args for inspect eval
+
+The judge dispatcher limits are per process. PARALLAX_JUDGE_RPM (an account
+limit) is divided by --jobs, and so is the default PARALLAX_JUDGE_CONCURRENCY
+unless it is set explicitly, so the suite as a whole stays within one ceiling.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from functools import cache
+from pathlib import Path
+
+_REPO_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(_REPO_ROOT))
+
+from evals.utils.dataset_loader import discover_datasets  # noqa: E402
+from scorers.judge_dispatch import DEFAULT_MAX_CONCURRENCY  # noqa: E402
+
+AGENTS_DIR = _REPO_ROOT / "agents"
+EVAL_TASK = "evals/reviewer_eval.py@agent_eval"
+RUNS_DIR = _REPO_ROOT / "logs" / "runs"
+DEFAULT_MODEL = "anthropic/claude-sonnet-4-5"
+# Metrics that are means over samples, so shard values combine by sample weight.
+# Spread and interval metrics (stderr, ci_lower/ci_upper, ...) do not, and are
+# left to the per-shard rows.
+MERGED_METRICS = ("mean", "accuracy")
+
+
+@dataclass(frozen=True)
+class Shard:
+    agent: str
+    dataset: str
+    model: str
+    epochs: int = 1
+    epoch_index: int = 0
+
+    @property
+    def shard_id(self) -> str:
+        model = self.model.replace("/", "_")
+        return f"{self.agent}__{self.dataset}__{model}__e{self.epoch_index}"
+
+
+def discover_agents(agents_dir: Path = AGENTS_DIR) -> list[str]:
+    return sorted(path.stem for path in agents_dir.glob("*.md"))
+
+
+def plan_shards(
+    agents: list[str],
+    datasets: list[str],
+    models: list[str],
+    epochs: int = 1,
+    split_epochs: bool = False,
+) -> list[Shard]:
+    """One shard per agent × dataset (× epoch with split_epochs), models round-robin."""
+    combos = [
+        (agent, dataset, epoch_index)
+        for agent in agents
+        for dataset in datasets
+        for epoch_index in (range(epochs) if split_epochs else [0])
+    ]
+    return [
+        Shard(
+            agent=agent,
+            dataset=dataset,
+            model=models[i % len(models)],
+            epochs=1 if split_epochs else epochs,
+            epoch_index=epoch_index,
+        )
+        for i, (agent, dataset, epoch_index) in enumerate(combos)
+    ]
+
+
+def shard_log_dir(run_dir: Path, shard: Shard) -> Path:
+    return run_dir / "logs" / shard.shard_id
+
+
+@cache
+def git_revision() -> str:
+    """Short HEAD commit for the --tags of every shard (same as the Makefile's eval targets)."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=_REPO_ROOT,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip() or "unknown"
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def build_command(shard: Shard, run_dir: Path, extra_args: list[str] = ()) -> list[str]:
+    return [
+        sys.executable, "-m", "inspect_ai", "eval", EVAL_TASK,
+        "-T", f"agent={shard.agent}",
+        "-T", f"dataset={shard.dataset}",
+        "-T", f"epochs={shard.epochs}",  # task param keeps the reviewer_epochs reducer
+        "--model", shard.model,
+        "--log-dir", str(shard_log_dir(run_dir, shard)),
+        "--tags", f"run={run_dir.name},shard={shard.shard_id},git={git_revision()}",
+        *extra_args,
+    ]
+
+
+def shard_env(jobs: int) -> dict:
+    """Environment for shard subprocesses, splitting judge limits across jobs."""
+    env = dict(os.environ)
+    env.setdefault("PARALLAX_JUDGE_CONCURRENCY", str(max(1, DEFAULT_MAX_CONCURRENCY // jobs)))
+    if "PARALLAX_JUDGE_RPM" in os.environ:
+        # A rate, not a count: the dispatcher takes fractional RPM, so divide as a float.
+        env["PARALLAX_JUDGE_RPM"] = f"{float(os.environ['PARALLAX_JUDGE_RPM']) / jobs:g}"
+    return env
+
+
+def summarise_log(path: Path) -> dict:
+    """Per-scorer metrics and sample counts from an .eval log header."""
+    from inspect_ai.log import read_eval_log
+
+    log = read_eval_log(str(path), header_only=True)
+    results = log.results
+    return {
+        "status": log.status,
+        "samples": results.completed_samples if results else 0,
+        "scores": {
+            score.name: {name: metric.value for name, metric in score.metrics.items()}
+            for score in (results.scores if results else [])
+        },
+    }
+
+
+def run_shard(shard: Shard, run_dir: Path, extra_args: list[str], env: dict) -> dict:
+    log_dir = shard_log_dir(run_dir, shard)
+    log_dir.mkdir(parents=True, exist_ok=True)
+    t0 = time.monotonic()
+    with open(log_dir / "inspect.out", "w") as out:
+        proc = subprocess.run(
+            build_command(shard, run_dir, extra_args),
+            cwd=_REPO_ROOT, env=env, stdout=out, stderr=subprocess.STDOUT,
+        )
+    row = {
+        **asdict(shard),
+        "shard_id": shard.shard_id,
+        "returncode": proc.returncode,
+        "elapsed_s": time.monotonic() - t0,
+        "log": None,
+    }
+    logs = sorted(log_dir.glob("*.eval"))
+    if logs:
+        row["log"] = str(logs[-1].relative_to(run_dir))
+        try:
+            row.update(summarise_log(logs[-1]))
+        except Exception as e:  # corrupt or partial log — keep the row, flag it
+            row["status"] = f"unreadable: {e}"
+    return row
+
+
+def merge_results(rows: list[dict]) -> dict:
+    """Sample-weighted mean of each scorer's mean metrics, per agent and overall."""
+
+    def weighted(group: list[dict]) -> dict:
+        totals: dict[str, dict[str, list[float]]] = {}
+        for row in group:
+            weight = row.get("samples") or 0
+            for scorer_name, metrics in row.get("scores", {}).items():
+                for metric, value in metrics.items():
+                    if metric not in MERGED_METRICS:
+                        continue
+                    acc = totals.setdefault(scorer_name, {}).setdefault(metric, [0.0, 0.0])
+                    acc[0] += value * weight
+                    acc[1] += weight
+        return {
+            scorer_name: {m: (s / w if w else None) for m, (s, w) in metrics.items()}
+            for scorer_name, metrics in totals.items()
+        }
+
+    ok = [row for row in rows if row.get("returncode") == 0 and row.get("status") == "success"]
+    by_agent = {}
+    for agent in sorted({row["agent"] for row in rows}):
+        group = [row for row in ok if row["agent"] == agent]
+        by_agent[agent] = {
+            "shards": sum(1 for row in rows if row["agent"] == agent),
+            "succeeded": len(group),
+            "samples": sum(row.get("samples") or 0 for row in group),
+            "scores": weighted(group),
+        }
+    return {
+        "shards": len(rows),
+        "succeeded": len(ok),
+        "failed": [row["shard_id"] for row in rows if row not in ok],
+        "by_agent": by_agent,
+        "overall": weighted(ok),
+    }
+
+
+def _print_summary(merged: dict, wall_clock_s: float, shard_s: float) -> None:
+    print(f"\n{'Agent':<22} {'OK':>5} {'Samples':>8}  Scores (mean)")
+    print("-" * 72)
+    for agent, result in merged["by_agent"].items():
+        scores = "  ".join(
+            f"{name}={metrics.get('mean'):.2f}"
+            for name, metrics in result["scores"].items()
+            if metrics.get("mean") is not None
+        )
+        print(f"{agent:<22} {result['succeeded']:>2}/{result['shards']:<2} {result['samples']:>8}  {scores}")
+    print(f"\nWall clock {wall_clock_s:.0f}s vs {shard_s:.0f}s summed over shards")
+    for shard_id in merged["failed"]:
+        print(f"  FAILED {shard_id}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run reviewer eval shards in parallel")
+    parser.add_argument("--agents", help="Comma-separated agents (default: every agents/*.md)")
+    parser.add_argument("--datasets", help="Comma-separated dataset dirs (default: all under datasets/)")
+    parser.add_argument("--model", action="append", help="Model (repeat to spread shards round-robin)")
+    parser.add_argument("--epochs", type=int, default=1)
+    parser.add_argument("--split-epochs", action="store_true", help="Run each epoch as its own shard")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--run-dir", type=Path, help="Output directory (default: logs/runs/<timestamp>)")
+    parser.add_argument("--dry-run", action="store_true", help="Print shard commands and exit")
+    parser.add_argument("extra", nargs=argparse.REMAINDER, help="Arguments after -- go to inspect eval")
+    args = parser.parse_args()
+
+    agents = args.agents.split(",") if args.agents else discover_agents()
+    datasets = args.datasets.split(",") if args.datasets else [p.name for p in discover_datasets()]
+    models = args.model or [DEFAULT_MODEL]
+    extra = [a for a in args.extra if a != "--"]
+    run_dir = args.run_dir or RUNS_DIR / datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    shards = plan_shards(agents, datasets, models, args.epochs, args.split_epochs)
+
+    if args.dry_run:
+        for shard in shards:
+            print(" ".join(build_command(shard, run_dir, extra)))
+        return
+
+    run_dir.mkdir(parents=True, exist_ok=True)
+    print(f"Running {len(shards)} shards with {args.jobs} workers → {run_dir}")
+    env = shard_env(args.jobs)
+    t0 = time.monotonic()
+    with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        rows = list(pool.map(lambda shard: run_shard(shard, run_dir, extra, env), shards))
+    wall_clock_s = time.monotonic() - t0
+
+    merged = merge_results(rows)
+    summary = {
+        "run": run_dir.name,
+        "git": git_revision(),
+        "models": models,
+        "epochs": args.epochs,
+        "wall_clock_s": wall_clock_s,
+        "shard_seconds": sum(row["elapsed_s"] for row in rows),
+        **merged,
+        "rows": rows,
+    }
+    (run_dir / "summary.json").write_text(json.dumps(summary, indent=2))
+    _print_summary(merged, wall_clock_s, summary["shard_seconds"])
+    sys.exit(1 if merged["failed"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Generate synthetic datasets for load-testing the scorers and loaders.
+
+Real datasets hold 3–10 findings, which hides every scaling problem in
+match_findings, read_jsonl and the per-finding judge fan-out. Each generated
+dataset is a directory in the datasets/ layout, so load_validated_findings,
+discover_datasets and load_document_suite(root=...) read it like any other:
+
+    <out>/<name>/
+        metadata.json                     design_doc_path plus a "synthetic" block
+        design.md                         --doc-kb of sections; every flaw is stated
+                                          in the section its finding cites
+        critical_findings.jsonl           ground truth: reviewer-findings-v1.0.0
+                                          finding records + validation_status/reviewer
+                                          (--false-positive-rate are false_positive)
+        must_find.jsonl                   --must-find-rate of the real flaws, with min_recall
+        context_dependent_findings.jsonl  --context-rate extra findings + required_context
+        completions/<reviewer>.jsonl      simulated reviewer output (see below)
+
+A simulated completion reports --overlap of that reviewer's real flaws.
+--noise of each reported title's words are swapped or replaced, so
+match_findings misses more of them as noise grows. --fabricated more
+findings are made up per reported one. metadata["synthetic"]["completions"]
+lists the ground-truth ids each completion reports.
+
+Finding ids follow the schema pattern v{N}-{reviewer}-{NNN}; the iteration
+number N rolls over every 1000 findings per reviewer. Output is deterministic
+for a given --seed.
+
+Usage:
+    python tools/synth_dataset.py --findings 1000 --doc-kb 500          # 100× today's datasets
+    python tools/synth_dataset.py --count 20 --findings 300 --overlap 0.6 --noise 0.3
+    python tools/synth_dataset.py --out /tmp/synth --name big --findings 100000 --doc-kb 5000
+"""
+import argparse
+import json
+import random
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+_REPO_ROOT = Path(__file__).parent.parent
+DEFAULT_OUT = _REPO_ROOT / ".synthetic_datasets"  # outside datasets/, so the real suite never picks it up
+REVIEWERS = ["assumption-hunter", "constraint-finder", "problem-framer", "scope-guardian", "success-validator"]
+PHASES = ["survey", "calibrate", "design", "plan"]
+SEVERITIES = ["Critical", "Important", "Minor"]
+DOC_NAME = "design.md"
+
+_QUALIFIERS = (
+    "unbounded undefined unvalidated implicit missing stale unowned circular unversioned "
+    "untested ambiguous unmeasured conflicting optional hardcoded unspecified silent manual"
+).split()
+_SUBJECTS = (
+    "retry budget rollback plan success criterion cache eviction policy failure mode "
+    "ownership boundary acceptance threshold data retention rule rate limit migration path "
+    "schema version error budget access control audit trail latency target dependency pin "
+    "fallback behaviour ground truth source scoring rubric escalation path"
+).split(" ")
+_FILLER = (
+    "the system should record each run so that reviewers can compare results across "
+    "iterations and the team can decide whether a change improved finding quality while "
+    "keeping cost and latency within the agreed budget for the evaluation phase"
+).split()
+_SYLLABLES = ["ka", "lo", "ren", "tis", "mar", "vel", "quo", "dan", "sul", "ber", "nix", "tor"]
+
+
+@dataclass
+class SynthConfig:
+    findings: int = 1000              # real flaws in critical_findings.jsonl
+    reviewers: list[str] = field(default_factory=lambda: list(REVIEWERS))
+    doc_kb: int = 200
+    false_positive_rate: float = 0.15
+    must_find_rate: float = 0.2
+    context_rate: float = 0.1
+    overlap: float = 0.7
+    noise: float = 0.2
+    fabricated: float = 0.25
+    seed: int = 0
+
+
+def finding_id(reviewer: str, index: int) -> str:
+    """Schema-valid id for a reviewer's index-th finding (v1-…-000 … v1-…-999, v2-…-000 …)."""
+    return f"v{1 + index // 1000}-{reviewer}-{index % 1000:03d}"
+
+
+class _Text:
+    """Seeded source of titles, components and filler prose."""
+
+    def __init__(self, rng: random.Random, components: int):
+        self.rng = rng
+        self.components = sorted({
+            "".join(rng.choices(_SYLLABLES, k=rng.randint(2, 4))).capitalize()
+            for _ in range(components)
+        })
+
+    def sentence(self, words: int) -> str:
+        return " ".join(self.rng.choices(_FILLER, k=words)).capitalize() + "."
+
+    def flaw(self, component: str) -> tuple[str, str]:
+        """(title, one-line statement of the flaw as the document shows it)."""
+        qualifier, subject = self.rng.choice(_QUALIFIERS), self.rng.choice(_SUBJECTS)
+        title = f"{qualifier.capitalize()} {subject} in {component}"
+        statement = f"The {subject} for {component} is {qualifier}; no section defines it."
+        return title, statement
+
+
+def _finding(text: _Text, reviewer: str, index: int, component: str, severity: str) -> dict:
+    title, statement = text.flaw(component)
+    return {
+        "type": "finding",
+        "id": finding_id(reviewer, index),
+        "title": title,
+        "severity": severity,
+        "confidence": text.rng.randint(60, 100),
+        "phase": {"primary": text.rng.choice(PHASES), "contributing": None},
+        "section": component,
+        "issue": statement + " " + text.sentence(20),
+        "why_it_matters": text.sentence(15),
+        "suggestion": text.sentence(12),
+    }
+
+
+def reword(title: str, noise: float, rng: random.Random) -> str:
+    """Swap or replace about noise × len(words) of the title's words."""
+    words = title.split()
+    for _ in range(round(noise * len(words))):
+        i = rng.randrange(len(words))
+        if rng.random() < 0.5 and len(words) > 1:
+            j = min(i + 1, len(words) - 1) if i < len(words) - 1 else i - 1
+            words[i], words[j] = words[j], words[i]
+        else:
+            words[i] = rng.choice(_QUALIFIERS)
+    return " ".join(words)
+
+
+def simulate_completion(
+    truth: list[dict], text: _Text, reviewer: str, config: SynthConfig, start_index: int,
+) -> tuple[list[dict], list[str]]:
+    """Reviewer output covering config.overlap of truth, plus fabricated findings."""
+    rng = text.rng
+    reported = [f for f in truth if rng.random() < config.overlap]
+    records = []
+    for k, finding in enumerate(reported):
+        records.append({
+            **{key: value for key, value in finding.items() if key not in ("validation_status", "reviewer")},
+            "id": finding_id(reviewer, start_index + k),  # ids are session-local, as in real runs
+            "title": reword(finding["title"], config.noise, rng),
+            "confidence": rng.randint(50, 100),
+        })
+    next_index = start_index + len(records)
+    for k in range(round(len(reported) * config.fabricated)):
+        records.append(_finding(text, reviewer, next_index + k, rng.choice(text.components),
+                                rng.choice(SEVERITIES)))
+    rng.shuffle(records)
+    return records, [f["id"] for f in reported]
+
+
+def _design_doc(text: _Text, flaws_by_component: dict[str, list[str]], doc_kb: int) -> str:
+    """Sections per component, padded with prose up to about doc_kb kilobytes."""
+    budget = doc_kb * 1000
+    per_section = max(200, budget // max(1, len(text.components)))
+    parts = ["# Synthetic design document\n\n## Overview\n\n" + text.sentence(40) + "\n"]
+    for component in text.components:
+        body = " ".join(flaws_by_component.get(component, []))
+        while len(body) < per_section:
+            body += " " + text.sentence(25)
+        parts.append(f"\n## {component}\n\n{body.strip()}\n")
+    return "".join(parts)
+
+
+def _write_jsonl(path: Path, records: list[dict]) -> None:
+    with open(path, "w") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+
+
+def generate_dataset(out_dir: Path, name: str, config: SynthConfig) -> Path:
+    """Write one synthetic dataset directory and return its path."""
+    rng = random.Random(f"{config.seed}:{name}")
+    text = _Text(rng, components=max(4, config.findings // 8))
+    root = Path(out_dir) / name
+    (root / "completions").mkdir(parents=True, exist_ok=True)
+
+    counters = dict.fromkeys(config.reviewers, 0)
+
+    def next_finding(severity: str) -> dict:
+        reviewer = rng.choice(config.reviewers)
+        finding = _finding(text, reviewer, counters[reviewer], rng.choice(text.components), severity)
+        counters[reviewer] += 1
+        return {**finding, "reviewer": reviewer}
+
+    real = [
+        {**next_finding(rng.choices(SEVERITIES, weights=[5, 3, 2])[0]), "validation_status": "real_flaw"}
+        for _ in range(config.findings)
+    ]
+    false_positives = [
+        {**next_finding(rng.choice(SEVERITIES)), "validation_status": "false_positive",
+         "false_positive_reason": text.sentence(10)}
+        for _ in range(round(config.findings * config.false_positive_rate))
+    ]
+    critical = real + false_positives
+    rng.shuffle(critical)
+
+    must_find = [
+        {"id": f["id"], "title": f["title"], "issue": f["issue"], "severity": f["severity"],
+         "reviewer": f["reviewer"], "min_recall": rng.choice([0.6, 0.8, 1.0])}
+        for f in rng.sample(real, round(len(real) * config.must_find_rate))
+    ]
+    context_dependent = [
+        {key: f[key] for key in ("id", "title", "issue", "severity", "reviewer")}
+        | {"required_context": "Requires knowledge from outside the document: " + text.sentence(12)}
+        for f in (next_finding(rng.choice(SEVERITIES)) for _ in range(round(config.findings * config.context_rate)))
+    ]
+
+    flaws_by_component: dict[str, list[str]] = {}
+    for finding in real:
+        flaws_by_component.setdefault(finding["section"], []).append(finding["issue"].split(";")[0] + ".")
+    (root / DOC_NAME).write_text(_design_doc(text, flaws_by_component, config.doc_kb))
+
+    _write_jsonl(root / "critical_findings.jsonl", critical)
+    _write_jsonl(root / "must_find.jsonl", must_find)
+    _write_jsonl(root / "context_dependent_findings.jsonl", context_dependent)
+
+    reported_ids = {}
+    for reviewer in config.reviewers:
+        truth = [f for f in real if f["reviewer"] == reviewer]
+        # Completion ids start past the ground-truth ids so the two never collide.
+        records, reported_ids[reviewer] = simulate_completion(truth, text, reviewer, config, counters[reviewer])
+        _write_jsonl(root / "completions" / f"{reviewer}.jsonl", records)
+
+    metadata = {
+        "source_review": name,
+        "design_doc_path": DOC_NAME,
+        "total_findings": len(critical),
+        "real_flaw_count": len(real),
+        "false_positive_count": len(false_positives),
+        "severity_distribution": {s: sum(f["severity"] == s for f in real) for s in SEVERITIES},
+        "synthetic": {**asdict(config), "completions": reported_ids},
+    }
+    (root / "metadata.json").write_text(json.dumps(metadata, indent=2))
+    return root
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    defaults = SynthConfig()
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT)
+    parser.add_argument("--name", default="synthetic", help="Dataset name (suffixed -NNN with --count > 1)")
+    parser.add_argument("--count", type=int, default=1, help="Datasets to generate")
+    parser.add_argument("--findings", type=int, default=defaults.findings, help="Real flaws per dataset")
+    parser.add_argument("--reviewers", default=",".join(REVIEWERS))
+    parser.add_argument("--doc-kb", type=int, default=defaults.doc_kb)
+    parser.add_argument("--false-positive-rate", type=float, default=defaults.false_positive_rate)
+    parser.add_argument("--must-find-rate", type=float, default=defaults.must_find_rate)
+    parser.add_argument("--context-rate", type=float, default=defaults.context_rate)
+    parser.add_argument("--overlap", type=float, default=defaults.overlap,
+                        help="Share of real flaws each simulated completion reports")
+    parser.add_argument("--noise", type=float, default=defaults.noise,
+                        help="Share of title words reworded in reported findings")
+    parser.add_argument("--fabricated", type=float, default=defaults.fabricated,
+                        help="Fabricated findings per reported finding")
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    args = parser.parse_args()
+
+    for name in ("overlap", "noise", "false_positive_rate", "must_find_rate", "context_rate"):
+        if not 0 <= getattr(args, name) <= 1:
+            parser.error(f"--{name.replace('_', '-')} must be between 0 and 1")
+    config = SynthConfig(
+        findings=args.findings, reviewers=args.reviewers.split(","), doc_kb=args.doc_kb,
+        false_positive_rate=args.false_positive_rate, must_find_rate=args.must_find_rate,
+        context_rate=args.context_rate, overlap=args.overlap, noise=args.noise,
+        fabricated=args.fabricated, seed=args.seed,
+    )
+    names = [args.name] if args.count == 1 else [f"{args.name}-{i:03d}" for i in range(args.count)]
+    for name in names:
+        root = generate_dataset(args.out, name, config)
+        size_mb = sum(p.stat().st_size for p in root.rglob("*") if p.is_file()) / 1e6
+        print(f"{root}  ({config.findings:,} real flaws, {size_mb:.1f} MB)")
+
+
+if __name__ == "__main__":
+    sys.exit(main())